@@ -0,0 +1,57 @@
+import os
+import json
+from typing import Dict, Any, List
+
+from agents.base_agent import BaseAgent
+
+# Directory holding one JSON definition per agent
+DEFINITIONS_DIR = os.getenv(
+    "AGENT_DEFINITIONS_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "definitions")
+)
+
+# Keys every agent definition must provide
+REQUIRED_FIELDS = ("name", "type", "description", "system_prompt")
+
+
+def create_agent(definition: Dict[str, Any]) -> BaseAgent:
+    """Build an agent from a declarative definition."""
+    missing = [field for field in REQUIRED_FIELDS if not definition.get(field)]
+    if missing:
+        raise ValueError(f"Agent definition is missing: {', '.join(missing)}")
+
+    return BaseAgent(
+        name=definition["name"],
+        agent_type=definition["type"],
+        description=definition["description"],
+        project_info=definition.get("project_info", {}),
+        system_prompt=definition["system_prompt"]
+    )
+
+
+def load_agent_definitions(directory: str = DEFINITIONS_DIR) -> List[Dict[str, Any]]:
+    """Read every *.json agent definition in a directory, sorted by file name."""
+    definitions = []
+    for file_name in sorted(os.listdir(directory)):
+        if not file_name.endswith(".json"):
+            continue
+        path = os.path.join(directory, file_name)
+        try:
+            with open(path, "r") as f:
+                definitions.append(json.load(f))
+        except Exception as e:
+            print(f"Error reading agent definition {path}: {e}")
+    return definitions
+
+
+def load_agents(directory: str = DEFINITIONS_DIR) -> Dict[str, BaseAgent]:
+    """Create all agents defined in a directory, keyed by agent type."""
+    agents = {}
+    for definition in load_agent_definitions(directory):
+        try:
+            agent = create_agent(definition)
+        except ValueError as e:
+            print(f"Skipping agent definition {definition.get('type', '?')}: {e}")
+            continue
+        agents[agent.type] = agent
+    return agents
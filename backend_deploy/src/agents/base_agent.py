@@ -1,14 +1,35 @@
 import os
+import re
+import json
+import hashlib
+import threading
 import swarmnode
-import requests
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable
 import google.generativeai as genai
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
 
+from api.github_sync import sync_engine
+from api.project_registry import project_registry
+from agents.knowledge import knowledge_chunks, load_or_build_index
+from agents.model_router import model_router
+from chain.indexer import staking_store
+
+# Number of knowledge chunks added to the prompt per turn (only for agents with documents to search)
+KNOWLEDGE_TOP_K = int(os.getenv("KNOWLEDGE_TOP_K", "3"))
+
+# Number of builder NFTs listed in the on-chain stats block
+STAKING_TOP_BUILDERS = int(os.getenv("STAKING_TOP_BUILDERS", "3"))
+
+# Inline project_info and the links block in first chat responses, for clients that predate project_info_etag
+CHAT_INLINE_PROJECT_INFO = os.getenv("CHAT_INLINE_PROJECT_INFO", "false").lower() == "true"
+
+# The scripted opening line in a system prompt: Your first message should be exactly: "..."
+GREETING_PATTERN = re.compile(r'first message should be exactly:\s*"(?P<greeting>[^"]+)"', re.IGNORECASE)
+
 # Load environment variables
 load_dotenv()
 
@@ -16,7 +37,6 @@ load_dotenv()
 swarmnode.api_key = os.getenv("SWARMNODE_API_KEY")
 openai_api_key = os.getenv("OPENAI_API_KEY")
 gemini_api_key = os.getenv("GEMINI_API_KEY")
-github_token = os.getenv("GITHUB_TOKEN", "")
 
 # Configure Gemini
 if gemini_api_key:
@@ -41,6 +61,21 @@ if gemini_api_key:
         }
     ]
 
+class GenerationCancelled(Exception):
+    """The client went away, so a generation was stopped before it finished."""
+
+def _collect_stream(chunks, cancelled: Optional[threading.Event],
+                    on_chunk: Optional[Callable[[str], None]] = None) -> str:
+    """Join streamed text chunks, stopping as soon as `cancelled` is set and passing each to `on_chunk`."""
+    parts = []
+    for chunk in chunks:
+        if cancelled is not None and cancelled.is_set():
+            raise GenerationCancelled()
+        parts.append(chunk)
+        if on_chunk is not None and chunk:
+            on_chunk(chunk)
+    return "".join(parts)
+
 # Define message models for chat
 class Message(BaseModel):
     role: str  # 'user' or 'assistant'
@@ -52,17 +87,44 @@ class ChatRequest(BaseModel):
 class ChatResponse(BaseModel):
     response: str
     project_info: Optional[dict] = None
+    project_info_etag: Optional[str] = None  # version of /agents/{type}/info to fetch, or reuse from cache
+
+def project_info_etag(project_info: Dict[str, Any]) -> str:
+    """Strong ETag for a project_info dict, the same in every process."""
+    canonical = json.dumps(project_info, sort_keys=True, separators=(",", ":"))
+    return f'"{hashlib.sha256(canonical.encode()).hexdigest()[:16]}"'
+
+def is_opening_turn(messages: List[Message]) -> bool:
+    """True until the agent has replied: at most one user message, system messages aside."""
+    roles = [msg.role for msg in messages if msg.role != "system"]
+    return "assistant" not in roles and len(roles) <= 1
+
+def extract_greeting(system_prompt: str) -> Optional[str]:
+    """The exact first message a system prompt scripts for the agent, if any."""
+    match = GREETING_PATTERN.search(system_prompt or "")
+    return match.group("greeting").strip() if match else None
+
+def _format_mon(wei: int) -> str:
+    """Format a wei amount as MON with up to 4 decimals."""
+    return f"{wei / 10**18:,.4f}".rstrip("0").rstrip(".")
 
 class BaseAgent:
     """Base class for all agents in the Mammothon Agent Swarm."""
     
-    def __init__(self, name: str, agent_type: str, description: str, project_info: Dict[str, Any]):
+    def __init__(self, name: str, agent_type: str, description: str, project_info: Dict[str, Any], system_prompt: str = ""):
         """Initialize the agent with basic information."""
         self.name = name
         self.type = agent_type
         self.description = description
         self.project_info = project_info
-        self.system_prompt = ""
+        self.project_info_etag = project_info_etag(project_info)
+        self.system_prompt = system_prompt
+        self.greeting = extract_greeting(system_prompt)
+        
+        # Knowledge index is opened (or built) on first use, once even when chats start together
+        self._knowledge = None
+        self._knowledge_loaded = False
+        self._knowledge_lock = threading.Lock()
         
         # Set up links for the agent
         self.links_html = self._generate_links_html()
@@ -83,81 +145,34 @@ class BaseAgent:
         links_html += '</div>'
         return links_html
     
-    def get_github_data(self) -> Dict[str, Any]:
-        """Fetch GitHub data for the project if a GitHub repo is specified."""
-        if "github_repo" not in self.project_info:
-            return {}
+    def get_github_repo(self) -> Optional[Dict[str, Any]]:
+        """Find this agent's GitHub project, preferring the project registry over URLs in project_info."""
+        project = project_registry.get_by_agent(self.type)
+        if project:
+            return project
 
-        github_url = self.project_info["github_repo"]
+        github_url = self.project_info.get("github_repo") or self.project_info.get("links", {}).get("github")
         if not github_url:
-            return {}
+            return None
 
         # Extract owner and repo from GitHub URL
         parts = github_url.strip('/').split('/')
         if len(parts) < 5:
-            return {}
+            return None
 
-        owner = parts[-2]
-        repo = parts[-1]
+        return {"owner": parts[-2], "repo": parts[-1]}
 
-        # Headers for GitHub API requests
-        headers = {"Authorization": f"token {github_token}"} if github_token else {}
+    def get_github_data(self) -> Dict[str, Any]:
+        """Fetch GitHub data for the project from the shared incremental sync engine."""
+        project = self.get_github_repo()
+        if not project:
+            return {}
 
         try:
-            return self._extracted_from_get_github_data_23(owner, repo, headers)
+            return sync_engine.sync(project["owner"], project["repo"])
         except Exception as e:
             print(f"Error fetching GitHub data: {e}")
             return {}
-
-    # TODO Rename this here and in `get_github_data`
-    def _extracted_from_get_github_data_23(self, owner, repo, headers):
-        # Get repo info
-        repo_response = requests.get(
-            f"https://api.github.com/repos/{owner}/{repo}",
-            headers=headers
-        )
-        repo_data = repo_response.json() if repo_response.status_code == 200 else {}
-
-        # Get recent commits
-        commits_response = requests.get(
-            f"https://api.github.com/repos/{owner}/{repo}/commits?per_page=5",
-            headers=headers
-        )
-        commits_data = commits_response.json() if commits_response.status_code == 200 else []
-
-        # Get recent forks
-        forks_response = requests.get(
-            f"https://api.github.com/repos/{owner}/{repo}/forks?per_page=5&sort=newest",
-            headers=headers
-        )
-        forks_data = forks_response.json() if forks_response.status_code == 200 else []
-
-        # Format the data
-        github_data = {
-            "repo_info": {
-                "stars": repo_data.get("stargazers_count", 0),
-                "forks": repo_data.get("forks_count", 0),
-                "watchers": repo_data.get("watchers_count", 0),
-                "open_issues": repo_data.get("open_issues_count", 0),
-                "last_updated": repo_data.get("updated_at", "")
-            },
-            "recent_commits": [
-                {
-                    "message": commit.get("commit", {}).get("message", "").split("\n")[0],
-                    "author": commit.get("commit", {}).get("author", {}).get("name", ""),
-                    "date": commit.get("commit", {}).get("author", {}).get("date", "")
-                } for commit in commits_data[:5]
-            ],
-            "recent_forks": [
-                {
-                    "owner": fork.get("owner", {}).get("login", ""),
-                    "full_name": fork.get("full_name", ""),
-                    "created_at": fork.get("created_at", "")
-                } for fork in forks_data[:5]
-            ]
-        }
-
-        return github_data
     
     def get_github_summary(self) -> str:
         """Generate a human-readable summary of GitHub activity."""
@@ -165,7 +180,7 @@ class BaseAgent:
         if not github_data:
             return ""
         
-        repo_info = github_data.get("repo_info", {})
+        repo_info = github_data.get("repo_info") or {}
         recent_commits = github_data.get("recent_commits", [])
         recent_forks = github_data.get("recent_forks", [])
         
@@ -191,10 +206,66 @@ class BaseAgent:
             
         return "\n".join(summary)
     
-    def get_chat_response(self, messages: List[Message], model_type: str = "gemini") -> str:
-        """Generate a response to a chat message using either OpenAI or Gemini."""
+    def get_staking_summary(self) -> str:
+        """Summarize this project's on-chain staking from the indexer's in-memory snapshot.
+
+        The snapshot is refreshed by the background chain indexer; nothing
+        here touches the chain or the database.
+        """
+        stats = staking_store.get_project_stats(self.project_info.get("staking_project_id"), self.type, self.name)
+        if not stats:
+            return ""
+        
+        summary = [f"Total Staked: {_format_mon(stats['total_staked'])} MON from {stats['stakers_count']} staker{'s' if stats['stakers_count'] != 1 else ''}"]
+        
+        builder_nfts = stats["builder_nfts"]
+        if builder_nfts:
+            summary.append(f"Builder NFTs: {len(builder_nfts)}")
+            summary.append("Top Builders:")
+            for nft in builder_nfts[:STAKING_TOP_BUILDERS]:
+                summary.append(f"- {nft['github_username']} ({nft['repo_name']}): {_format_mon(int(nft['total_staked']))} MON staked")
+        
+        return "\n".join(summary)
+    
+    def get_knowledge_context(self, query: str, k: int = KNOWLEDGE_TOP_K) -> str:
+        """Retrieve the project knowledge chunks most relevant to a query.
+
+        Empty for agents without documents under agents/knowledge/<type>/.
+        """
+        if not self._knowledge_loaded:
+            with self._knowledge_lock:
+                if not self._knowledge_loaded:
+                    self._knowledge = load_or_build_index(self.type, knowledge_chunks(self.type, self.project_info))
+                    self._knowledge_loaded = True
+        
+        if not self._knowledge or not query:
+            return ""
+        
+        return "\n".join(f"- {result['text']}" for result in self._knowledge.search(query, k))
+    
+    def get_chat_response(self, messages: List[Message], model_type: str = "gemini",
+                          cancelled: Optional[threading.Event] = None,
+                          on_chunk: Optional[Callable[[str], None]] = None,
+                          on_restart: Optional[Callable[[], None]] = None) -> str:
+        """Generate a response to a chat message using either OpenAI or Gemini.
+
+        The model and output token cap come from the model router: simple
+        and first-turn messages go to the provider's fast tier, complex ones
+        to its large model.
+
+        Responses are streamed from the provider; once `cancelled` is set the
+        stream is abandoned between chunks and GenerationCancelled is raised,
+        so no more output is generated for a client that has gone away.
+        `on_chunk` is called (on the generating thread) with each piece of
+        text as it arrives. When a provider fails after some text was
+        streamed (and the answer falls back to another provider or an
+        apology), `on_restart` is called: the text streamed so far is void
+        and only the returned string is the answer.
+        """
         if not self.system_prompt:
-            raise NotImplementedError("System prompt must be defined in the child class")
+            raise NotImplementedError("System prompt must be defined in the agent definition")
+        if cancelled is not None and cancelled.is_set():
+            raise GenerationCancelled()
 
         # Extract just the content from the messages
         conversation_history = []
@@ -219,6 +290,16 @@ class BaseAgent:
         if github_summary:
             enhanced_prompt += f"\n\nCurrent GitHub Activity:\n{github_summary}\n\nIncorporate this GitHub data naturally in your response if the user is asking about project progress or activity."
 
+        # Add on-chain staking stats (precomputed in memory, no RPC calls)
+        staking_summary = self.get_staking_summary()
+        if staking_summary:
+            enhanced_prompt += f"\n\nCurrent On-chain Stats:\n{staking_summary}\n\nUse these figures when the user asks about staking or community support for the project."
+
+        # Add only the project knowledge relevant to this turn
+        knowledge_context = self.get_knowledge_context(last_user_message)
+        if knowledge_context:
+            enhanced_prompt += f"\n\nRelevant Project Knowledge:\n{knowledge_context}\n\nUse this knowledge if it helps answer the user's latest message."
+
         # Add common response structure
         enhanced_prompt += """
         
@@ -232,28 +313,50 @@ class BaseAgent:
            - Stake: "Support this project by staking MON tokens"
         """
 
+        streamed = False
+
+        def forward(text: str):
+            nonlocal streamed
+            streamed = True
+            on_chunk(text)
+
+        def abandon_attempt():
+            nonlocal streamed
+            if streamed and on_restart is not None:
+                on_restart()
+            streamed = False
+
+        stream_to = forward if on_chunk is not None else None
+        # Routed once per chat; a fallback provider gets the same tier
+        tier = None
+
         if model_type == "openai" and openai_api_key:
+            tier = model_router.route(self.type, messages, "openai")
             try:
-                model = ChatOpenAI(api_key=openai_api_key, model="gpt-4")
+                model = ChatOpenAI(api_key=openai_api_key, model=tier.model, max_tokens=tier.max_output_tokens)
                 messages_for_model = [
                     SystemMessage(content=enhanced_prompt),
                     HumanMessage(content=f"Conversation history:\n{conversation_text}\n\nUser's latest message: {last_user_message}\n\nRespond as the {self.name} agent:")
                 ]
-                response = model.invoke(messages_for_model)
-                return response.content
+                return _collect_stream((chunk.content for chunk in model.stream(messages_for_model)), cancelled, stream_to)
+            except GenerationCancelled:
+                raise
             except Exception as e:
                 print(f"OpenAI error: {e}")
+                abandon_attempt()
                 # Fall back to Gemini if OpenAI fails
                 if gemini_api_key:
                     model_type = "gemini"
+                    tier = model_router.fallback(self.type, tier, "gemini")
                 else:
                     return "I'm sorry, I'm having trouble connecting to my AI services right now. Please try again later."
 
         if model_type == "gemini" and gemini_api_key:
             try:
-                # Use the correct model name for Gemini Pro
                 print(f"Using Gemini API with key: {gemini_api_key[:5]}...")
-                model = genai.GenerativeModel('gemini-1.5-pro')
+                if tier is None:
+                    tier = model_router.route(self.type, messages, "gemini")
+                model = genai.GenerativeModel(tier.model)
                 prompt = f"{enhanced_prompt}\n\nConversation history:\n{conversation_text}\n\nUser's latest message: {last_user_message}\n\nRespond as the {self.name} agent:"
 
                 print(f"Sending prompt to Gemini: {prompt[:100]}...")
@@ -268,23 +371,31 @@ class BaseAgent:
                             "temperature": 0.7,
                             "top_p": 0.8,
                             "top_k": 40,
-                            "max_output_tokens": 2048
-                        }
+                            "max_output_tokens": tier.max_output_tokens
+                        },
+                        stream=True
                     )
+                    text = _collect_stream((chunk.text for chunk in response), cancelled, stream_to)
 
-                    if not response.text:
+                    if not text:
                         print("Empty response from Gemini")
                         return "I'm sorry, I received an empty response. Please try again."
 
-                    print(f"Received response from Gemini: {response.text[:100]}...")
-                    return response.text
+                    print(f"Received response from Gemini: {text[:100]}...")
+                    return text
+                except GenerationCancelled:
+                    raise
                 except Exception as content_error:
+                    abandon_attempt()
                     return self._extracted_from_get_chat_response_94(
                         'Gemini content generation error: ',
                         content_error,
                         "I'm sorry, I had trouble generating a response. Please try again.",
                     )
+            except GenerationCancelled:
+                raise
             except Exception as e:
+                abandon_attempt()
                 return self._extracted_from_get_chat_response_94(
                     'Gemini error: ',
                     e,
@@ -299,20 +410,41 @@ class BaseAgent:
         print(f"Error details: {str(arg1)}")
         return arg2
     
-    def process_chat_request(self, request: ChatRequest, model_type: str = "gemini") -> ChatResponse:
-        """Process a chat request and return a response."""
+    def process_chat_request(self, request: ChatRequest, model_type: str = "gemini",
+                             cancelled: Optional[threading.Event] = None,
+                             on_chunk: Optional[Callable[[str], None]] = None,
+                             on_restart: Optional[Callable[[], None]] = None) -> ChatResponse:
+        """Process a chat request and return a response; see get_chat_response for `cancelled`, `on_chunk` and `on_restart`."""
         if model_type not in ["openai", "gemini"]:
             raise HTTPException(status_code=400, detail="Invalid model type. Use 'openai' or 'gemini'.")
         
+        scripted = self.get_scripted_response(request)
+        if scripted is not None:
+            return scripted
+        
         # Generate response
-        response = self.get_chat_response(request.messages, model_type)
+        response = self.get_chat_response(request.messages, model_type, cancelled, on_chunk, on_restart)
+        return self._chat_response(response, is_opening_turn(request.messages))
+    
+    def get_scripted_response(self, request: ChatRequest) -> Optional[ChatResponse]:
+        """The scripted greeting for a conversation's opening turn, without an LLM call.
+
+        Returns None when the agent has no scripted greeting or the
+        conversation is past its opening turn.
+        """
+        if not self.greeting or not is_opening_turn(request.messages):
+            return None
+        return self._chat_response(self.greeting, is_first_message=True)
+    
+    def _chat_response(self, response: str, is_first_message: bool) -> ChatResponse:
+        if not is_first_message:
+            return ChatResponse(response=response)
         
-        # For the first message, add project links if they're not already included
-        is_first_message = len(request.messages) <= 1
-        if is_first_message and "<a href='" not in response:
-            response += self.links_html
+        if CHAT_INLINE_PROJECT_INFO:
+            # Add project links if they're not already included
+            if "<a href='" not in response:
+                response += self.links_html
+            return ChatResponse(response=response, project_info=self.project_info, project_info_etag=self.project_info_etag)
         
-        return ChatResponse(
-            response=response,
-            project_info=self.project_info if is_first_message else None
-        ) 
\ No newline at end of file
+        # Clients fetch /agents/{type}/info once per version and render the links from it
+        return ChatResponse(response=response, project_info_etag=self.project_info_etag) 
\ No newline at end of file
@@ -0,0 +1,233 @@
+import os
+import re
+import json
+import mmap
+import math
+import heapq
+import struct
+import hashlib
+import tempfile
+from collections import Counter
+from typing import List, Dict, Any, Optional, Iterable
+
+from api.github_sync import DATA_DIR
+
+# Where built indexes are written (one file per agent)
+KNOWLEDGE_DIR = os.getenv("KNOWLEDGE_INDEX_DIR", os.path.join(DATA_DIR, "knowledge"))
+
+# Where extra documents (READMEs, docs, notes) for each agent live: <dir>/<agent type>/*.md
+KNOWLEDGE_DOCS_DIR = os.getenv(
+    "KNOWLEDGE_DOCS_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "knowledge")
+)
+
+# BM25 parameters
+K1 = 1.5
+B = 0.75
+
+# Words per chunk and overlap between consecutive chunks of a document
+CHUNK_WORDS = 120
+CHUNK_OVERLAP = 20
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "do", "does", "for", "from", "how",
+    "i", "in", "is", "it", "of", "on", "or", "that", "the", "this", "to", "what", "with", "you", "your"
+}
+
+# File layout: header, doc table, chunk texts, postings, then the vocabulary as JSON
+MAGIC = b"MAMKIDX1"
+HEADER = struct.Struct("<8sIdQQQ")   # magic, doc count, avg doc length, doc table, vocab offset, vocab length
+DOC = struct.Struct("<IQI")          # doc length, text offset, text length
+POSTING = struct.Struct("<IH")       # doc id, term frequency
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords."""
+    return [t for t in re.findall(r"[a-z0-9]+", text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+def chunk_text(text: str, title: str = "", max_words: int = CHUNK_WORDS, overlap: int = CHUNK_OVERLAP) -> List[str]:
+    """Split a document into overlapping word windows, prefixed with its title."""
+    words = text.split()
+    if not words:
+        return []
+    prefix = f"{title}: " if title else ""
+    step = max(1, max_words - overlap)
+    return [
+        prefix + " ".join(words[start:start + max_words])
+        for start in range(0, max(1, len(words) - overlap), step)
+    ]
+
+
+def _flatten(value: Any) -> str:
+    if isinstance(value, dict):
+        return "; ".join(f"{k.replace('_', ' ')}: {_flatten(v)}" for k, v in value.items())
+    if isinstance(value, list):
+        return "; ".join(_flatten(v) for v in value)
+    return " ".join(str(value).split())
+
+
+def project_info_chunks(project_info: Dict[str, Any]) -> List[str]:
+    """One chunk per top-level project_info section (split further if long)."""
+    chunks = []
+    for key, value in project_info.items():
+        chunks.extend(chunk_text(_flatten(value), title=key.replace("_", " ")))
+    return chunks
+
+
+def document_chunks(agent_type: str, docs_dir: str = KNOWLEDGE_DOCS_DIR) -> List[str]:
+    """Chunks from the Markdown/text documents kept for an agent."""
+    directory = os.path.join(docs_dir, agent_type)
+    if not os.path.isdir(directory):
+        return []
+
+    chunks = []
+    for file_name in sorted(os.listdir(directory)):
+        if not file_name.endswith((".md", ".txt")):
+            continue
+        with open(os.path.join(directory, file_name), "r") as f:
+            text = f.read()
+        # Chunk each Markdown section separately so titles stay meaningful
+        for section in re.split(r"\n(?=#)", text):
+            lines = section.strip().splitlines()
+            if not lines:
+                continue
+            title = lines[0].lstrip("#").strip() if lines[0].startswith("#") else file_name
+            chunks.extend(chunk_text(" ".join(lines[1:] if lines[0].startswith("#") else lines), title=title))
+    return chunks
+
+
+def knowledge_chunks(agent_type: str, project_info: Dict[str, Any], docs_dir: str = KNOWLEDGE_DOCS_DIR) -> List[str]:
+    """Everything retrieval searches for an agent, or nothing if it has no documents.
+
+    Without documents retrieval would only add project_info excerpts on top
+    of the static system prompt, making every prompt longer for nothing, so
+    it stays off until there is a corpus worth searching.
+    """
+    documents = document_chunks(agent_type, docs_dir)
+    if not documents:
+        return []
+    return project_info_chunks(project_info) + documents
+
+
+def build_index(chunks: List[str], path: str, source_hash: str = ""):
+    """Write a BM25 index over chunks to a single file."""
+    doc_terms = [Counter(tokenize(chunk)) for chunk in chunks]
+    doc_lengths = [sum(terms.values()) for terms in doc_terms]
+    avgdl = sum(doc_lengths) / len(doc_lengths) if doc_lengths else 0.0
+
+    postings: Dict[str, List[tuple]] = {}
+    for doc_id, terms in enumerate(doc_terms):
+        for term, tf in terms.items():
+            postings.setdefault(term, []).append((doc_id, min(tf, 0xFFFF)))
+
+    texts = [chunk.encode() for chunk in chunks]
+    doc_table_offset = HEADER.size
+    text_offset = doc_table_offset + DOC.size * len(chunks)
+
+    body = bytearray()
+    offset = text_offset
+    doc_table = bytearray()
+    for length, text in zip(doc_lengths, texts):
+        doc_table += DOC.pack(length, offset, len(text))
+        body += text
+        offset += len(text)
+
+    vocab = {}
+    for term in sorted(postings):
+        vocab[term] = [offset, len(postings[term])]
+        for posting in postings[term]:
+            body += POSTING.pack(*posting)
+        offset += POSTING.size * len(postings[term])
+
+    vocab_blob = json.dumps({"source_hash": source_hash, "terms": vocab}, separators=(",", ":")).encode()
+    header = HEADER.pack(MAGIC, len(chunks), avgdl, doc_table_offset, offset, len(vocab_blob))
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    # Each writer gets its own temporary file, so concurrent builds of one index never interleave
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=f".{os.path.basename(path)}.")
+    with os.fdopen(fd, "wb") as f:
+        f.write(header)
+        f.write(doc_table)
+        f.write(body)
+        f.write(vocab_blob)
+    os.replace(tmp_path, path)
+
+
+class KnowledgeIndex:
+    """Read-only BM25 index over an agent's knowledge chunks.
+
+    The index file is memory-mapped: only the vocabulary is parsed up front,
+    while postings and chunk texts are read from the mapping on demand, so
+    many agents can keep large indexes open at little resident cost.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.doc_count, self.avgdl, self._doc_table, vocab_offset, vocab_length = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a knowledge index")
+        vocab = json.loads(self._mmap[vocab_offset:vocab_offset + vocab_length])
+        self.source_hash = vocab["source_hash"]
+        self._terms = vocab["terms"]
+
+    def _doc(self, doc_id: int) -> tuple:
+        return DOC.unpack_from(self._mmap, self._doc_table + DOC.size * doc_id)
+
+    def text(self, doc_id: int) -> str:
+        _, offset, length = self._doc(doc_id)
+        return self._mmap[offset:offset + length].decode()
+
+    def search(self, query: str, k: int = 3) -> List[Dict[str, Any]]:
+        """Top-k chunks for a query, scored with BM25."""
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            entry = self._terms.get(term)
+            if not entry:
+                continue
+            offset, df = entry
+            idf = math.log(1 + (self.doc_count - df + 0.5) / (df + 0.5))
+            for doc_id, tf in POSTING.iter_unpack(self._mmap[offset:offset + POSTING.size * df]):
+                doc_length = self._doc(doc_id)[0]
+                norm = K1 * (1 - B + B * doc_length / self.avgdl) if self.avgdl else K1
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+
+        top = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+        return [{"text": self.text(doc_id), "score": score} for doc_id, score in top]
+
+    def close(self):
+        self._mmap.close()
+
+
+def source_hash(chunks: Iterable[str]) -> str:
+    """Fingerprint of the chunks an index was built from."""
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        digest.update(chunk.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def load_or_build_index(agent_type: str, chunks: List[str], index_dir: str = KNOWLEDGE_DIR) -> Optional[KnowledgeIndex]:
+    """Open an agent's index, rebuilding it first if its sources changed."""
+    if not chunks:
+        return None
+    path = os.path.join(index_dir, f"{agent_type}.idx")
+    expected = source_hash(chunks)
+
+    try:
+        index = KnowledgeIndex(path)
+        if index.source_hash == expected:
+            return index
+        index.close()
+    except (OSError, ValueError, struct.error):
+        pass
+
+    try:
+        build_index(chunks, path, expected)
+        return KnowledgeIndex(path)
+    except Exception as e:
+        print(f"Error building knowledge index for {agent_type}: {e}")
+        return None
@@ -0,0 +1,120 @@
+import os
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Any, List, Tuple
+
+# Which tier answers chats: "auto" routes per message, "fast" or "large" pins every chat to one tier
+MODEL_ROUTING = os.getenv("MODEL_ROUTING", "auto")
+
+# Output token caps per tier; the guidelines ask for brief answers, so simple turns get a tight cap
+FAST_MAX_OUTPUT_TOKENS = int(os.getenv("FAST_MAX_OUTPUT_TOKENS", "512"))
+LARGE_MAX_OUTPUT_TOKENS = int(os.getenv("LARGE_MAX_OUTPUT_TOKENS", "2048"))
+
+# Latest user messages longer than this (in words) go to the large tier
+FAST_TIER_MAX_WORDS = int(os.getenv("FAST_TIER_MAX_WORDS", "40"))
+
+# Conversations with more user turns than this go to the large tier
+FAST_TIER_MAX_TURNS = int(os.getenv("FAST_TIER_MAX_TURNS", "6"))
+
+# Phrases that ask for reasoning, comparison or code rather than an FAQ answer
+COMPLEX_PATTERN = re.compile(
+    r"\b(why|how does|how do|how would|explain|compare|comparison|difference|versus|vs|trade-?offs?|"
+    r"architecture|design|implement|integrate|write code|code example|step by step|in detail|security|audit|tokenomics)\b",
+    re.IGNORECASE
+)
+
+# Routing decisions kept for the status endpoint
+ROUTING_HISTORY = 20
+
+
+@dataclass(frozen=True)
+class ModelTier:
+    """A provider model and the output token cap it is called with."""
+    name: str
+    provider: str
+    model: str
+    max_output_tokens: int
+
+
+TIERS = {
+    "gemini": {
+        "fast": ModelTier("fast", "gemini", os.getenv("GEMINI_FAST_MODEL", "gemini-1.5-flash"), FAST_MAX_OUTPUT_TOKENS),
+        "large": ModelTier("large", "gemini", os.getenv("GEMINI_LARGE_MODEL", "gemini-1.5-pro"), LARGE_MAX_OUTPUT_TOKENS),
+    },
+    "openai": {
+        "fast": ModelTier("fast", "openai", os.getenv("OPENAI_FAST_MODEL", "gpt-4o-mini"), FAST_MAX_OUTPUT_TOKENS),
+        "large": ModelTier("large", "openai", os.getenv("OPENAI_LARGE_MODEL", "gpt-4"), LARGE_MAX_OUTPUT_TOKENS),
+    },
+}
+
+
+def classify(messages: List[Any], max_words: int = FAST_TIER_MAX_WORDS, max_turns: int = FAST_TIER_MAX_TURNS) -> Tuple[str, str]:
+    """Pick the tier for a conversation from its latest user message; returns (tier, reason).
+
+    Long messages, long conversations and messages asking for reasoning,
+    comparisons or code escalate to the large tier; first turns and short
+    FAQ-style questions stay on the fast tier.
+    """
+    user_messages = [msg.content for msg in messages if msg.role == "user"]
+    last = user_messages[-1] if user_messages else ""
+    words = len(last.split())
+    match = COMPLEX_PATTERN.search(last)
+    if match:
+        return "large", f"asks '{match.group(0).lower()}'"
+    if words > max_words:
+        return "large", f"{words} words"
+    if len(user_messages) > max_turns:
+        return "large", f"{len(user_messages)} user turns"
+    if len(user_messages) <= 1:
+        return "fast", "first turn"
+    return "fast", f"short follow-up ({words} words)"
+
+
+class ModelRouter:
+    """Chooses the model tier for each chat and logs the decision.
+
+    Every decision is printed and the most recent ones are kept, with
+    counts per provider and tier, for the dispatch status endpoint. A chat
+    is routed once; when its provider fails and another one answers, the
+    same tier is reused there and counted as a fallback, not a new decision.
+    """
+
+    def __init__(self, mode: str = MODEL_ROUTING, tiers: Dict[str, Dict[str, ModelTier]] = TIERS):
+        if mode not in ("auto", "fast", "large"):
+            raise ValueError(f"Unknown MODEL_ROUTING mode '{mode}'. Use 'auto', 'fast' or 'large'.")
+        self.mode = mode
+        self.tiers = tiers
+        self.counts: Dict[str, int] = {}
+        self.fallbacks: Dict[str, int] = {}
+        self.recent = deque(maxlen=ROUTING_HISTORY)
+
+    def route(self, agent_type: str, messages: List[Any], provider: str) -> ModelTier:
+        if self.mode == "auto":
+            tier_name, reason = classify(messages)
+        else:
+            tier_name, reason = self.mode, f"MODEL_ROUTING={self.mode}"
+        tier = self.tiers[provider][tier_name]
+
+        key = f"{provider}/{tier_name}"
+        self.counts[key] = self.counts.get(key, 0) + 1
+        self.recent.append({"agent": agent_type, "model": tier.model, "tier": tier_name, "reason": reason})
+        print(f"Model routing: {agent_type} -> {tier.model} ({tier_name}, max {tier.max_output_tokens} tokens): {reason}")
+        return tier
+
+    def fallback(self, agent_type: str, tier: ModelTier, provider: str) -> ModelTier:
+        """The tier already chosen for a chat, on the provider answering after `tier.provider` failed."""
+        fallback = self.tiers[provider][tier.name]
+        key = f"{tier.provider}->{provider}/{tier.name}"
+        self.fallbacks[key] = self.fallbacks.get(key, 0) + 1
+        print(f"Model routing fallback: {agent_type} {tier.model} -> {fallback.model} ({tier.name}): {tier.provider} failed")
+        return fallback
+
+    def status(self) -> Dict[str, Any]:
+        """Routing mode, decisions per provider tier, provider fallbacks and the latest decisions."""
+        return {"mode": self.mode, "counts": dict(self.counts), "fallbacks": dict(self.fallbacks),
+                "recent": list(self.recent)}
+
+
+# Shared router used by every agent
+model_router = ModelRouter()
@@ -0,0 +1,175 @@
+import os
+import time
+import asyncio
+from collections import deque
+from typing import Dict, Any, Optional, Callable
+
+# Seconds a chat may wait for a generation slot before it is dropped
+CHAT_QUEUE_MAX_WAIT = float(os.getenv("CHAT_QUEUE_MAX_WAIT", "30"))
+
+# Relative share of generation slots per agent, e.g. "wooly=2,vocafi=1" (default 1)
+CHAT_AGENT_WEIGHTS = {
+    name.strip(): float(weight)
+    for name, _, weight in (entry.partition("=") for entry in os.getenv("CHAT_AGENT_WEIGHTS", "").split(","))
+    if name.strip() and weight
+}
+
+# Recent queue waits kept per agent for the wait percentiles
+WAIT_HISTORY = 256
+
+
+class RequestDropped(Exception):
+    """A queued request was dropped before it got a slot."""
+
+
+class _Waiter:
+    __slots__ = ("tag", "seq", "future", "deadline", "abandoned", "enqueued", "granted")
+
+    def __init__(self, tag: float, seq: int, future: asyncio.Future, deadline: float,
+                 abandoned: Optional[Callable[[], bool]], enqueued: float):
+        self.tag = tag
+        self.seq = seq
+        self.future = future
+        self.deadline = deadline
+        self.abandoned = abandoned
+        self.enqueued = enqueued
+        self.granted = False
+
+
+def _percentile(values, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))] if ordered else 0.0
+
+
+class FairScheduler:
+    """Hands a fixed number of generation slots to per-agent queues fairly.
+
+    Requests queue per agent and are started by start-time weighted fair
+    queuing: each request is tagged with its agent's virtual finish time
+    (previous tag, or the scheduler's virtual time if the agent was idle,
+    plus 1/weight), and the lowest tag across queue heads runs next. A busy
+    agent therefore gets its weighted share of slots but cannot starve the
+    others, however deep its own queue is.
+
+    Requests are dropped instead of started when their deadline has passed
+    or their ``abandoned`` callback reports that the client went away;
+    cancelling a waiting task removes it from its queue at once.
+    """
+
+    def __init__(self, slots: int, weights: Optional[Dict[str, float]] = None, max_wait: float = CHAT_QUEUE_MAX_WAIT):
+        self.slots = slots
+        self.weights = dict(CHAT_AGENT_WEIGHTS if weights is None else weights)
+        self.max_wait = max_wait
+        self.running = 0
+        self.virtual_time = 0.0
+        self._seq = 0
+        self._queues: Dict[str, deque] = {}
+        self._last_tag: Dict[str, float] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def queued(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def _agent_stats(self, key: str) -> Dict[str, Any]:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = {"running": 0, "served": 0, "dropped": 0, "waits": deque(maxlen=WAIT_HISTORY)}
+        return stats
+
+    def _start(self, key: str, waited: float):
+        stats = self._agent_stats(key)
+        self.running += 1
+        stats["running"] += 1
+        stats["served"] += 1
+        stats["waits"].append(waited)
+
+    def _drop(self, key: str, waiter: _Waiter, reason: str):
+        self._agent_stats(key)["dropped"] += 1
+        if not waiter.future.done():
+            waiter.future.set_exception(RequestDropped(reason))
+
+    async def acquire(self, key: str, deadline: Optional[float] = None,
+                      abandoned: Optional[Callable[[], bool]] = None):
+        """Wait for a slot for agent `key`; raises RequestDropped if the request is dropped.
+
+        `deadline` is a ``time.monotonic()`` timestamp (default: now plus
+        ``max_wait``). Every successful acquire must be paired with ``release``.
+        """
+        now = time.monotonic()
+        if self.running < self.slots and not self.queued:
+            self._start(key, 0.0)
+            return
+
+        tag = max(self.virtual_time, self._last_tag.get(key, 0.0)) + 1 / self.weights.get(key, 1.0)
+        self._last_tag[key] = tag
+        deadline = deadline if deadline is not None else now + self.max_wait
+        self._seq += 1
+        waiter = _Waiter(tag, self._seq, asyncio.get_running_loop().create_future(), deadline, abandoned, now)
+        queue = self._queues.setdefault(key, deque())
+        queue.append(waiter)
+
+        try:
+            await asyncio.wait_for(waiter.future, max(0.0, deadline - now))
+        except asyncio.TimeoutError:
+            if waiter.granted:
+                return
+            self._remove(key, waiter)
+            self._agent_stats(key)["dropped"] += 1
+            raise RequestDropped(f"Waited longer than {deadline - now:.1f}s for a slot")
+        except asyncio.CancelledError:
+            if waiter.granted:
+                self.release(key)
+            else:
+                self._remove(key, waiter)
+                self._agent_stats(key)["dropped"] += 1
+            raise
+
+    def _remove(self, key: str, waiter: _Waiter):
+        try:
+            self._queues[key].remove(waiter)
+        except ValueError:
+            pass
+
+    def release(self, key: str):
+        self.running -= 1
+        self._agent_stats(key)["running"] -= 1
+        self._dispatch()
+
+    def _dispatch(self):
+        now = time.monotonic()
+        while self.running < self.slots:
+            # Lowest tag first; equal tags in arrival order
+            heads = [(queue[0].tag, queue[0].seq, key) for key, queue in self._queues.items() if queue]
+            if not heads:
+                return
+            _, _, key = min(heads)
+            waiter = self._queues[key].popleft()
+            if waiter.future.done():
+                continue
+            if now > waiter.deadline:
+                self._drop(key, waiter, "Deadline passed while queued")
+                continue
+            if waiter.abandoned is not None and waiter.abandoned():
+                self._drop(key, waiter, "Client disconnected while queued")
+                continue
+            self.virtual_time = waiter.tag
+            waiter.granted = True
+            self._start(key, now - waiter.enqueued)
+            waiter.future.set_result(None)
+
+    def status(self) -> Dict[str, Any]:
+        """Queue depth, running and dropped requests and recent queue waits per agent."""
+        agents = {}
+        for key, stats in sorted(self._stats.items()):
+            waits = list(stats["waits"])
+            agents[key] = {
+                "queued": len(self._queues.get(key, ())),
+                "running": stats["running"],
+                "served": stats["served"],
+                "dropped": stats["dropped"],
+                "weight": self.weights.get(key, 1.0),
+                "wait_p50_ms": round(_percentile(waits, 50) * 1000, 1),
+                "wait_p95_ms": round(_percentile(waits, 95) * 1000, 1),
+            }
+        return {"slots": self.slots, "running": self.running, "queued": self.queued, "agents": agents}
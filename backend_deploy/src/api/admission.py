@@ -0,0 +1,262 @@
+import os
+import re
+import json
+import math
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Mapping, Optional, Tuple, Container
+from urllib.parse import parse_qs
+
+from pydantic import ValidationError
+
+from agents.base_agent import BaseAgent, ChatRequest
+
+# Chat requests a client (IP) may send per second, and how many it may burst
+ADMISSION_CLIENT_RATE = float(os.getenv("ADMISSION_CLIENT_RATE", "2"))
+ADMISSION_CLIENT_BURST = int(os.getenv("ADMISSION_CLIENT_BURST", "10"))
+
+# Chat requests a single agent accepts per second, and its burst
+ADMISSION_AGENT_RATE = float(os.getenv("ADMISSION_AGENT_RATE", "50"))
+ADMISSION_AGENT_BURST = int(os.getenv("ADMISSION_AGENT_BURST", "100"))
+
+# Chats admitted and not yet answered, per LLM provider
+PROVIDER_MAX_IN_FLIGHT = {
+    "gemini": int(os.getenv("GEMINI_MAX_IN_FLIGHT", "32")),
+    "openai": int(os.getenv("OPENAI_MAX_IN_FLIGHT", "32")),
+}
+
+# Retry-After sent when a provider is at its in-flight cap
+PROVIDER_RETRY_AFTER = int(os.getenv("PROVIDER_RETRY_AFTER", "1"))
+
+# Client buckets kept in memory; the least recently seen are dropped first
+ADMISSION_MAX_CLIENTS = int(os.getenv("ADMISSION_MAX_CLIENTS", "10000"))
+
+# Use the address the proxy in front of us (Koyeb) appends to X-Forwarded-For; only enable behind such a proxy,
+# since anyone reaching the app directly could otherwise pick their own rate-limit key
+TRUST_FORWARDED_FOR = os.getenv("TRUST_FORWARDED_FOR", "false").lower() == "true"
+
+# Requests that spend LLM quota; everything else (info, health, docs) is never throttled
+CHAT_PATH = re.compile(r"^/agents/(?P<agent>[^/]+)/chat$")
+
+
+class TokenBucket:
+    """Allows `rate` events per second on average and up to `burst` at once."""
+
+    def __init__(self, rate: float, burst: int, now: Optional[float] = None):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic() if now is None else now
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until a token is available (0 if one is available now)."""
+        self._refill(now)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate if self.rate > 0 else math.inf
+
+    def take(self, now: float):
+        self._refill(now)
+        self.tokens -= 1
+
+
+class AdmissionController:
+    """Decides whether a chat request may start, before any LLM work is queued.
+
+    A request is admitted only if its client's token bucket, its agent's
+    token bucket and its provider's in-flight cap all allow it; tokens are
+    taken from both buckets only when all three do. Rejected requests are
+    answered at once with 429 and a Retry-After, instead of queueing
+    behind the provider and dragging every other request's latency up.
+    """
+
+    def __init__(self, client_rate: float = ADMISSION_CLIENT_RATE, client_burst: int = ADMISSION_CLIENT_BURST,
+                 agent_rate: float = ADMISSION_AGENT_RATE, agent_burst: int = ADMISSION_AGENT_BURST,
+                 provider_limits: Optional[Dict[str, int]] = None, max_clients: int = ADMISSION_MAX_CLIENTS):
+        self.client_rate = client_rate
+        self.client_burst = client_burst
+        self.agent_rate = agent_rate
+        self.agent_burst = agent_burst
+        self.provider_limits = dict(PROVIDER_MAX_IN_FLIGHT if provider_limits is None else provider_limits)
+        self.max_clients = max_clients
+        self._clients: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._agents: Dict[str, TokenBucket] = {}
+        self.in_flight: Dict[str, int] = {provider: 0 for provider in self.provider_limits}
+        self.stats = {"admitted": 0, "rejected_client": 0, "rejected_agent": 0, "rejected_provider": 0}
+
+    def _client_bucket(self, client: str, now: float) -> TokenBucket:
+        bucket = self._clients.get(client)
+        if bucket is None:
+            bucket = self._clients[client] = TokenBucket(self.client_rate, self.client_burst, now)
+            while len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+        self._clients.move_to_end(client)
+        return bucket
+
+    def _agent_bucket(self, agent: str, now: float) -> TokenBucket:
+        bucket = self._agents.get(agent)
+        if bucket is None:
+            bucket = self._agents[agent] = TokenBucket(self.agent_rate, self.agent_burst, now)
+        return bucket
+
+    def admit(self, client: str, agent: str, provider: Optional[str], now: Optional[float] = None) -> Tuple[bool, float]:
+        """Admit a chat request or return the seconds to wait before retrying.
+
+        An admitted request holds a provider slot until ``release`` is called.
+        Pass no `provider` for chats answered without an LLM call (scripted
+        greetings): they spend client and agent tokens but take no slot.
+        """
+        now = time.monotonic() if now is None else now
+        client_bucket = self._client_bucket(client, now)
+        wait = client_bucket.wait_time(now)
+        if wait:
+            self.stats["rejected_client"] += 1
+            return False, wait
+
+        agent_bucket = self._agent_bucket(agent, now)
+        wait = agent_bucket.wait_time(now)
+        if wait:
+            self.stats["rejected_agent"] += 1
+            return False, wait
+
+        limit = self.provider_limits.get(provider)
+        if limit is not None and self.in_flight[provider] >= limit:
+            self.stats["rejected_provider"] += 1
+            return False, float(PROVIDER_RETRY_AFTER)
+
+        client_bucket.take(now)
+        agent_bucket.take(now)
+        if limit is not None:
+            self.in_flight[provider] += 1
+        self.stats["admitted"] += 1
+        return True, 0.0
+
+    def reserve(self, provider: str) -> bool:
+        """Take a provider slot for work no client or agent bucket pays for (batch chats); False at the cap."""
+        limit = self.provider_limits.get(provider)
+        if limit is not None and self.in_flight[provider] >= limit:
+            return False
+        if limit is not None:
+            self.in_flight[provider] += 1
+        return True
+
+    def release(self, provider: Optional[str]):
+        if provider in self.in_flight:
+            self.in_flight[provider] -= 1
+
+    def status(self) -> Dict[str, Any]:
+        """In-flight chats per provider, tracked clients and admission counts."""
+        return {
+            "in_flight": dict(self.in_flight),
+            "provider_limits": dict(self.provider_limits),
+            "clients": len(self._clients),
+            **self.stats
+        }
+
+
+def client_address(scope: Dict[str, Any]) -> str:
+    """Address rate limits are keyed by: the proxy-reported client, else the peer."""
+    if TRUST_FORWARDED_FOR:
+        for name, value in scope.get("headers", []):
+            if name == b"x-forwarded-for":
+                return value.decode("latin-1").split(",")[-1].strip()
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+class AdmissionMiddleware:
+    """ASGI middleware applying an AdmissionController to agent chat requests.
+
+    Only ``POST /agents/{name}/chat`` for a known agent passes through the
+    controller; every other route is a priority lane that is never
+    throttled or queued behind chats. When `agents` maps names to the
+    loaded agents, the body of a chat with an agent that has a scripted
+    greeting is read first, and an opening turn (answered with the greeting,
+    no LLM call) is admitted without taking a provider slot.
+    """
+
+    def __init__(self, app, controller: AdmissionController, agents: Optional[Container[str]] = None):
+        self.app = app
+        self.controller = controller
+        self.agents = agents
+
+    async def __call__(self, scope, receive, send):
+        match = CHAT_PATH.match(scope.get("path", "")) if scope["type"] == "http" and scope.get("method") == "POST" else None
+        if match is None or (self.agents is not None and match.group("agent") not in self.agents):
+            await self.app(scope, receive, send)
+            return
+
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        provider = query.get("model_type", ["gemini"])[0]
+        agent = self.agents.get(match.group("agent")) if isinstance(self.agents, Mapping) else None
+        if agent is not None and agent.greeting:
+            received = await _read_body(receive)
+            receive = _replay(received, receive)
+            if _is_scripted(agent, b"".join(message.get("body", b"") for message in received)):
+                provider = None
+        admitted, retry_after = self.controller.admit(client_address(scope), match.group("agent"), provider)
+        if not admitted:
+            await self._reject(send, retry_after)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(provider)
+
+    async def _reject(self, send, retry_after: float):
+        seconds = max(1, math.ceil(retry_after))
+        body = json.dumps({
+            "error": "Too Many Requests",
+            "message": "The agents are busy. Please try again shortly.",
+            "retry_after": seconds
+        }).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(seconds).encode()),
+            ]
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+async def _read_body(receive) -> List[Dict[str, Any]]:
+    """The ASGI messages carrying a request's body (or the disconnect that cut it short)."""
+    received = []
+    while True:
+        message = await receive()
+        received.append(message)
+        if message["type"] != "http.request" or not message.get("more_body", False):
+            return received
+
+
+def _replay(received: List[Dict[str, Any]], receive):
+    """An ASGI receive that hands out `received` again before reading on."""
+    pending = list(received)
+
+    async def replay():
+        if pending:
+            return pending.pop(0)
+        return await receive()
+
+    return replay
+
+
+def _is_scripted(agent: BaseAgent, body: bytes) -> bool:
+    """Whether the agent answers this chat body with its scripted greeting; invalid bodies are not."""
+    try:
+        request = ChatRequest.model_validate_json(body)
+    except ValidationError:
+        return False
+    return agent.get_scripted_response(request) is not None
+
+
+# Shared controller used by the app's admission middleware
+admission_controller = AdmissionController()
@@ -0,0 +1,151 @@
+import asyncio
+
+from fastapi import APIRouter, HTTPException, Request, Response, WebSocket
+from fastapi.responses import StreamingResponse
+
+from agents.base_agent import BaseAgent, ChatRequest
+from agents.agent_factory import load_agents
+from agents.model_router import model_router
+from agents.scheduler import RequestDropped
+from api.admission import admission_controller
+from api.chat_socket import ChatSession
+from api.serialization import StaticJSON, dumps
+from swarm.dispatch import chat_dispatcher
+from swarm.batch import BATCH_ADMIN_TOKEN, BATCH_MAX_CONVERSATIONS, BatchChatRequest, run_batch
+
+# Create router
+router = APIRouter(prefix="/agents", tags=["agents"])
+
+# All agents, built from their JSON definitions and keyed by agent type
+agents = load_agents()
+
+# Agents only change on restart, so their listing and project info are serialized once
+agents_listing = StaticJSON({
+    "agents": [
+        {
+            "name": agent.name,
+            "type": agent.type,
+            "description": agent.description,
+            "endpoint": f"/agents/{agent_name}",
+            "project_info": agent.project_info,
+            "project_info_etag": agent.project_info_etag
+        }
+        for agent_name, agent in agents.items()
+    ]
+})
+agent_infos = {agent_name: StaticJSON(agent.project_info) for agent_name, agent in agents.items()}
+
+def get_agent(agent_name: str) -> BaseAgent:
+    """Look up an agent by type, raising 404 if it does not exist."""
+    agent = agents.get(agent_name)
+    if not agent:
+        raise HTTPException(status_code=404, detail=f"Agent '{agent_name}' not found")
+    return agent
+
+async def watch_disconnect(http_request: Request, disconnected: asyncio.Event):
+    """Set `disconnected` once the client goes away (the request body has already been read)."""
+    while True:
+        message = await http_request.receive()
+        if message["type"] == "http.disconnect":
+            disconnected.set()
+            return
+
+@router.get("")
+async def list_agents():
+    """List all available agents."""
+    return agents_listing.response()
+
+@router.get("/dispatch/status")
+async def dispatch_status(http_request: Request):
+    """Local queue depth, latency estimates, offloaded chats, admission control counts and model routing."""
+    status = chat_dispatcher.status()
+    # The dispatcher is shared by every app in the process; offloading is this app's profile's choice
+    status["swarm_enabled"] = status["swarm_enabled"] and http_request.app.state.profile.swarm_offload
+    return {**status, "admission": admission_controller.status(), "routing": model_router.status()}
+
+@router.get("/{agent_name}")
+async def agent_root(agent_name: str):
+    """Root endpoint with basic API information."""
+    agent = get_agent(agent_name)
+    return {
+        "name": f"{agent.name} Agent API",
+        "version": "0.1.0",
+        "description": f"API for the {agent.name} AI agent"
+    }
+
+@router.get("/{agent_name}/health")
+async def agent_health_check(agent_name: str):
+    """Health check endpoint."""
+    get_agent(agent_name)
+    return {"status": "healthy"}
+
+@router.get("/{agent_name}/info")
+async def get_agent_info(agent_name: str):
+    """Returns the agent's project details, versioned by the ETag chat responses refer to.
+
+    Caching headers and 304s come from api.caching.HTTPCacheMiddleware.
+    """
+    agent = get_agent(agent_name)
+    return agent_infos[agent_name].response({"ETag": agent.project_info_etag})
+
+@router.post("/{agent_name}/chat")
+async def chat(agent_name: str, request: ChatRequest, http_request: Request, model_type: str = "gemini"):
+    """Chat with an agent, locally or on SwarmNode when this process is saturated.
+
+    If the client disconnects first, the generation is cancelled instead of
+    running to completion for nobody.
+    """
+    agent = get_agent(agent_name)
+    disconnected = asyncio.Event()
+    watcher = asyncio.create_task(watch_disconnect(http_request, disconnected))
+    generation = asyncio.ensure_future(chat_dispatcher.dispatch(agent, request, model_type, abandoned=disconnected.is_set,
+                                                                offload=http_request.app.state.profile.swarm_offload))
+    try:
+        await asyncio.wait({generation, watcher}, return_when=asyncio.FIRST_COMPLETED)
+        if not generation.done():
+            generation.cancel()
+            # Nobody is listening any more; 499 is what proxies log for this
+            return Response(status_code=499)
+        return generation.result()
+    except RequestDropped as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    finally:
+        watcher.cancel()
+        if not generation.done():
+            generation.cancel()
+
+@router.post("/{agent_name}/chat/batch")
+async def chat_batch(agent_name: str, batch: BatchChatRequest, http_request: Request, model_type: str = "gemini"):
+    """Answer many conversations with an agent, streamed back as NDJSON as they finish.
+
+    One line per conversation, then a summary line; see swarm.batch.run_batch.
+    Pass the ids already answered in `completed` to resume an interrupted run.
+    """
+    if not BATCH_ADMIN_TOKEN or http_request.headers.get("X-Admin-Token") != BATCH_ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Batch chat is not allowed")
+    agent = get_agent(agent_name)
+    if model_type not in ("openai", "gemini"):
+        raise HTTPException(status_code=400, detail="Invalid model type. Use 'openai' or 'gemini'.")
+    if len(batch.conversations) > BATCH_MAX_CONVERSATIONS:
+        raise HTTPException(status_code=413, detail=f"A batch may hold at most {BATCH_MAX_CONVERSATIONS} conversations")
+
+    profile = http_request.app.state.profile
+    admission = admission_controller if profile.admission else None
+    results = run_batch(agent, batch.conversations, model_type, batch.concurrency, batch.completed, admission=admission,
+                        offload=profile.swarm_offload)
+    return StreamingResponse((dumps(result) + b"\n" async for result in results), media_type="application/x-ndjson")
+
+@router.websocket("/{agent_name}/ws")
+async def chat_socket(agent_name: str, websocket: WebSocket):
+    """Chat over a WebSocket that keeps the conversation, streams tokens and takes cancel messages.
+
+    Other agents can be addressed on the same socket; see api.chat_socket.ChatSession.
+    """
+    if agent_name not in agents:
+        await websocket.close(code=4404, reason=f"Agent '{agent_name}' not found")
+        return
+    await websocket.accept()
+    # Each turn is admitted like a POST to /chat when the profile rate limits chats
+    profile = websocket.app.state.profile
+    admission = admission_controller if profile.admission else None
+    await ChatSession(websocket, agent_name, agents, chat_dispatcher, admission, offload=profile.swarm_offload).run()
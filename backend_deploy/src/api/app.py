@@ -0,0 +1,157 @@
+import os
+from dataclasses import dataclass
+from typing import Dict, Union
+
+from fastapi import FastAPI, Request, HTTPException
+from fastapi.middleware.cors import CORSMiddleware
+
+from api.admission import AdmissionMiddleware, admission_controller
+from api.caching import HTTPCacheMiddleware, response_cache
+from api.compression import CompressionMiddleware
+from api.serialization import FastJSONResponse
+from api.agent_router import router as agent_router, agents as loaded_agents
+
+# Deployment profile used when none is passed to create_app
+BACKEND_PROFILE = os.getenv("BACKEND_PROFILE", "server")
+
+# Frontends allowed to call the API from a browser
+CORS_ORIGINS = [
+    "http://localhost:3000",
+    "https://mammothon-swarm.vercel.app",
+    "https://mammothon-swarm-*.vercel.app",  # Allow all preview deployments
+    "https://mammothon-swarm-git-*.vercel.app",  # Allow all git branch deployments
+    "https://kind-gwenora-papajams-0ddff9e5.koyeb.app",
+    "https://mammothon-backend-papajams-d9d0dedd.koyeb.app"
+]
+
+
+@dataclass(frozen=True)
+class DeploymentProfile:
+    """Which optional parts of the backend a deployment runs.
+
+    Every profile serves the same agent router, BaseAgent and chat
+    dispatcher; profiles only switch the extra routers, background work,
+    admission control and SwarmNode offload. The routes read the profile
+    from ``app.state.profile``, so apps with different profiles can share
+    a process.
+    """
+    name: str
+    github: bool = True
+    staking: bool = True
+    chain_indexer: bool = True
+    swarm_offload: bool = True
+    admission: bool = True
+
+
+PROFILES: Dict[str, DeploymentProfile] = {
+    # Long-running API server (Koyeb, Docker, Procfile)
+    "server": DeploymentProfile("server"),
+    # Backend running inside a SwarmNode execution: no background threads,
+    # chats are never offloaded back to SwarmNode and each execution is one
+    # request, so there is nothing to rate limit
+    "swarmnode": DeploymentProfile("swarmnode", chain_indexer=False, swarm_offload=False, admission=False),
+    # Agents only, for local development and benchmarks
+    "minimal": DeploymentProfile("minimal", github=False, staking=False, chain_indexer=False, swarm_offload=False,
+                                 admission=False),
+}
+
+
+def get_profile(profile: Union[str, DeploymentProfile, None] = None) -> DeploymentProfile:
+    """Resolve a profile by name, defaulting to BACKEND_PROFILE."""
+    if isinstance(profile, DeploymentProfile):
+        return profile
+    name = profile or BACKEND_PROFILE
+    if name not in PROFILES:
+        raise ValueError(f"Unknown backend profile '{name}'. Use one of: {', '.join(PROFILES)}")
+    return PROFILES[name]
+
+
+def create_app(profile: Union[str, DeploymentProfile, None] = None) -> FastAPI:
+    """Build the API for a deployment profile."""
+    profile = get_profile(profile)
+
+    app = FastAPI(
+        title="Mammothon Agent Swarm API",
+        description="API for AI-powered agents representing hackathon projects",
+        version="1.0.0",
+        # orjson instead of json.dumps for every response
+        default_response_class=FastJSONResponse
+    )
+    app.state.profile = profile
+
+    # Innermost, so cached responses still pass through CORS and compression
+    app.add_middleware(HTTPCacheMiddleware, cache=response_cache)
+
+    # Added before CORS so that 429 responses still carry CORS headers
+    if profile.admission:
+        app.add_middleware(AdmissionMiddleware, controller=admission_controller, agents=loaded_agents)
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+        allow_headers=["*"],
+        expose_headers=["Content-Type", "X-Content-Type-Options", "Retry-After", "ETag", "Last-Modified"],
+    )
+
+    # Outermost, so every response leaving the app (CORS and 429s included) can be compressed
+    app.add_middleware(CompressionMiddleware)
+
+    if profile.github:
+        from api.github_api import router as github_router
+        app.include_router(github_router)
+
+    if profile.staking:
+        from api.staking_api import router as staking_router
+        app.include_router(staking_router)
+
+    if profile.chain_indexer:
+        from api.staking_api import CHAIN_INDEXER_ENABLED
+        from chain.indexer import staking_indexer
+
+        if CHAIN_INDEXER_ENABLED:
+            app.add_event_handler("startup", staking_indexer.start)
+            app.add_event_handler("shutdown", staking_indexer.stop)
+
+    @app.get("/health")
+    async def health_check():
+        """Health check endpoint."""
+        return {
+            "status": "healthy",
+            "version": "1.0.0",
+            "profile": profile.name
+        }
+
+    @app.get("/")
+    async def root():
+        """Redirect to API documentation."""
+        return {
+            "message": "Welcome to the Mammothon Agent Swarm API",
+            "documentation": "/docs"
+        }
+
+    # Mount every agent on one shared router
+    app.include_router(agent_router)
+
+    @app.exception_handler(404)
+    async def not_found_handler(request: Request, exc: HTTPException):
+        """Handle 404 errors."""
+        return FastJSONResponse(
+            status_code=404,
+            content={
+                "error": "Not Found",
+                "message": "The requested resource was not found.",
+                "available_endpoints": [
+                    "/",
+                    "/health",
+                    "/agents",
+                    "/agents/{agent_name}",
+                    "/docs",
+                    "/redoc"
+                ]
+            }
+        )
+
+    print(f"Created '{profile.name}' app with agents: {', '.join(loaded_agents)}")
+    return app
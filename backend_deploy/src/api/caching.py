@@ -0,0 +1,199 @@
+import os
+import re
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Dict, Any, List, Optional, Pattern, Tuple
+
+# Seconds browsers and the CDN may reuse the agent listing and project info (both only change on deploy)
+AGENTS_CACHE_MAX_AGE = int(os.getenv("AGENTS_CACHE_MAX_AGE", "300"))
+
+# Seconds browsers and the CDN may reuse GitHub projects and activity
+GITHUB_CACHE_MAX_AGE = int(os.getenv("GITHUB_CACHE_MAX_AGE", "60"))
+
+# Seconds past max-age a cache may keep serving a response while it revalidates in the background
+STALE_WHILE_REVALIDATE = int(os.getenv("STALE_WHILE_REVALIDATE", "600"))
+
+# Rendered responses kept in memory; the least recently used are dropped first
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "256"))
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    max_age: int
+    stale_while_revalidate: int = STALE_WHILE_REVALIDATE
+
+    @property
+    def cache_control(self) -> str:
+        return f"public, max-age={self.max_age}, stale-while-revalidate={self.stale_while_revalidate}"
+
+
+# Read-only GET routes served through the cache, and how long their responses stay fresh
+CACHE_POLICIES: List[Tuple[Pattern, CachePolicy]] = [
+    (re.compile(r"^/agents$"), CachePolicy(AGENTS_CACHE_MAX_AGE)),
+    (re.compile(r"^/agents/[^/]+/info$"), CachePolicy(AGENTS_CACHE_MAX_AGE)),
+    (re.compile(r"^/github/projects$"), CachePolicy(GITHUB_CACHE_MAX_AGE)),
+    (re.compile(r"^/github/activity$"), CachePolicy(GITHUB_CACHE_MAX_AGE)),
+]
+
+
+def cache_policy(path: str) -> Optional[CachePolicy]:
+    return next((policy for pattern, policy in CACHE_POLICIES if pattern.match(path)), None)
+
+
+def body_etag(body: bytes) -> str:
+    """Strong ETag for a serialized response body."""
+    return f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an If-None-Match header names `etag` (weak or strong) or is "*"."""
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in tags or "*" in tags
+
+
+def not_modified_since(if_modified_since: str, last_modified: str) -> bool:
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+
+@dataclass
+class CachedResponse:
+    status: int
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+    etag: str
+    last_modified: str
+    expires: float
+
+
+class ResponseCache:
+    """Rendered responses of the read-only routes, reused until their max-age runs out.
+
+    While an entry is fresh the route is not called at all; a conditional
+    request is answered from the stored ETag. Entries are keyed by path
+    and query string.
+    """
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """The entry for `key`, fresh or not; callers check `expires`."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, entry: CachedResponse):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, prefix: str = ""):
+        """Expire every entry whose path starts with `prefix`, so the next read renders it again.
+
+        Expired entries keep their ETag and Last-Modified, which stay put if
+        the new rendering is the same.
+        """
+        with self._lock:
+            for key, entry in self._entries.items():
+                if key.startswith(prefix):
+                    entry.expires = 0
+
+    def status(self) -> Dict[str, Any]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+class HTTPCacheMiddleware:
+    """ASGI middleware adding HTTP caching to the read-only routes in CACHE_POLICIES.
+
+    Successful GET responses get a strong ETag (the route's own, or a hash
+    of the body), Last-Modified and the route's Cache-Control with
+    stale-while-revalidate, so browsers and the CDN edge can absorb polling.
+    If-None-Match (or If-Modified-Since) is answered with 304. Rendered
+    responses are kept in `cache` for max-age, so repeated polls skip the
+    route as well.
+    """
+
+    def __init__(self, app, cache: ResponseCache):
+        self.app = app
+        self.cache = cache
+
+    async def __call__(self, scope, receive, send):
+        policy = cache_policy(scope.get("path", "")) if scope["type"] == "http" and scope.get("method") == "GET" else None
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        key = scope["path"] + "?" + scope.get("query_string", b"").decode("latin-1")
+        now = time.time()
+        entry = self.cache.get(key)
+        if entry is not None and entry.expires > now:
+            self.cache.hits += 1
+        else:
+            self.cache.misses += 1
+            messages = []
+
+            async def collect(message):
+                messages.append(message)
+
+            await self.app(scope, receive, collect)
+            rendered = self._entry(messages, policy, now, previous=entry)
+            if rendered is None:
+                # Errors and anything else that is not a plain 200 pass through uncached
+                for message in messages:
+                    await send(message)
+                return
+            entry = rendered
+            self.cache.put(key, entry)
+
+        await self._send(entry, policy, scope, send)
+
+    def _entry(self, messages, policy: CachePolicy, now: float,
+               previous: Optional[CachedResponse]) -> Optional[CachedResponse]:
+        start = next((message for message in messages if message["type"] == "http.response.start"), None)
+        if start is None or start["status"] != 200:
+            return None
+        body = b"".join(message.get("body", b"") for message in messages if message["type"] == "http.response.body")
+        headers = [(name, value) for name, value in start.get("headers", [])
+                   if name.lower() not in (b"content-length", b"etag", b"cache-control", b"last-modified")]
+        route_etag = next((value.decode("latin-1") for name, value in start.get("headers", []) if name.lower() == b"etag"), None)
+        etag = route_etag or body_etag(body)
+        unchanged = previous is not None and previous.etag == etag
+        last_modified = previous.last_modified if unchanged else formatdate(now, usegmt=True)
+        return CachedResponse(200, headers, body, etag, last_modified, now + policy.max_age)
+
+    async def _send(self, entry: CachedResponse, policy: CachePolicy, scope, send):
+        request_headers = {name.lower(): value.decode("latin-1") for name, value in scope.get("headers", [])}
+        validators = [(b"etag", entry.etag.encode()), (b"last-modified", entry.last_modified.encode()),
+                      (b"cache-control", policy.cache_control.encode())]
+        if_none_match = request_headers.get(b"if-none-match")
+        if if_none_match is not None:
+            not_modified = etag_matches(if_none_match, entry.etag)
+        else:
+            not_modified = not_modified_since(request_headers.get(b"if-modified-since", ""), entry.last_modified)
+
+        if not_modified:
+            await send({"type": "http.response.start", "status": 304, "headers": validators})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        headers = entry.headers + validators + [(b"content-length", str(len(entry.body)).encode())]
+        await send({"type": "http.response.start", "status": entry.status, "headers": headers})
+        await send({"type": "http.response.body", "body": entry.body})
+
+
+# Shared response cache used by the API
+response_cache = ResponseCache()
@@ -0,0 +1,171 @@
+import os
+import json
+import asyncio
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+from agents.base_agent import BaseAgent, ChatRequest, Message
+from agents.scheduler import RequestDropped
+from api.admission import AdmissionController, client_address
+from api.serialization import dumps
+from swarm.dispatch import ChatDispatcher
+
+# Exchanges (user message and answer) a socket keeps per agent; older ones are forgotten
+CHAT_SOCKET_MAX_TURNS = int(os.getenv("CHAT_SOCKET_MAX_TURNS", "20"))
+
+class ChatSession:
+    """Chat over one WebSocket: a conversation per agent, kept on the connection.
+
+    Clients send only their new message each turn::
+
+        {"type": "chat", "id": "1", "content": "How do I fork it?", "agent": "hwc", "model_type": "gemini"}
+        {"type": "cancel", "id": "1"}
+        {"type": "reset", "agent": "hwc"}
+
+    ``agent`` defaults to the agent in the socket's URL, so one socket can
+    talk to several agents, with their turns running side by side (one at a
+    time per agent). The server answers with ``token`` messages as the
+    reply streams, then ``done`` with the full response (and project info
+    on the opening turn), or ``cancelled`` / ``error``. A ``restart``
+    means a provider failed mid-stream and the tokens so far are void; the
+    tokens after it belong to the fallback answer. ``done.response`` is
+    authoritative: it is what the conversation keeps. Every message
+    carries the turn's ``id`` and ``agent``. A cancelled or failed turn
+    leaves the conversation as it was before it; closing the socket
+    cancels the turns still running. Only the last ``max_turns`` exchanges
+    of each conversation are kept.
+    """
+
+    def __init__(self, websocket: WebSocket, agent_name: str, agents: Mapping[str, BaseAgent],
+                 dispatcher: ChatDispatcher, admission: Optional[AdmissionController] = None,
+                 max_turns: int = CHAT_SOCKET_MAX_TURNS, offload: bool = True):
+        self.websocket = websocket
+        self.agent_name = agent_name
+        self.agents = agents
+        self.dispatcher = dispatcher
+        self.admission = admission
+        self.max_turns = max_turns
+        self.offload = offload
+        self.conversations: Dict[str, List[Message]] = {}
+        self.turns: Dict[str, Tuple[str, asyncio.Task]] = {}
+        self.outbox: asyncio.Queue = asyncio.Queue()
+
+    async def run(self):
+        """Serve the socket until the client closes it."""
+        writer = asyncio.create_task(self._write())
+        try:
+            while True:
+                text = await self.websocket.receive_text()
+                try:
+                    message = json.loads(text)
+                    self.handle(message if isinstance(message, dict) else {})
+                except ValueError:
+                    self.send({"type": "error", "error": "Messages must be JSON objects"})
+        except WebSocketDisconnect:
+            pass
+        finally:
+            tasks = [task for _, task in self.turns.values()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            writer.cancel()
+
+    def handle(self, message: Dict[str, Any]):
+        kind = message.get("type")
+        turn_id = str(message.get("id", ""))
+        agent_name = message.get("agent") or self.agent_name
+        if not isinstance(agent_name, str):
+            self.send({"type": "error", "id": turn_id, "error": "'agent' must be an agent name"})
+        elif kind == "cancel":
+            if turn_id in self.turns:
+                self.turns[turn_id][1].cancel()
+        elif kind == "reset":
+            if any(name == agent_name for name, _ in self.turns.values()):
+                self.send({"type": "error", "agent": agent_name, "error": "Cannot reset while a turn is running"})
+            else:
+                self.conversations.pop(agent_name, None)
+        elif kind == "chat":
+            error = self._check_turn(turn_id, agent_name, message)
+            if error:
+                self.send({"type": "error", "id": turn_id, "agent": agent_name, "error": error})
+                return
+            task = asyncio.create_task(self._turn(turn_id, agent_name, message["content"],
+                                                  message.get("model_type", "gemini")))
+            self.turns[turn_id] = (agent_name, task)
+        else:
+            self.send({"type": "error", "id": turn_id, "error": f"Unknown message type '{kind}'"})
+
+    def _check_turn(self, turn_id: str, agent_name: str, message: Dict[str, Any]) -> Optional[str]:
+        if not turn_id or turn_id in self.turns:
+            return "Each turn needs an id that is not already in use"
+        if agent_name not in self.agents:
+            return f"Agent '{agent_name}' not found"
+        if not isinstance(message.get("content"), str) or not message["content"]:
+            return "A chat message needs some content"
+        if message.get("model_type", "gemini") not in ("openai", "gemini"):
+            return "Invalid model type. Use 'openai' or 'gemini'."
+        if any(name == agent_name for name, _ in self.turns.values()):
+            return f"A turn with '{agent_name}' is already running"
+        return None
+
+    async def _turn(self, turn_id: str, agent_name: str, content: str, model_type: str):
+        agent = self.agents[agent_name]
+        history = self.conversations.get(agent_name, [])
+        messages = history + [Message(role="user", content=content)]
+        loop = asyncio.get_running_loop()
+
+        def on_chunk(text: str):
+            # Called on the generating thread
+            loop.call_soon_threadsafe(self._token, turn_id, agent_name, text)
+
+        def on_restart():
+            loop.call_soon_threadsafe(self._restart, turn_id, agent_name)
+
+        admitted = True
+        # Scripted greetings make no LLM call, so they take no provider slot
+        provider = None if agent.get_scripted_response(ChatRequest(messages=messages)) is not None else model_type
+        if self.admission is not None:
+            admitted, retry_after = self.admission.admit(client_address(self.websocket.scope), agent_name, provider)
+        try:
+            if not admitted:
+                self.send({"type": "error", "id": turn_id, "agent": agent_name, "error": "Too Many Requests",
+                           "retry_after": max(1, round(retry_after))})
+                return
+            response = await self.dispatcher.dispatch(agent, ChatRequest(messages=messages), model_type,
+                                                      on_chunk=on_chunk, on_restart=on_restart, offload=self.offload)
+            messages = messages + [Message(role="assistant", content=response.response)]
+            self.conversations[agent_name] = messages[max(0, len(messages) - 2 * self.max_turns):]
+            self.send({"type": "done", "id": turn_id, "agent": agent_name, **response.model_dump()})
+        except asyncio.CancelledError:
+            self.send({"type": "cancelled", "id": turn_id, "agent": agent_name})
+        except RequestDropped as e:
+            self.send({"type": "error", "id": turn_id, "agent": agent_name, "error": str(e), "retry_after": 1})
+        except Exception as e:
+            self.send({"type": "error", "id": turn_id, "agent": agent_name, "error": f"{type(e).__name__}: {e}"})
+        finally:
+            if admitted and self.admission is not None:
+                self.admission.release(provider)
+            self.turns.pop(turn_id, None)
+
+    def _token(self, turn_id: str, agent_name: str, text: str):
+        # A stream can deliver one more chunk after its turn was cancelled
+        if turn_id in self.turns:
+            self.send({"type": "token", "id": turn_id, "agent": agent_name, "text": text})
+
+    def _restart(self, turn_id: str, agent_name: str):
+        if turn_id in self.turns:
+            self.send({"type": "restart", "id": turn_id, "agent": agent_name})
+
+    def send(self, message: Dict[str, Any]):
+        """Queue a message; one writer sends them in order, so tokens never overtake their turn's end."""
+        self.outbox.put_nowait(message)
+
+    async def _write(self):
+        while True:
+            message = await self.outbox.get()
+            try:
+                await self.websocket.send_text(dumps(message).decode("utf-8"))
+            except Exception:
+                # The client is gone; run() finishes the session when the receive side notices
+                return
@@ -0,0 +1,138 @@
+import os
+import re
+import zlib
+from typing import Optional
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+# Responses smaller than this (bytes) are sent as they are; streamed responses are always compressed
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+
+# Compression levels: brotli 0-11, gzip 1-9
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "5"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+
+# Content types worth compressing (text formats; images and archives already are)
+COMPRESSIBLE_TYPES = re.compile(r"^(text/|application/(json|x-ndjson|javascript|xml)|image/svg)")
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """The best encoding the client accepts: "br" when brotli is installed, else "gzip"."""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    if brotli is not None and accepted.get("br", 0) > 0:
+        return "br"
+    if accepted.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+
+def _weak_etags(headers):
+    """Headers with any strong ETag made weak: the encoded bytes differ from the identity ones it was computed for."""
+    return [(name, value if name.lower() != b"etag" or value.startswith(b"W/") else b"W/" + value)
+            for name, value in headers]
+
+
+class _Compressor:
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            self._gzip = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def chunk(self, data: bytes) -> bytes:
+        """Compress a piece of a streamed body and flush it, so the client can decode it right away."""
+        if self.encoding == "br":
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._gzip.compress(data) + self._gzip.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        if self.encoding == "br":
+            return self._brotli.process(data) + self._brotli.finish()
+        return self._gzip.compress(data) + self._gzip.flush()
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses with brotli or gzip, per the client's Accept-Encoding.
+
+    Complete responses are compressed only from ``minimum_size`` bytes up;
+    streamed ones (more_body) are compressed chunk by chunk and flushed
+    after each, so NDJSON lines still arrive as they are produced.
+    Brotli is used when the ``brotli`` package is installed. ETags of
+    compressed responses (and of 304s to clients that would get one) are
+    made weak, so gzip, br and identity bodies never share a strong ETag.
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept = next((value.decode("latin-1") for name, value in scope.get("headers", []) if name == b"accept-encoding"), "")
+        encoding = choose_encoding(accept)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = None
+        compressor = None
+
+        async def send_compressed(message):
+            nonlocal start, compressor
+            if message["type"] == "http.response.start":
+                # Held back until the first body message shows whether to compress
+                start = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body, more_body = message.get("body", b""), message.get("more_body", False)
+            if start is not None:
+                headers = {name.lower(): value for name, value in start.get("headers", [])}
+                content_type = headers.get(b"content-type", b"").decode("latin-1")
+                skip = (b"content-encoding" in headers or start["status"] in (204, 304)
+                        or not COMPRESSIBLE_TYPES.match(content_type)
+                        or (not more_body and len(body) < self.minimum_size))
+                if skip:
+                    if start["status"] == 304:
+                        start = {**start, "headers": _weak_etags(start.get("headers", []))}
+                    await send(start)
+                else:
+                    compressor = _Compressor(encoding)
+                    start_headers = [(name, value) for name, value in _weak_etags(start.get("headers", []))
+                                     if name.lower() != b"content-length"]
+                    start_headers += [(b"content-encoding", encoding.encode()), (b"vary", b"Accept-Encoding")]
+                    if not more_body:
+                        body = compressor.finish(body)
+                        start_headers.append((b"content-length", str(len(body)).encode()))
+                    await send({**start, "headers": start_headers})
+                    if not more_body:
+                        await send({"type": "http.response.body", "body": body})
+                        start = None
+                        return
+                start = None
+
+            if compressor is None:
+                await send(message)
+            elif more_body:
+                await send({"type": "http.response.body", "body": compressor.chunk(body), "more_body": True})
+            else:
+                await send({"type": "http.response.body", "body": compressor.finish(body)})
+
+        await self.app(scope, receive, send_compressed)
@@ -1,25 +1,22 @@
 import os
-import requests
-from fastapi import APIRouter, HTTPException
+import json
+import time
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 
+from .github_sync import sync_engine, verify_webhook_signature, GITHUB_WEBHOOK_SECRET
+from .github_history import history_store, to_timestamp, to_iso, RESOLUTIONS
+from .project_registry import project_registry
+from .serialization import FastJSONResponse
+from .caching import response_cache
+
 # Create router
 router = APIRouter(prefix="/github", tags=["github"])
 
-# GitHub API token (optional but recommended to avoid rate limits)
-GITHUB_TOKEN = os.getenv("GITHUB_TOKEN", "")
-
-# Headers for GitHub API requests
-headers = {"Authorization": f"token {GITHUB_TOKEN}"} if GITHUB_TOKEN else {}
-
-# List of projects to track
-TRACKED_PROJECTS = [
-    {"owner": "Mazzz-zzz", "repo": "voca.fi", "name": "VocaFI"},
-    {"owner": "Royleong31", "repo": "Clarity", "name": "Clarity"},
-    {"owner": "azf20", "repo": "hello-world-computer", "name": "Hello World Computer"},
-    {"owner": "thisyearnofear", "repo": "mammothon-swarm", "name": "Mammothon"},
-]
+# Token required to register projects at runtime (registration is disabled when unset)
+REGISTRY_ADMIN_TOKEN = os.getenv("REGISTRY_ADMIN_TOKEN", "")
 
 # Response models
 class RepoInfo(BaseModel):
@@ -44,122 +41,184 @@ class Fork(BaseModel):
     created_at: str
     url: str
 
+class TrackedProject(BaseModel):
+    owner: str
+    repo: str
+    name: Optional[str] = None
+    agent: Optional[str] = None
+
 class ProjectActivity(BaseModel):
     repo_info: Optional[RepoInfo] = None
     recent_commits: List[Commit] = []
     recent_forks: List[Fork] = []
 
+class HistoryPoint(BaseModel):
+    timestamp: str
+    stars: int
+    forks: int
+    watchers: int
+    open_issues: int
+
+class ProjectHistory(BaseModel):
+    owner: str
+    repo: str
+    resolution: str
+    points: List[HistoryPoint] = []
+
+class ProjectTrend(BaseModel):
+    owner: str
+    repo: str
+    stars: int
+    forks: int
+    stars_delta: int
+    forks_delta: int
+
 # Helper functions
+def get_activity(owner: str, repo: str) -> Dict[str, Any]:
+    """Get a project's synced activity and record it in the history store"""
+    activity = sync_engine.sync(owner, repo)
+    
+    # Warm start from history if GitHub has not answered since the restart
+    if activity["repo_info"] is None:
+        latest = history_store.latest(owner, repo)
+        if latest:
+            activity["repo_info"] = {
+                "name": repo,
+                "owner": owner,
+                "repo": repo,
+                "stars": latest["stars"],
+                "forks": latest["forks"],
+                "watchers": latest["watchers"],
+                "open_issues": latest["open_issues"],
+                "last_updated": latest["last_updated"]
+            }
+    else:
+        history_store.record(activity["repo_info"])
+    
+    return activity
+
 def get_repo_info(owner: str, repo: str) -> Optional[Dict[str, Any]]:
-    """Get basic repository information"""
-    try:
-        response = requests.get(
-            f"https://api.github.com/repos/{owner}/{repo}",
-            headers=headers
-        )
-        response.raise_for_status()
-        data = response.json()
-        return {
-            "name": data.get("name"),
-            "owner": owner,
-            "repo": repo,
-            "stars": data.get("stargazers_count", 0),
-            "forks": data.get("forks_count", 0),
-            "watchers": data.get("watchers_count", 0),
-            "open_issues": data.get("open_issues_count", 0),
-            "last_updated": data.get("updated_at", "")
-        }
-    except Exception as e:
-        print(f"Error fetching repo info for {owner}/{repo}: {str(e)}")
-        return None
+    """Get basic repository information from the incrementally synced snapshot"""
+    return get_activity(owner, repo)["repo_info"]
 
 def get_recent_commits(owner: str, repo: str, count: int = 5) -> List[Dict[str, Any]]:
-    """Get recent commits"""
-    try:
-        response = requests.get(
-            f"https://api.github.com/repos/{owner}/{repo}/commits?per_page={count}",
-            headers=headers
-        )
-        response.raise_for_status()
-        data = response.json()
-        return [
-            {
-                "sha": commit.get("sha", "")[:7],
-                "message": commit.get("commit", {}).get("message", "").split("\n")[0],
-                "author": commit.get("commit", {}).get("author", {}).get("name", ""),
-                "date": commit.get("commit", {}).get("author", {}).get("date", "")
-            }
-            for commit in data
-        ]
-    except Exception as e:
-        print(f"Error fetching commits for {owner}/{repo}: {str(e)}")
-        return []
+    """Get recent commits from the incrementally synced snapshot"""
+    return sync_engine.sync(owner, repo)["recent_commits"][:count]
 
 def get_recent_forks(owner: str, repo: str, count: int = 5) -> List[Dict[str, Any]]:
-    """Get recent forks"""
-    try:
-        response = requests.get(
-            f"https://api.github.com/repos/{owner}/{repo}/forks?per_page={count}&sort=newest",
-            headers=headers
-        )
-        response.raise_for_status()
-        data = response.json()
-        return [
-            {
-                "owner": fork.get("owner", {}).get("login", ""),
-                "full_name": fork.get("full_name", ""),
-                "created_at": fork.get("created_at", ""),
-                "url": fork.get("html_url", "")
-            }
-            for fork in data
-        ]
-    except Exception as e:
-        print(f"Error fetching forks for {owner}/{repo}: {str(e)}")
-        return []
+    """Get recent forks from the incrementally synced snapshot"""
+    return sync_engine.sync(owner, repo)["recent_forks"][:count]
 
 # API endpoints
 @router.get("/projects", response_model=List[Dict[str, str]])
-async def list_projects():
+async def list_projects(offset: int = 0, limit: Optional[int] = None):
     """List all tracked projects"""
-    return TRACKED_PROJECTS
+    # Registry rows are plain strings already; skip re-validating them against the response model
+    return FastJSONResponse(project_registry.all(offset, limit))
+
+@router.post("/projects", response_model=Dict[str, str])
+async def register_project(project: TrackedProject, request: Request):
+    """Register a project to track without redeploying"""
+    if not REGISTRY_ADMIN_TOKEN or request.headers.get("X-Admin-Token") != REGISTRY_ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Project registration is not allowed")
+    registered = project_registry.register(project.owner, project.repo, project.name, project.agent)
+    response_cache.invalidate("/github/")
+    return registered
 
 @router.get("/project/{owner}/{repo}", response_model=ProjectActivity)
-async def get_project_activity(owner: str, repo: str):
-    """Get activity for a specific project"""
+def get_project_activity(owner: str, repo: str):
+    """Get activity for a specific project
+
+    A plain def, like the other routes that may sync, so GitHub requests run in the threadpool.
+    """
     # Check if project is tracked
-    project = next((p for p in TRACKED_PROJECTS if p["owner"] == owner and p["repo"] == repo), None)
+    project = project_registry.get(owner, repo)
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found in tracked projects")
+    
+    # Get project activity (only deltas are fetched from GitHub)
+    return get_activity(project["owner"], project["repo"])
+
+@router.get("/project/{owner}/{repo}/history", response_model=ProjectHistory)
+async def get_project_history(owner: str, repo: str, start: Optional[str] = None, end: Optional[str] = None, resolution: str = "day"):
+    """Get star/fork history for a project, downsampled to the requested resolution"""
+    project = project_registry.get(owner, repo)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found in tracked projects")
+    owner, repo = project["owner"], project["repo"]
+    if resolution not in RESOLUTIONS:
+        raise HTTPException(status_code=400, detail=f"Invalid resolution. Use one of: {', '.join(RESOLUTIONS)}")
     
-    # Get project activity
-    repo_info = get_repo_info(owner, repo)
-    recent_commits = get_recent_commits(owner, repo)
-    recent_forks = get_recent_forks(owner, repo)
+    try:
+        samples = history_store.history(owner, repo, to_timestamp(start), to_timestamp(end), resolution)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid start or end. Use ISO-8601 timestamps.")
     
     return {
-        "repo_info": repo_info,
-        "recent_commits": recent_commits,
-        "recent_forks": recent_forks
+        "owner": owner,
+        "repo": repo,
+        "resolution": resolution,
+        "points": [
+            {
+                "timestamp": to_iso(sample["ts"]),
+                "stars": sample["stars"],
+                "forks": sample["forks"],
+                "watchers": sample["watchers"],
+                "open_issues": sample["open_issues"]
+            }
+            for sample in samples
+        ]
     }
 
+@router.get("/trends", response_model=List[ProjectTrend])
+async def get_trends(days: int = 7):
+    """Get star/fork growth of all tracked projects over the last few days"""
+    if days <= 0:
+        raise HTTPException(status_code=400, detail="days must be positive")
+    
+    start = int(time.time()) - days * 86400
+    return [t for t in history_store.trends(start) if project_registry.get(t["owner"], t["repo"])]
+
 @router.get("/activity", response_model=Dict[str, ProjectActivity])
-async def get_all_activity():
-    """Get activity for all tracked projects"""
+def get_all_activity(offset: int = 0, limit: int = 100):
+    """Get activity for tracked projects (paged, since each project may hit GitHub)"""
     result = {}
     
-    for project in TRACKED_PROJECTS:
+    for project in project_registry.all(offset, limit):
         owner = project["owner"]
         repo = project["repo"]
         name = project["name"]
         
-        repo_info = get_repo_info(owner, repo)
-        recent_commits = get_recent_commits(owner, repo)
-        recent_forks = get_recent_forks(owner, repo)
-        
-        result[name] = {
-            "repo_info": repo_info,
-            "recent_commits": recent_commits,
-            "recent_forks": recent_forks
-        }
+        result[name] = get_activity(owner, repo)
+    
+    # Snapshots are stored in the response model's shape; skip re-validating them
+    return FastJSONResponse(result)
+
+@router.post("/webhook")
+async def github_webhook(request: Request):
+    """Receive GitHub webhook deliveries and update the activity snapshot"""
+    if not GITHUB_WEBHOOK_SECRET:
+        raise HTTPException(status_code=403, detail="Webhook deliveries are not accepted")
+    body = await request.body()
+    if not verify_webhook_signature(body, request.headers.get("X-Hub-Signature-256"), GITHUB_WEBHOOK_SECRET):
+        raise HTTPException(status_code=401, detail="Invalid webhook signature")
+    
+    event = request.headers.get("X-GitHub-Event", "")
+    if event == "ping":
+        return {"status": "ok"}
+    
+    try:
+        payload = json.loads(body or b"{}")
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    
+    repository = payload.get("repository") or {}
+    owner = (repository.get("owner") or {}).get("login") or (repository.get("owner") or {}).get("name")
+    repo = repository.get("name")
+    if not owner or not repo or not project_registry.get(owner, repo):
+        return {"status": "ignored"}
     
-    return result 
\ No newline at end of file
+    await run_in_threadpool(sync_engine.apply_webhook, event, payload)
+    response_cache.invalidate("/github/")
+    return {"status": "updated", "event": event}
+ 
\ No newline at end of file
@@ -0,0 +1,199 @@
+import os
+import time
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional
+
+from .github_sync import DATA_DIR
+
+# SQLite database holding repo snapshots over time
+HISTORY_DB_FILE = os.getenv("GITHUB_HISTORY_DB", os.path.join(DATA_DIR, "github_history.db"))
+
+# Minimum seconds between two recorded samples of an unchanged repo
+SAMPLE_INTERVAL = int(os.getenv("GITHUB_HISTORY_SAMPLE_INTERVAL", "3600"))
+
+# Bucket sizes (in seconds) accepted by the history endpoint
+RESOLUTIONS = {
+    "raw": 0,
+    "hour": 3600,
+    "day": 86400,
+    "week": 604800
+}
+
+METRICS = ("stars", "forks", "watchers", "open_issues")
+
+
+def to_timestamp(value: Optional[str]) -> Optional[int]:
+    """Parse an ISO-8601 string into a unix timestamp."""
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+def to_iso(timestamp: int) -> str:
+    """Format a unix timestamp as an ISO-8601 UTC string."""
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class GitHubHistoryStore:
+    """Embedded time-series store of RepoInfo snapshots per tracked project.
+
+    Samples live in a single SQLite table indexed on (owner, repo, ts), so
+    range scans stay fast as history grows. Downsampling happens in SQL by
+    bucketing timestamps and keeping the last sample of each bucket.
+    """
+
+    def __init__(self, db_file: str = HISTORY_DB_FILE, sample_interval: int = SAMPLE_INTERVAL):
+        self.db_file = db_file
+        self.sample_interval = sample_interval
+        self._lock = threading.Lock()
+        if db_file != ":memory:":
+            os.makedirs(os.path.dirname(db_file) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(db_file, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS repo_snapshots (
+                owner TEXT NOT NULL,
+                repo TEXT NOT NULL,
+                ts INTEGER NOT NULL,
+                stars INTEGER NOT NULL,
+                forks INTEGER NOT NULL,
+                watchers INTEGER NOT NULL,
+                open_issues INTEGER NOT NULL,
+                last_updated TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_repo_snapshots_repo_ts ON repo_snapshots (owner, repo, ts);
+            CREATE INDEX IF NOT EXISTS idx_repo_snapshots_ts ON repo_snapshots (ts);
+        """)
+        self._conn.commit()
+        self._latest = self._load_latest()
+
+    def _load_latest(self) -> Dict[str, Dict[str, Any]]:
+        """Read the newest sample of every repo (used for warm starts)."""
+        rows = self._conn.execute("""
+            SELECT owner, repo, MAX(ts), stars, forks, watchers, open_issues, last_updated
+            FROM repo_snapshots GROUP BY owner, repo
+        """).fetchall()
+        return {f"{row[0]}/{row[1]}": self._row_to_sample(row) for row in rows}
+
+    def _row_to_sample(self, row) -> Dict[str, Any]:
+        owner, repo, ts, stars, forks, watchers, open_issues, last_updated = row
+        return {
+            "owner": owner,
+            "repo": repo,
+            "ts": ts,
+            "stars": stars,
+            "forks": forks,
+            "watchers": watchers,
+            "open_issues": open_issues,
+            "last_updated": last_updated or ""
+        }
+
+    def record(self, repo_info: Optional[Dict[str, Any]], ts: Optional[int] = None) -> bool:
+        """Record a RepoInfo snapshot.
+
+        Unchanged repos are sampled at most once per sample interval, so this
+        is cheap to call on every read. Returns True if a row was written.
+        """
+        if not repo_info:
+            return False
+        ts = int(ts if ts is not None else time.time())
+        key = f"{repo_info['owner']}/{repo_info['repo']}"
+
+        with self._lock:
+            latest = self._latest.get(key)
+            if latest:
+                unchanged = all(latest[m] == repo_info.get(m, 0) for m in METRICS)
+                if unchanged and ts - latest["ts"] < self.sample_interval:
+                    return False
+
+            sample = {
+                "owner": repo_info["owner"],
+                "repo": repo_info["repo"],
+                "ts": ts,
+                **{m: repo_info.get(m, 0) for m in METRICS},
+                "last_updated": repo_info.get("last_updated", "")
+            }
+            self._conn.execute(
+                "INSERT INTO repo_snapshots VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (sample["owner"], sample["repo"], ts, sample["stars"], sample["forks"],
+                 sample["watchers"], sample["open_issues"], sample["last_updated"])
+            )
+            self._conn.commit()
+            self._latest[key] = sample
+            return True
+
+    def latest(self, owner: str, repo: str) -> Optional[Dict[str, Any]]:
+        """Newest recorded sample for a repo, if any."""
+        return self._latest.get(f"{owner}/{repo}")
+
+    def history(self, owner: str, repo: str, start: Optional[int] = None, end: Optional[int] = None,
+                resolution: str = "day") -> List[Dict[str, Any]]:
+        """Samples for a repo in [start, end], downsampled to one per bucket."""
+        if resolution not in RESOLUTIONS:
+            raise ValueError(f"Invalid resolution. Use one of: {', '.join(RESOLUTIONS)}")
+        bucket = RESOLUTIONS[resolution]
+        start = start if start is not None else 0
+        end = end if end is not None else int(time.time())
+
+        if bucket:
+            # SQLite returns the bare columns of the row holding MAX(ts) in each group
+            query = """
+                SELECT owner, repo, MAX(ts), stars, forks, watchers, open_issues, last_updated
+                FROM repo_snapshots
+                WHERE owner = ? AND repo = ? AND ts BETWEEN ? AND ?
+                GROUP BY ts / ? ORDER BY ts
+            """
+            params = (owner, repo, start, end, bucket)
+        else:
+            query = """
+                SELECT owner, repo, ts, stars, forks, watchers, open_issues, last_updated
+                FROM repo_snapshots
+                WHERE owner = ? AND repo = ? AND ts BETWEEN ? AND ?
+                ORDER BY ts
+            """
+            params = (owner, repo, start, end)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [self._row_to_sample(row) for row in rows]
+
+    def trends(self, start: int, end: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Growth of every repo between its first and last sample in the range."""
+        end = end if end is not None else int(time.time())
+        with self._lock:
+            rows = self._conn.execute("""
+                SELECT first.owner, first.repo, first.stars, first.forks, last.stars, last.forks, first.ts, last.ts
+                FROM (
+                    SELECT owner, repo, MIN(ts) AS ts, stars, forks FROM repo_snapshots
+                    WHERE ts BETWEEN ? AND ? GROUP BY owner, repo
+                ) AS first
+                JOIN (
+                    SELECT owner, repo, MAX(ts) AS ts, stars, forks FROM repo_snapshots
+                    WHERE ts BETWEEN ? AND ? GROUP BY owner, repo
+                ) AS last ON first.owner = last.owner AND first.repo = last.repo
+            """, (start, end, start, end)).fetchall()
+
+        trends = [
+            {
+                "owner": owner,
+                "repo": repo,
+                "stars": last_stars,
+                "forks": last_forks,
+                "stars_delta": last_stars - first_stars,
+                "forks_delta": last_forks - first_forks,
+                "from": to_iso(first_ts),
+                "to": to_iso(last_ts)
+            }
+            for owner, repo, first_stars, first_forks, last_stars, last_forks, first_ts, last_ts in rows
+        ]
+        trends.sort(key=lambda t: (t["stars_delta"], t["forks_delta"]), reverse=True)
+        return trends
+
+
+# Shared store used by the API
+history_store = GitHubHistoryStore()
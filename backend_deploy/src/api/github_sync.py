@@ -0,0 +1,306 @@
+import os
+import copy
+import json
+import hmac
+import time
+import hashlib
+import threading
+import requests
+from typing import List, Dict, Any, Optional
+
+# GitHub API token (optional but recommended to avoid rate limits)
+GITHUB_TOKEN = os.getenv("GITHUB_TOKEN", "")
+
+# Secret configured on the GitHub webhook; webhook deliveries are refused when unset
+GITHUB_WEBHOOK_SECRET = os.getenv("GITHUB_WEBHOOK_SECRET", "")
+
+# Where local state (sync checkpoints, history, registry) is kept
+DATA_DIR = os.getenv(
+    "MAMMOTHON_DATA_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data")
+)
+
+# File holding the per-repo sync checkpoints and last snapshot
+SYNC_STATE_FILE = os.getenv("GITHUB_SYNC_STATE_FILE", os.path.join(DATA_DIR, "github_sync_state.json"))
+
+# Seconds a snapshot is served as-is before we ask GitHub for deltas again
+SYNC_INTERVAL = int(os.getenv("GITHUB_SYNC_INTERVAL", "300"))
+
+# Number of commits/forks kept in each snapshot
+SNAPSHOT_SIZE = 5
+
+API_URL = "https://api.github.com"
+
+
+def _format_repo_info(owner: str, repo: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a GitHub repo payload into the RepoInfo shape."""
+    return {
+        "name": data.get("name"),
+        "owner": owner,
+        "repo": repo,
+        "stars": data.get("stargazers_count", 0),
+        "forks": data.get("forks_count", 0),
+        "watchers": data.get("watchers_count", 0),
+        "open_issues": data.get("open_issues_count", 0),
+        "last_updated": data.get("updated_at", "")
+    }
+
+
+def _format_commit(commit: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a GitHub commit payload into the Commit shape."""
+    return {
+        "sha": commit.get("sha", "")[:7],
+        "message": commit.get("commit", {}).get("message", "").split("\n")[0],
+        "author": commit.get("commit", {}).get("author", {}).get("name", ""),
+        "date": commit.get("commit", {}).get("author", {}).get("date", "")
+    }
+
+
+def _format_fork(fork: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a GitHub fork payload into the Fork shape."""
+    return {
+        "owner": fork.get("owner", {}).get("login", ""),
+        "full_name": fork.get("full_name", ""),
+        "created_at": fork.get("created_at", ""),
+        "url": fork.get("html_url", "")
+    }
+
+
+def _merge(new_items: List[Dict[str, Any]], old_items: List[Dict[str, Any]], key: str) -> List[Dict[str, Any]]:
+    """Put new items in front of the old ones, dropping duplicates and trimming to the snapshot size."""
+    merged = []
+    seen = set()
+    for item in new_items + old_items:
+        if item.get(key) in seen:
+            continue
+        seen.add(item.get(key))
+        merged.append(item)
+    return merged[:SNAPSHOT_SIZE]
+
+
+def verify_webhook_signature(body: bytes, signature: Optional[str], secret: str = GITHUB_WEBHOOK_SECRET) -> bool:
+    """Check the X-Hub-Signature-256 header of a webhook delivery; nothing passes without a secret."""
+    if not secret:
+        return False
+    if not signature or not signature.startswith("sha256="):
+        return False
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(f"sha256={expected}", signature)
+
+
+class GitHubSyncEngine:
+    """Incrementally syncs repo info, commits and forks for tracked repositories.
+
+    For each repo we persist the last-seen commit and fork together with the
+    ETag / Last-Modified validators of every GitHub resource, so a refresh only
+    asks for deltas (``since=`` for commits, conditional requests everywhere).
+    Unchanged resources come back as 304, which GitHub does not count against
+    the rate limit. Webhook deliveries update the snapshot without polling.
+
+    Each repo has its own lock, held while it syncs, so one slow repo does
+    not hold up reads of the others. Syncs work on a copy of the repo's
+    state, which replaces the stored entry (and is saved) under the
+    engine-wide lock once the HTTP calls are done.
+    """
+
+    def __init__(self, state_file: str = SYNC_STATE_FILE, session=None, interval: int = SYNC_INTERVAL):
+        self.state_file = state_file
+        self.session = session or requests.Session()
+        self.interval = interval
+        self.headers = {"Authorization": f"token {GITHUB_TOKEN}"} if GITHUB_TOKEN else {}
+        self._lock = threading.Lock()
+        self._repo_locks: Dict[str, threading.Lock] = {}
+        self.state = self._load_state()
+
+    def _load_state(self) -> Dict[str, Any]:
+        """Load persisted sync state, starting empty if there is none."""
+        try:
+            with open(self.state_file, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Error loading GitHub sync state from {self.state_file}: {e}")
+            return {}
+
+    def _save_state(self):
+        """Atomically write sync state to disk."""
+        try:
+            os.makedirs(os.path.dirname(self.state_file) or ".", exist_ok=True)
+            tmp_file = f"{self.state_file}.tmp"
+            with open(tmp_file, "w") as f:
+                json.dump(self.state, f)
+            os.replace(tmp_file, self.state_file)
+        except Exception as e:
+            print(f"Error saving GitHub sync state to {self.state_file}: {e}")
+
+    def _repo_lock(self, owner: str, repo: str) -> threading.Lock:
+        with self._lock:
+            return self._repo_locks.setdefault(f"{owner}/{repo}", threading.Lock())
+
+    def _repo_state(self, owner: str, repo: str) -> Dict[str, Any]:
+        """A working copy of a repo's state entry (a new one if there is none); callers hold the repo lock."""
+        with self._lock:
+            current = self.state.get(f"{owner}/{repo}")
+            if current is not None:
+                return copy.deepcopy(current)
+        return {
+            "repo_info": None,
+            "recent_commits": [],
+            "recent_forks": [],
+            "last_commit_sha": "",
+            "last_commit_date": "",
+            "last_fork_created_at": "",
+            "validators": {},
+            "synced_at": 0,
+            "stale": True
+        }
+
+    def _commit(self, owner: str, repo: str, repo_state: Dict[str, Any]):
+        """Store a repo's updated state and persist it."""
+        with self._lock:
+            self.state[f"{owner}/{repo}"] = repo_state
+            self._save_state()
+
+    def _conditional_get(self, repo_state: Dict[str, Any], resource: str, url: str):
+        """GET a resource, sending the validators from the previous response.
+
+        Returns the decoded JSON body, or None when GitHub answered 304.
+        """
+        validators = repo_state["validators"].get(resource, {})
+        request_headers = dict(self.headers)
+        if validators.get("etag"):
+            request_headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            request_headers["If-Modified-Since"] = validators["last_modified"]
+
+        response = self.session.get(url, headers=request_headers)
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+
+        repo_state["validators"][resource] = {
+            "etag": response.headers.get("ETag", ""),
+            "last_modified": response.headers.get("Last-Modified", "")
+        }
+        return response.json()
+
+    def _sync_repo_info(self, owner: str, repo: str, repo_state: Dict[str, Any]):
+        data = self._conditional_get(repo_state, "repo", f"{API_URL}/repos/{owner}/{repo}")
+        if data is not None:
+            repo_state["repo_info"] = _format_repo_info(owner, repo, data)
+
+    def _sync_commits(self, owner: str, repo: str, repo_state: Dict[str, Any]):
+        url = f"{API_URL}/repos/{owner}/{repo}/commits?per_page={SNAPSHOT_SIZE}"
+        if repo_state["last_commit_date"]:
+            url += f"&since={repo_state['last_commit_date']}"
+
+        data = self._conditional_get(repo_state, "commits", url)
+        if not data:
+            return
+
+        new_commits = [_format_commit(commit) for commit in data]
+        repo_state["recent_commits"] = _merge(new_commits, repo_state["recent_commits"], "sha")
+        repo_state["last_commit_sha"] = data[0].get("sha", "")
+        repo_state["last_commit_date"] = new_commits[0]["date"] or repo_state["last_commit_date"]
+
+    def _sync_forks(self, owner: str, repo: str, repo_state: Dict[str, Any]):
+        # The forks endpoint has no since= filter, so rely on the conditional
+        # request and keep only forks newer than the last one we saw
+        url = f"{API_URL}/repos/{owner}/{repo}/forks?per_page={SNAPSHOT_SIZE}&sort=newest"
+        data = self._conditional_get(repo_state, "forks", url)
+        if not data:
+            return
+
+        last_seen = repo_state["last_fork_created_at"]
+        new_forks = [_format_fork(fork) for fork in data if fork.get("created_at", "") > last_seen]
+        if new_forks:
+            repo_state["recent_forks"] = _merge(new_forks, repo_state["recent_forks"], "full_name")
+            repo_state["last_fork_created_at"] = new_forks[0]["created_at"]
+
+    def sync(self, owner: str, repo: str, force: bool = False) -> Dict[str, Any]:
+        """Refresh a repo's snapshot if it is stale and return it."""
+        with self._repo_lock(owner, repo):
+            with self._lock:
+                current = self.state.get(f"{owner}/{repo}")
+                fresh = current is not None and time.time() - current["synced_at"] < self.interval
+                if fresh and not current["stale"] and not force:
+                    return self._snapshot(current)
+
+            repo_state = self._repo_state(owner, repo)
+            for step in (self._sync_repo_info, self._sync_commits, self._sync_forks):
+                try:
+                    step(owner, repo, repo_state)
+                except Exception as e:
+                    print(f"Error syncing {owner}/{repo} ({step.__name__}): {str(e)}")
+
+            repo_state["synced_at"] = time.time()
+            repo_state["stale"] = False
+            self._commit(owner, repo, repo_state)
+            return self._snapshot(repo_state)
+
+    def _snapshot(self, repo_state: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "repo_info": repo_state["repo_info"],
+            "recent_commits": list(repo_state["recent_commits"]),
+            "recent_forks": list(repo_state["recent_forks"])
+        }
+
+    def invalidate(self, owner: str, repo: str):
+        """Mark a repo's snapshot stale so the next read syncs it."""
+        with self._repo_lock(owner, repo):
+            repo_state = self._repo_state(owner, repo)
+            repo_state["stale"] = True
+            self._commit(owner, repo, repo_state)
+
+    def apply_webhook(self, event: str, payload: Dict[str, Any]) -> bool:
+        """Update a snapshot from a GitHub webhook delivery.
+
+        Pushes to the default branch and fork events carry enough data to
+        update the snapshot in place; pushes to other branches leave it
+        alone, and anything else just invalidates it. Returns False if the
+        payload does not reference a repository.
+        """
+        repository = payload.get("repository") or {}
+        owner = (repository.get("owner") or {}).get("login") or (repository.get("owner") or {}).get("name")
+        repo = repository.get("name")
+        if not owner or not repo:
+            return False
+
+        with self._repo_lock(owner, repo):
+            repo_state = self._repo_state(owner, repo)
+
+            default_ref = f"refs/heads/{repository.get('default_branch', '')}"
+            if event == "push" and payload.get("ref") != default_ref:
+                # Feature-branch and fork pushes are not the project's activity
+                repo_state["validators"].pop("commits", None)
+            elif event == "push" and payload.get("commits"):
+                new_commits = [
+                    {
+                        "sha": commit.get("id", "")[:7],
+                        "message": commit.get("message", "").split("\n")[0],
+                        "author": commit.get("author", {}).get("name", ""),
+                        "date": commit.get("timestamp", "")
+                    }
+                    for commit in reversed(payload["commits"])
+                ]
+                repo_state["recent_commits"] = _merge(new_commits, repo_state["recent_commits"], "sha")
+                repo_state["last_commit_sha"] = payload["commits"][-1].get("id", "")
+                repo_state["last_commit_date"] = new_commits[0]["date"] or repo_state["last_commit_date"]
+                # Commit list validators no longer describe what we hold
+                repo_state["validators"].pop("commits", None)
+            elif event == "fork" and payload.get("forkee"):
+                fork = _format_fork(payload["forkee"])
+                repo_state["recent_forks"] = _merge([fork], repo_state["recent_forks"], "full_name")
+                repo_state["last_fork_created_at"] = max(fork["created_at"], repo_state["last_fork_created_at"])
+                if repo_state["repo_info"]:
+                    repo_state["repo_info"]["forks"] += 1
+            else:
+                repo_state["stale"] = True
+
+            self._commit(owner, repo, repo_state)
+        return True
+
+
+# Shared engine used by the API and agents
+sync_engine = GitHubSyncEngine()
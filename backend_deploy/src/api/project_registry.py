@@ -0,0 +1,185 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+from typing import List, Dict, Any, Optional, Iterable
+
+from .github_sync import DATA_DIR
+
+# SQLite database backing the registry
+REGISTRY_DB_FILE = os.getenv("PROJECT_REGISTRY_DB", os.path.join(DATA_DIR, "projects.db"))
+
+# Optional JSON file of projects, re-imported whenever it changes on disk
+PROJECTS_FILE = os.getenv("PROJECT_REGISTRY_FILE", os.path.join(DATA_DIR, "projects.json"))
+
+# Seconds between checks of the projects file for changes
+RELOAD_INTERVAL = int(os.getenv("PROJECT_REGISTRY_RELOAD_INTERVAL", "10"))
+
+# Projects every deployment starts with
+DEFAULT_PROJECTS = [
+    {"owner": "Mazzz-zzz", "repo": "voca.fi", "name": "VocaFI", "agent": "vocafi"},
+    {"owner": "Royleong31", "repo": "Clarity", "name": "Clarity", "agent": "clarity"},
+    {"owner": "azf20", "repo": "hello-world-computer", "name": "Hello World Computer", "agent": "hwc"},
+    {"owner": "thisyearnofear", "repo": "mammothon-swarm", "name": "Mammothon", "agent": "mammothon"},
+]
+
+
+def _key(owner: str, repo: str) -> tuple:
+    """GitHub owner and repo names are case-insensitive."""
+    return (owner.lower(), repo.lower())
+
+
+class ProjectRegistry:
+    """Registry of tracked GitHub projects.
+
+    Projects are persisted in SQLite with a unique (owner, repo) index and
+    mirrored in memory as a dict, so lookups are O(1) however many projects
+    are registered. New projects can be added at runtime through
+    ``register`` or by editing the projects file; no redeploy is needed.
+    """
+
+    def __init__(self, db_file: str = REGISTRY_DB_FILE, projects_file: Optional[str] = PROJECTS_FILE,
+                 defaults: Iterable[Dict[str, Any]] = DEFAULT_PROJECTS, reload_interval: int = RELOAD_INTERVAL):
+        self.db_file = db_file
+        self.projects_file = projects_file
+        self.reload_interval = reload_interval
+        self._lock = threading.RLock()
+        self._projects: Dict[tuple, Dict[str, Any]] = {}
+        self._by_agent: Dict[str, Dict[str, Any]] = {}
+        self._ordered: Optional[List[Dict[str, Any]]] = None
+        self._file_mtime = None
+        self._checked_at = 0.0
+
+        if db_file != ":memory:":
+            os.makedirs(os.path.dirname(db_file) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(db_file, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS projects (
+                owner TEXT NOT NULL COLLATE NOCASE,
+                repo TEXT NOT NULL COLLATE NOCASE,
+                name TEXT NOT NULL,
+                agent TEXT,
+                added_at INTEGER NOT NULL
+            );
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_projects_owner_repo ON projects (owner, repo);
+            CREATE INDEX IF NOT EXISTS idx_projects_agent ON projects (agent);
+        """)
+        self._conn.commit()
+
+        self._load()
+        if not self._projects:
+            self.register_many(defaults)
+        self.reload_if_changed(force=True)
+
+    def _load(self):
+        """Mirror the database into memory."""
+        rows = self._conn.execute("SELECT owner, repo, name, agent FROM projects ORDER BY rowid").fetchall()
+        with self._lock:
+            self._projects = {}
+            self._by_agent = {}
+            for owner, repo, name, agent in rows:
+                self._index(self._project(owner, repo, name, agent))
+            self._ordered = None
+
+    def _project(self, owner: str, repo: str, name: str, agent: Optional[str]) -> Dict[str, Any]:
+        project = {"owner": owner, "repo": repo, "name": name}
+        if agent:
+            project["agent"] = agent
+        return project
+
+    def _index(self, project: Dict[str, Any]):
+        self._projects[_key(project["owner"], project["repo"])] = project
+        if project.get("agent"):
+            self._by_agent[project["agent"]] = project
+
+    def register_many(self, projects: Iterable[Dict[str, Any]]) -> int:
+        """Add or update projects in one transaction. Returns how many were written."""
+        now = int(time.time())
+        rows = [
+            (p["owner"], p["repo"], p.get("name") or p["repo"], p.get("agent"), now)
+            for p in projects
+            if p.get("owner") and p.get("repo")
+        ]
+        with self._lock:
+            self._conn.executemany("""
+                INSERT INTO projects (owner, repo, name, agent, added_at) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (owner, repo) DO UPDATE SET name = excluded.name, agent = excluded.agent
+            """, rows)
+            self._conn.commit()
+            for owner, repo, name, agent, _ in rows:
+                existing = self._projects.get(_key(owner, repo))
+                if existing and existing.get("agent") and existing["agent"] != agent:
+                    self._by_agent.pop(existing["agent"], None)
+                self._index(self._project(owner, repo, name, agent))
+            self._ordered = None
+        return len(rows)
+
+    def register(self, owner: str, repo: str, name: Optional[str] = None, agent: Optional[str] = None) -> Dict[str, Any]:
+        """Add or update a single project."""
+        self.register_many([{"owner": owner, "repo": repo, "name": name, "agent": agent}])
+        return self.get(owner, repo)
+
+    def remove(self, owner: str, repo: str) -> bool:
+        """Stop tracking a project."""
+        with self._lock:
+            project = self._projects.pop(_key(owner, repo), None)
+            if not project:
+                return False
+            self._conn.execute("DELETE FROM projects WHERE owner = ? AND repo = ?", (owner, repo))
+            self._conn.commit()
+            if project.get("agent"):
+                self._by_agent.pop(project["agent"], None)
+            self._ordered = None
+            return True
+
+    def reload_if_changed(self, force: bool = False):
+        """Import the projects file if it changed since the last check."""
+        if not self.projects_file:
+            return
+        now = time.time()
+        if not force and now - self._checked_at < self.reload_interval:
+            return
+        self._checked_at = now
+
+        try:
+            mtime = os.path.getmtime(self.projects_file)
+        except OSError:
+            return
+        if mtime == self._file_mtime:
+            return
+
+        try:
+            with open(self.projects_file, "r") as f:
+                projects = json.load(f)
+            count = self.register_many(projects)
+            self._file_mtime = mtime
+            print(f"Loaded {count} projects from {self.projects_file}")
+        except Exception as e:
+            print(f"Error loading projects from {self.projects_file}: {e}")
+
+    def get(self, owner: str, repo: str) -> Optional[Dict[str, Any]]:
+        """Look up a tracked project by owner and repo."""
+        self.reload_if_changed()
+        return self._projects.get(_key(owner, repo))
+
+    def get_by_agent(self, agent: str) -> Optional[Dict[str, Any]]:
+        """Look up the project represented by an agent type."""
+        self.reload_if_changed()
+        return self._by_agent.get(agent)
+
+    def all(self, offset: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """List tracked projects in registration order."""
+        self.reload_if_changed()
+        with self._lock:
+            if self._ordered is None:
+                self._ordered = list(self._projects.values())
+            ordered = self._ordered
+        return ordered[offset:offset + limit if limit is not None else None]
+
+    def __len__(self) -> int:
+        return len(self._projects)
+
+
+# Shared registry used by the API and agents
+project_registry = ProjectRegistry()
@@ -0,0 +1,46 @@
+import json
+from typing import Any, Dict, Optional
+
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # standard library json
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Encode what orjson and json don't handle natively."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Compact UTF-8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson; the app's default response class.
+
+    Endpoints whose payload is already plain JSON data (dicts, lists,
+    strings and numbers) can return one directly to skip FastAPI's
+    jsonable_encoder and response_model passes too.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class StaticJSON:
+    """A payload serialized once, for endpoints whose data only changes on restart."""
+
+    def __init__(self, content: Any):
+        self.body = dumps(content)
+
+    def response(self, headers: Optional[Dict[str, str]] = None) -> Response:
+        return Response(self.body, media_type="application/json", headers=headers)
@@ -0,0 +1,71 @@
+import os
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel
+from typing import List, Optional
+
+from chain.indexer import staking_store
+from chain.multicall import staking_summary_reader
+
+# Create router
+router = APIRouter(tags=["staking"])
+
+# Run the chain indexer in the background of the API process
+CHAIN_INDEXER_ENABLED = os.getenv("CHAIN_INDEXER_ENABLED", "true").lower() == "true"
+
+# Response models (amounts are wei as decimal strings)
+class StakingProject(BaseModel):
+    id: str
+    name: str
+    total_staked: str
+    stakers_count: int
+    builder_nfts: List[int] = []
+
+class BuilderNFT(BaseModel):
+    token_id: int
+    github_username: str
+    repo_name: str
+    project_id: Optional[str] = None
+    owner: Optional[str] = None
+    total_staked: str
+    stakers_count: int
+
+class SummaryBuilderNFT(BaseModel):
+    token_id: int
+    github_username: str
+    repo_name: str
+    total_staked: str
+    stakers_count: int
+
+class SummaryProject(BaseModel):
+    id: str
+    name: str
+    total_staked: str
+    stakers_count: int
+    active: bool
+    builder_nfts: List[SummaryBuilderNFT] = []
+
+class StakingSummary(BaseModel):
+    projects: List[SummaryProject] = []
+    fetched_at: int
+
+@router.get("/staking/projects", response_model=List[StakingProject])
+async def list_staking_projects():
+    """Staking state of all projects, served from the local event index"""
+    return staking_store.get_projects()
+
+@router.get("/nfts/by-github/{github_username}", response_model=List[BuilderNFT])
+async def get_nfts_by_github(github_username: str):
+    """Builder NFTs minted for a GitHub username, served from the local event index"""
+    return staking_store.get_nfts_by_github(github_username)
+
+@router.get("/staking/summary", response_model=StakingSummary)
+def get_staking_summary():
+    """Live staking state of every project and builder NFT, read with batched view calls
+
+    A plain def so the blocking RPC round-trips run in the threadpool, not on the event loop.
+    """
+    try:
+        return staking_summary_reader.get_summary()
+    except Exception as e:
+        print(f"Error reading staking summary: {e}")
+        raise HTTPException(status_code=502, detail="Could not read staking state from the chain")
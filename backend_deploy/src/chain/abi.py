@@ -0,0 +1,172 @@
+from typing import List, Any, Tuple
+
+# Keccak-f[1600] round constants and rotation offsets
+_ROUND_CONSTANTS = [
+    0x0000000000000001, 0x0000000000008082, 0x800000000000808A, 0x8000000080008000,
+    0x000000000000808B, 0x0000000080000001, 0x8000000080008081, 0x8000000000008009,
+    0x000000000000008A, 0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+    0x000000008000808B, 0x800000000000008B, 0x8000000000008089, 0x8000000000008003,
+    0x8000000000008002, 0x8000000000000080, 0x000000000000800A, 0x800000008000000A,
+    0x8000000080008081, 0x8000000000008080, 0x0000000080000001, 0x8000000080008008,
+]
+_ROTATIONS = [
+    [0, 36, 3, 41, 18], [1, 44, 10, 45, 2], [62, 6, 43, 15, 61], [28, 55, 25, 21, 56], [27, 20, 39, 8, 14],
+]
+_MASK = (1 << 64) - 1
+
+
+def _rotl(value: int, shift: int) -> int:
+    return ((value << shift) | (value >> (64 - shift))) & _MASK if shift else value
+
+
+def _keccak_f(state: List[List[int]]):
+    for rc in _ROUND_CONSTANTS:
+        c = [state[x][0] ^ state[x][1] ^ state[x][2] ^ state[x][3] ^ state[x][4] for x in range(5)]
+        d = [c[(x - 1) % 5] ^ _rotl(c[(x + 1) % 5], 1) for x in range(5)]
+        state = [[state[x][y] ^ d[x] for y in range(5)] for x in range(5)]
+        b = [[0] * 5 for _ in range(5)]
+        for x in range(5):
+            for y in range(5):
+                b[y][(2 * x + 3 * y) % 5] = _rotl(state[x][y], _ROTATIONS[x][y])
+        state = [[b[x][y] ^ ((~b[(x + 1) % 5][y]) & b[(x + 2) % 5][y]) for y in range(5)] for x in range(5)]
+        state[0][0] ^= rc
+    return state
+
+
+def keccak256(data: bytes) -> bytes:
+    """Keccak-256 as used by Ethereum (not the NIST SHA3-256 padding)."""
+    rate = 136
+    padded = bytearray(data)
+    padded.append(0x01)
+    padded.extend(b"\x00" * (-len(padded) % rate))
+    padded[-1] |= 0x80
+
+    state = [[0] * 5 for _ in range(5)]
+    for offset in range(0, len(padded), rate):
+        block = padded[offset:offset + rate]
+        for i in range(rate // 8):
+            state[i % 5][i // 5] ^= int.from_bytes(block[i * 8:i * 8 + 8], "little")
+        state = _keccak_f(state)
+
+    return b"".join(state[i % 5][i // 5].to_bytes(8, "little") for i in range(4))
+
+
+def event_topic(signature: str) -> str:
+    """topic0 of an event, e.g. ``Staked(address,string,uint256)``."""
+    return "0x" + keccak256(signature.encode()).hex()
+
+
+def function_selector(signature: str) -> bytes:
+    """4-byte selector of a function, e.g. ``getProject(string)``."""
+    return keccak256(signature.encode())[:4]
+
+
+def split_types(types: str) -> List[str]:
+    """Split a comma-separated type list, respecting tuple parentheses."""
+    parts, depth, current = [], 0, ""
+    for char in types:
+        if char == "," and depth == 0:
+            parts.append(current)
+            current = ""
+            continue
+        depth += char == "("
+        depth -= char == ")"
+        current += char
+    if current:
+        parts.append(current)
+    return parts
+
+
+def _is_dynamic(abi_type: str) -> bool:
+    if abi_type in ("string", "bytes") or abi_type.endswith("[]"):
+        return True
+    if abi_type.startswith("("):
+        return any(_is_dynamic(t) for t in split_types(abi_type[1:-1]))
+    return False
+
+
+def _encode_single(abi_type: str, value: Any) -> bytes:
+    if abi_type.endswith("[]"):
+        return len(value).to_bytes(32, "big") + encode([abi_type[:-2]] * len(value), value)
+    if abi_type.startswith("("):
+        return encode(split_types(abi_type[1:-1]), value)
+    if abi_type in ("string", "bytes"):
+        data = value.encode() if isinstance(value, str) else bytes(value)
+        return len(data).to_bytes(32, "big") + data + b"\x00" * (-len(data) % 32)
+    if abi_type == "address":
+        return bytes.fromhex(value[2:] if value.startswith("0x") else value).rjust(32, b"\x00")
+    if abi_type == "bool":
+        return int(bool(value)).to_bytes(32, "big")
+    if abi_type == "bytes32":
+        return bytes(value).ljust(32, b"\x00")
+    if abi_type.startswith("uint"):
+        return int(value).to_bytes(32, "big")
+    if abi_type.startswith("int"):
+        return int(value).to_bytes(32, "big", signed=True)
+    raise ValueError(f"Unsupported ABI type: {abi_type}")
+
+
+def encode(types: List[str], values: List[Any]) -> bytes:
+    """ABI-encode values (head/tail layout)."""
+    heads, tails = [], []
+    head_size = 32 * len(types)
+    for abi_type, value in zip(types, values):
+        encoded = _encode_single(abi_type, value)
+        if _is_dynamic(abi_type):
+            heads.append((head_size + sum(len(t) for t in tails)).to_bytes(32, "big"))
+            tails.append(encoded)
+        else:
+            heads.append(encoded)
+    return b"".join(heads) + b"".join(tails)
+
+
+def _decode_single(abi_type: str, data: bytes, offset: int) -> Any:
+    if abi_type.endswith("[]"):
+        length = int.from_bytes(data[offset:offset + 32], "big")
+        return decode([abi_type[:-2]] * length, data[offset + 32:])
+    if abi_type.startswith("("):
+        return tuple(decode(split_types(abi_type[1:-1]), data[offset:]))
+    if abi_type in ("string", "bytes"):
+        length = int.from_bytes(data[offset:offset + 32], "big")
+        raw = data[offset + 32:offset + 32 + length]
+        return raw.decode("utf-8", errors="replace") if abi_type == "string" else raw
+    word = data[offset:offset + 32]
+    if abi_type == "address":
+        return "0x" + word[12:].hex()
+    if abi_type == "bool":
+        return word[-1] == 1
+    if abi_type == "bytes32":
+        return "0x" + word.hex()
+    if abi_type.startswith("uint"):
+        return int.from_bytes(word, "big")
+    if abi_type.startswith("int"):
+        return int.from_bytes(word, "big", signed=True)
+    raise ValueError(f"Unsupported ABI type: {abi_type}")
+
+
+def decode(types: List[str], data: bytes) -> List[Any]:
+    """ABI-decode values encoded with :func:`encode`."""
+    values = []
+    for i, abi_type in enumerate(types):
+        if _is_dynamic(abi_type):
+            offset = int.from_bytes(data[32 * i:32 * i + 32], "big")
+            values.append(_decode_single(abi_type, data, offset))
+        else:
+            values.append(_decode_single(abi_type, data, 32 * i))
+    return values
+
+
+def parse_signature(signature: str) -> Tuple[str, List[str]]:
+    """``getProject(string)`` -> ("getProject", ["string"])."""
+    name, _, args = signature.partition("(")
+    return name, split_types(args[:-1])
+
+
+def encode_call(signature: str, args: List[Any]) -> str:
+    """Calldata for a function call as a 0x-prefixed hex string."""
+    _, types = parse_signature(signature)
+    return "0x" + (function_selector(signature) + encode(types, args)).hex()
+
+
+def hex_to_bytes(value: str) -> bytes:
+    return bytes.fromhex(value[2:] if value.startswith("0x") else value)
@@ -0,0 +1,66 @@
+import os
+from typing import Dict, Any, Optional
+
+from chain.abi import event_topic, decode, hex_to_bytes
+
+# Deployed contract addresses (Zora Sepolia by default)
+BUILDER_NFT_ADDRESS = os.getenv("BUILDER_NFT_ADDRESS", "0xfbe99dcd3b2d93b1c8ffabc26427383daaba05d1").lower()
+PROJECT_STAKING_ADDRESS = os.getenv("PROJECT_STAKING_ADDRESS", "0x8B62D610c83C42Ea8A8fC10F80581d9B7701cd37").lower()
+
+# First block worth scanning for events (the earlier deploy block of the two contracts)
+DEPLOY_BLOCK = int(os.getenv("CONTRACTS_DEPLOY_BLOCK", "0"))
+
+# Events we follow: name -> list of (field, ABI type, indexed)
+EVENTS = {
+    "ProjectAdded": [("project_id", "string", False), ("name", "string", False)],
+    "Staked": [("staker", "address", False), ("project_id", "string", False), ("amount", "uint256", False)],
+    "Unstaked": [("staker", "address", False), ("project_id", "string", False), ("amount", "uint256", False)],
+    "BuilderNFTAdded": [("token_id", "uint256", False), ("github_username", "string", False),
+                        ("repo_name", "string", False), ("project_id", "string", False)],
+    "BuilderNFTStaked": [("staker", "address", False), ("token_id", "uint256", False),
+                         ("amount", "uint256", False), ("project_id", "string", False)],
+    "BuilderNFTUnstaked": [("staker", "address", False), ("token_id", "uint256", False),
+                           ("amount", "uint256", False), ("project_id", "string", False)],
+    "BuilderNFTMinted": [("token_id", "uint256", True), ("recipient", "address", True),
+                         ("github_username", "string", False), ("project_hash", "bytes32", True),
+                         ("repo_name", "string", False)],
+}
+
+# topic0 -> event name
+EVENT_TOPICS = {
+    event_topic(f"{name}({','.join(t for _, t, _ in fields)})"): name
+    for name, fields in EVENTS.items()
+}
+
+
+def decode_log(log: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Decode a raw eth_getLogs entry into {event, args, block_number, ...}.
+
+    Returns None for logs of events we do not follow.
+    """
+    topics = log.get("topics") or []
+    name = EVENT_TOPICS.get(topics[0]) if topics else None
+    if not name:
+        return None
+
+    fields = EVENTS[name]
+    data_values = decode([t for _, t, indexed in fields if not indexed], hex_to_bytes(log.get("data", "0x")))
+    indexed_values = iter(topics[1:])
+    data_iter = iter(data_values)
+
+    args = {}
+    for field, abi_type, indexed in fields:
+        if indexed:
+            args[field] = decode([abi_type], hex_to_bytes(next(indexed_values)))[0]
+        else:
+            args[field] = next(data_iter)
+
+    return {
+        "event": name,
+        "args": args,
+        "address": log.get("address", "").lower(),
+        "block_number": int(log["blockNumber"], 16),
+        "block_hash": log.get("blockHash", ""),
+        "transaction_hash": log.get("transactionHash", ""),
+        "log_index": int(log.get("logIndex", "0x0"), 16)
+    }
@@ -0,0 +1,265 @@
+import os
+import json
+import sqlite3
+import threading
+from typing import List, Dict, Any, Optional, Tuple
+
+from api.github_sync import DATA_DIR
+from chain.abi import keccak256
+from chain.rpc import JsonRpcClient
+from chain.scanner import BlockScanner, REORG_DEPTH
+from chain.contracts import BUILDER_NFT_ADDRESS, PROJECT_STAKING_ADDRESS, DEPLOY_BLOCK, EVENT_TOPICS, decode_log
+
+# SQLite database holding indexed contract events
+CHAIN_DB_FILE = os.getenv("CHAIN_INDEX_DB", os.path.join(DATA_DIR, "chain_events.db"))
+
+
+class StakingStore:
+    """Indexed event log for ProjectStaking/BuilderNFT plus the state it materializes.
+
+    Events are persisted in SQLite keyed by (block_number, log_index), which
+    makes re-applying a batch idempotent. On startup the log is replayed into
+    in-memory dicts, so API reads never touch the chain or the database.
+    Per-project stats are precomputed into ``snapshot`` whenever the state
+    changes, so agents can read them on every chat turn for a dict lookup.
+    """
+
+    def __init__(self, db_file: str = CHAIN_DB_FILE):
+        self.db_file = db_file
+        self._lock = threading.RLock()
+        if db_file != ":memory:":
+            os.makedirs(os.path.dirname(db_file) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(db_file, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS events (
+                block_number INTEGER NOT NULL,
+                log_index INTEGER NOT NULL,
+                block_hash TEXT,
+                transaction_hash TEXT,
+                event TEXT NOT NULL,
+                args TEXT NOT NULL,
+                PRIMARY KEY (block_number, log_index)
+            );
+            CREATE INDEX IF NOT EXISTS idx_events_event ON events (event);
+            CREATE TABLE IF NOT EXISTS checkpoint (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                block_number INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS blocks (
+                block_number INTEGER PRIMARY KEY,
+                block_hash TEXT NOT NULL
+            );
+        """)
+        self._conn.commit()
+        self._reset()
+        self.load()
+
+    def _reset(self):
+        self.projects: Dict[str, Dict[str, Any]] = {}
+        self.project_stakes: Dict[str, Dict[str, int]] = {}
+        self.builder_nfts: Dict[int, Dict[str, Any]] = {}
+        self.builder_stakes: Dict[int, Dict[str, int]] = {}
+        self.project_hashes: Dict[str, str] = {}
+        self.nfts_by_github: Dict[str, List[int]] = {}
+        self.snapshot: Dict[str, Dict[str, Any]] = {}
+        self.version = 0
+
+    @property
+    def checkpoint(self) -> Optional[int]:
+        """Last block whose events are fully indexed."""
+        row = self._conn.execute("SELECT block_number FROM checkpoint WHERE id = 1").fetchone()
+        return row[0] if row else None
+
+    def load(self):
+        """Rebuild in-memory state by replaying the persisted event log."""
+        with self._lock:
+            self._reset()
+            rows = self._conn.execute(
+                "SELECT event, args FROM events ORDER BY block_number, log_index"
+            ).fetchall()
+            for event, args in rows:
+                self._apply(event, json.loads(args))
+            self.version += 1
+            self._build_snapshot()
+
+    def recent_blocks(self) -> List[Tuple[int, str]]:
+        """Stored (block_number, block_hash) pairs, newest first, used to detect reorgs."""
+        return self._conn.execute("SELECT block_number, block_hash FROM blocks ORDER BY block_number DESC").fetchall()
+
+    def _set_checkpoint(self, checkpoint: int):
+        self._conn.execute(
+            "INSERT INTO checkpoint (id, block_number) VALUES (1, ?) "
+            "ON CONFLICT (id) DO UPDATE SET block_number = excluded.block_number",
+            (checkpoint,)
+        )
+
+    def add_events(self, events: List[Dict[str, Any]], checkpoint: int,
+                   block_hashes: Optional[Dict[int, str]] = None):
+        """Persist decoded events, block hashes and the new checkpoint in one transaction.
+
+        Only the hashes of the last REORG_DEPTH blocks are kept.
+        """
+        events = sorted(events, key=lambda e: (e["block_number"], e["log_index"]))
+        with self._lock:
+            applied = []
+            with self._conn:
+                for event in events:
+                    cursor = self._conn.execute(
+                        "INSERT OR IGNORE INTO events VALUES (?, ?, ?, ?, ?, ?)",
+                        (event["block_number"], event["log_index"], event["block_hash"],
+                         event["transaction_hash"], event["event"], json.dumps(event["args"]))
+                    )
+                    if cursor.rowcount:
+                        applied.append(event)
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO blocks VALUES (?, ?)",
+                    [(number, block_hash) for number, block_hash in (block_hashes or {}).items() if block_hash]
+                )
+                self._conn.execute("DELETE FROM blocks WHERE block_number <= ?", (checkpoint - REORG_DEPTH,))
+                self._set_checkpoint(checkpoint)
+            for event in applied:
+                self._apply(event["event"], event["args"])
+            if applied:
+                self.version += 1
+                self._build_snapshot()
+
+    def rollback(self, block_number: int) -> int:
+        """Drop everything indexed after `block_number` and replay the rest. Returns the events removed."""
+        with self._lock:
+            with self._conn:
+                removed = self._conn.execute("DELETE FROM events WHERE block_number > ?", (block_number,)).rowcount
+                self._conn.execute("DELETE FROM blocks WHERE block_number > ?", (block_number,))
+                self._set_checkpoint(block_number)
+            self.load()
+            return removed
+
+    def _apply(self, event: str, args: Dict[str, Any]):
+        """Fold one event into the materialized state."""
+        if event == "ProjectAdded":
+            project_id = args["project_id"]
+            self.projects[project_id] = {"id": project_id, "name": args["name"], "builder_nfts": []}
+            self.project_stakes.setdefault(project_id, {})
+            self.project_hashes["0x" + keccak256(project_id.encode()).hex()] = project_id
+        elif event in ("Staked", "Unstaked"):
+            stakes = self.project_stakes.setdefault(args["project_id"], {})
+            delta = args["amount"] if event == "Staked" else -args["amount"]
+            stakes[args["staker"]] = stakes.get(args["staker"], 0) + delta
+            if stakes[args["staker"]] <= 0:
+                del stakes[args["staker"]]
+        elif event == "BuilderNFTAdded":
+            token_id = args["token_id"]
+            nft = self.builder_nfts.setdefault(token_id, {"token_id": token_id})
+            nft.update({
+                "github_username": args["github_username"],
+                "repo_name": args["repo_name"],
+                "project_id": args["project_id"]
+            })
+            self.builder_stakes.setdefault(token_id, {})
+            project = self.projects.get(args["project_id"])
+            if project is not None and token_id not in project["builder_nfts"]:
+                project["builder_nfts"].append(token_id)
+        elif event in ("BuilderNFTStaked", "BuilderNFTUnstaked"):
+            stakes = self.builder_stakes.setdefault(args["token_id"], {})
+            delta = args["amount"] if event == "BuilderNFTStaked" else -args["amount"]
+            stakes[args["staker"]] = stakes.get(args["staker"], 0) + delta
+            if stakes[args["staker"]] <= 0:
+                del stakes[args["staker"]]
+        elif event == "BuilderNFTMinted":
+            token_id = args["token_id"]
+            nft = self.builder_nfts.setdefault(token_id, {"token_id": token_id})
+            nft.update({
+                "github_username": args["github_username"],
+                "repo_name": args["repo_name"],
+                "owner": args["recipient"],
+                "project_hash": args["project_hash"]
+            })
+            tokens = self.nfts_by_github.setdefault(args["github_username"].lower(), [])
+            if token_id not in tokens:
+                tokens.append(token_id)
+
+    def _nft_view(self, token_id: int) -> Dict[str, Any]:
+        nft = self.builder_nfts.get(token_id, {"token_id": token_id})
+        stakes = self.builder_stakes.get(token_id, {})
+        project_id = nft.get("project_id") or self.project_hashes.get(nft.get("project_hash", ""))
+        return {
+            "token_id": token_id,
+            "github_username": nft.get("github_username", ""),
+            "repo_name": nft.get("repo_name", ""),
+            "project_id": project_id,
+            "owner": nft.get("owner"),
+            "total_staked": str(sum(stakes.values())),
+            "stakers_count": len(stakes)
+        }
+
+    def _build_snapshot(self):
+        """Precompute per-project stats, keyed by lowercase project id and name.
+
+        The new dict replaces the old one in a single assignment, so readers
+        never see a half-built snapshot and need no lock.
+        """
+        snapshot = {}
+        for project in self.projects.values():
+            stakes = self.project_stakes.get(project["id"], {})
+            nfts = [self._nft_view(token_id) for token_id in project["builder_nfts"]]
+            nfts.sort(key=lambda nft: int(nft["total_staked"]), reverse=True)
+            stats = {
+                "id": project["id"],
+                "name": project["name"],
+                "total_staked": sum(stakes.values()),
+                "stakers_count": len(stakes),
+                "builder_nfts": nfts
+            }
+            snapshot[project["name"].lower()] = stats
+            snapshot[project["id"].lower()] = stats
+        self.snapshot = snapshot
+
+    def get_project_stats(self, *candidates: str) -> Optional[Dict[str, Any]]:
+        """Precomputed stats of the first project matching one of the candidate ids or names."""
+        snapshot = self.snapshot
+        for candidate in candidates:
+            if candidate and candidate.lower() in snapshot:
+                return snapshot[candidate.lower()]
+        return None
+
+    def get_projects(self) -> List[Dict[str, Any]]:
+        """Staking state of every project (amounts in wei, as strings)."""
+        with self._lock:
+            return [
+                {
+                    "id": project["id"],
+                    "name": project["name"],
+                    "total_staked": str(sum(self.project_stakes.get(project["id"], {}).values())),
+                    "stakers_count": len(self.project_stakes.get(project["id"], {})),
+                    "builder_nfts": list(project["builder_nfts"])
+                }
+                for project in self.projects.values()
+            ]
+
+    def get_nfts_by_github(self, github_username: str) -> List[Dict[str, Any]]:
+        """Builder NFTs minted for a GitHub username."""
+        with self._lock:
+            return [self._nft_view(token_id) for token_id in self.nfts_by_github.get(github_username.lower(), [])]
+
+
+class StakingIndexer(BlockScanner):
+    """Follows ProjectStaking and BuilderNFT events into a StakingStore.
+
+    Logs for both contracts are fetched with one eth_getLogs per block
+    window, starting after the store's checkpoint (or the deploy block).
+    See BlockScanner for windowing, parallel backfill and reorg handling.
+    """
+
+    name = "staking-indexer"
+
+    def __init__(self, store: StakingStore, rpc: Optional[JsonRpcClient] = None,
+                 addresses: Optional[List[str]] = None, start_block: int = DEPLOY_BLOCK, **kwargs):
+        super().__init__(
+            store, decode_log, rpc=rpc,
+            addresses=addresses or [PROJECT_STAKING_ADDRESS, BUILDER_NFT_ADDRESS],
+            topics=[list(EVENT_TOPICS)], start_block=start_block, **kwargs
+        )
+
+
+# Shared store and indexer used by the API
+staking_store = StakingStore()
+staking_indexer = StakingIndexer(staking_store)
@@ -0,0 +1,150 @@
+import os
+import time
+import threading
+from typing import List, Dict, Any, Optional, Tuple
+
+from chain.abi import encode_call, decode, hex_to_bytes
+from chain.rpc import JsonRpcClient, RpcError
+from chain.contracts import PROJECT_STAKING_ADDRESS
+
+# Multicall3 is deployed at the same address on most EVM chains
+MULTICALL3_ADDRESS = os.getenv("MULTICALL3_ADDRESS", "0xcA11bde05977b3631167028862bE2a173976CA11")
+
+# How view calls are batched: "batch" (JSON-RPC batch) or "multicall" (Multicall3.aggregate3)
+MULTICALL_MODE = os.getenv("MULTICALL_MODE", "batch")
+
+# Seconds a staking summary is served from cache
+SUMMARY_CACHE_TTL = float(os.getenv("STAKING_SUMMARY_TTL", "10"))
+
+# Return types of the ProjectStaking view functions we read
+VIEW_RETURNS = {
+    "getAllProjectIds()": ["string[]"],
+    "getAllBuilderNFTIds()": ["uint256[]"],
+    "getProject(string)": ["string", "string", "uint256", "uint256", "bool"],
+    "getBuilderNFT(uint256)": ["uint256", "string", "string", "uint256", "uint256"],
+    "getBuilderNFTsByProject(string)": ["uint256[]"],
+}
+
+# A view call: (contract address, function signature, args)
+Call = Tuple[str, str, List[Any]]
+
+
+class MulticallReader:
+    """Runs many contract view calls in as few RPC round-trips as possible.
+
+    In "batch" mode every call is an eth_call inside one JSON-RPC batch; in
+    "multicall" mode they are packed into a single Multicall3.aggregate3
+    eth_call. Either way a failed call yields None instead of raising.
+    """
+
+    def __init__(self, rpc: Optional[JsonRpcClient] = None, mode: str = MULTICALL_MODE,
+                 multicall_address: str = MULTICALL3_ADDRESS):
+        if mode not in ("batch", "multicall"):
+            raise ValueError("mode must be 'batch' or 'multicall'")
+        self.rpc = rpc or JsonRpcClient()
+        self.mode = mode
+        self.multicall_address = multicall_address
+
+    def _decode(self, signature: str, data: Any) -> Optional[List[Any]]:
+        if isinstance(data, (RpcError, type(None))):
+            return None
+        raw = hex_to_bytes(data) if isinstance(data, str) else data
+        if not raw:
+            return None
+        return decode(VIEW_RETURNS[signature], raw)
+
+    def call_many(self, calls: List[Call], block: str = "latest") -> List[Optional[List[Any]]]:
+        """Execute view calls and return their decoded results in order."""
+        if not calls:
+            return []
+
+        if self.mode == "multicall":
+            aggregate = [(address, True, hex_to_bytes(encode_call(signature, args))) for address, signature, args in calls]
+            raw = self.rpc.eth_call(self.multicall_address, encode_call("aggregate3((address,bool,bytes)[])", [aggregate]), block)
+            results = decode(["(bool,bytes)[]"], hex_to_bytes(raw))[0]
+            return [
+                self._decode(signature, return_data) if success else None
+                for (success, return_data), (_, signature, _) in zip(results, calls)
+            ]
+
+        raw_results = self.rpc.batch([
+            ("eth_call", [{"to": address, "data": encode_call(signature, args)}, block])
+            for address, signature, args in calls
+        ])
+        return [self._decode(signature, raw) for raw, (_, signature, _) in zip(raw_results, calls)]
+
+
+class StakingSummaryReader:
+    """Reads the full ProjectStaking state in two round-trips, with a short TTL cache.
+
+    Round-trip 1 fetches all project IDs; round-trip 2 fetches every
+    project, its builder NFT IDs and every builder NFT at once, instead of
+    one RPC request per project and per NFT.
+    """
+
+    def __init__(self, reader: Optional[MulticallReader] = None, staking_address: str = PROJECT_STAKING_ADDRESS,
+                 ttl: float = SUMMARY_CACHE_TTL):
+        self.reader = reader or MulticallReader()
+        self.staking_address = staking_address
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._cached: Optional[Dict[str, Any]] = None
+        self._cached_at = 0.0
+
+    def _fetch(self) -> Dict[str, Any]:
+        address = self.staking_address
+        ids_result, nft_ids_result = self.reader.call_many([
+            (address, "getAllProjectIds()", []),
+            (address, "getAllBuilderNFTIds()", []),
+        ])
+        project_ids = ids_result[0] if ids_result else []
+        nft_ids = nft_ids_result[0] if nft_ids_result else []
+
+        calls = [(address, "getProject(string)", [pid]) for pid in project_ids]
+        calls += [(address, "getBuilderNFTsByProject(string)", [pid]) for pid in project_ids]
+        calls += [(address, "getBuilderNFT(uint256)", [token_id]) for token_id in nft_ids]
+        results = self.reader.call_many(calls)
+
+        count = len(project_ids)
+        project_results, project_nfts, nft_results = results[:count], results[count:2 * count], results[2 * count:]
+
+        builder_nfts = {}
+        for token_id, nft in zip(nft_ids, nft_results):
+            if nft:
+                _, github_username, repo_name, total_staked, stakers_count = nft
+                builder_nfts[token_id] = {
+                    "token_id": token_id,
+                    "github_username": github_username,
+                    "repo_name": repo_name,
+                    "total_staked": str(total_staked),
+                    "stakers_count": stakers_count
+                }
+
+        projects = []
+        for project_id, project, token_ids in zip(project_ids, project_results, project_nfts):
+            if not project:
+                continue
+            _, name, total_staked, stakers_count, active = project
+            projects.append({
+                "id": project_id,
+                "name": name,
+                "total_staked": str(total_staked),
+                "stakers_count": stakers_count,
+                "active": active,
+                "builder_nfts": [builder_nfts[t] for t in (token_ids[0] if token_ids else []) if t in builder_nfts]
+            })
+
+        return {"projects": projects, "fetched_at": int(time.time())}
+
+    def get_summary(self, force: bool = False) -> Dict[str, Any]:
+        """Staking summary, refreshed at most once per TTL (concurrent callers share a refresh)."""
+        with self._lock:
+            if force or self._cached is None or time.time() - self._cached_at >= self.ttl:
+                self._cached = self._fetch()
+                self._cached_at = time.time()
+            return self._cached
+
+
+# Shared reader used by the API
+staking_summary_reader = StakingSummaryReader()
+
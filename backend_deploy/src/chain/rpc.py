@@ -0,0 +1,91 @@
+import os
+import itertools
+import requests
+from typing import List, Dict, Any, Optional, Tuple, Union
+
+# JSON-RPC endpoint of the chain the contracts are deployed on
+RPC_URL = os.getenv("ZORA_RPC_URL", "https://sepolia.rpc.zora.energy")
+
+# Seconds to wait for a JSON-RPC response
+RPC_TIMEOUT = float(os.getenv("RPC_TIMEOUT", "15"))
+
+# Most requests sent in one JSON-RPC batch (public nodes cap batch sizes)
+RPC_MAX_BATCH_SIZE = int(os.getenv("RPC_MAX_BATCH_SIZE", "1000"))
+
+
+class RpcError(Exception):
+    """Error returned by a JSON-RPC node."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(f"RPC error {code}: {message}")
+        self.code = code
+        self.message = message
+
+
+class JsonRpcClient:
+    """Small Ethereum JSON-RPC client over HTTP."""
+
+    def __init__(self, url: str = RPC_URL, session=None, timeout: float = RPC_TIMEOUT,
+                 max_batch_size: int = RPC_MAX_BATCH_SIZE):
+        self.url = url
+        self.session = session or requests.Session()
+        self.timeout = timeout
+        self.max_batch_size = max_batch_size
+        self._ids = itertools.count(1)
+        self.request_count = 0
+
+    def call(self, method: str, params: Optional[List[Any]] = None) -> Any:
+        """Send a single JSON-RPC request and return its result."""
+        payload = {"jsonrpc": "2.0", "id": next(self._ids), "method": method, "params": params or []}
+        self.request_count += 1
+        response = self.session.post(self.url, json=payload, timeout=self.timeout)
+        response.raise_for_status()
+        data = response.json()
+        if data.get("error"):
+            raise RpcError(data["error"].get("code", 0), data["error"].get("message", ""))
+        return data.get("result")
+
+    def batch(self, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+        """Send many requests as JSON-RPC batches (one HTTP round-trip per batch).
+
+        Results come back in call order; a failed call yields an RpcError
+        instance in its slot instead of raising, so one revert does not sink
+        the whole batch.
+        """
+        results = []
+        for start in range(0, len(calls), self.max_batch_size):
+            chunk = calls[start:start + self.max_batch_size]
+            payload = [
+                {"jsonrpc": "2.0", "id": next(self._ids), "method": method, "params": params}
+                for method, params in chunk
+            ]
+            self.request_count += 1
+            response = self.session.post(self.url, json=payload, timeout=self.timeout)
+            response.raise_for_status()
+            data = response.json()
+            if isinstance(data, dict):
+                error = data.get("error") or {}
+                raise RpcError(error.get("code", 0), error.get("message", "Batch requests not supported"))
+
+            by_id = {item.get("id"): item for item in data}
+            for request in payload:
+                item = by_id.get(request["id"], {"error": {"code": 0, "message": "Missing response"}})
+                if item.get("error"):
+                    results.append(RpcError(item["error"].get("code", 0), item["error"].get("message", "")))
+                else:
+                    results.append(item.get("result"))
+        return results
+
+    def block_number(self) -> int:
+        return int(self.call("eth_blockNumber"), 16)
+
+    def get_logs(self, from_block: int, to_block: int, address: Union[str, List[str]],
+                 topics: Optional[List[Any]] = None) -> List[Dict[str, Any]]:
+        """Logs emitted by `address` in [from_block, to_block]."""
+        log_filter = {"fromBlock": hex(from_block), "toBlock": hex(to_block), "address": address}
+        if topics:
+            log_filter["topics"] = topics
+        return self.call("eth_getLogs", [log_filter])
+
+    def eth_call(self, to: str, data: str, block: str = "latest") -> str:
+        return self.call("eth_call", [{"to": to, "data": data}, block])
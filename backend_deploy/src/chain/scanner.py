@@ -0,0 +1,212 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Callable, Tuple
+
+from chain.rpc import JsonRpcClient, RpcError
+
+# Blocks requested per eth_getLogs call to start with; the window adapts from there
+LOG_BATCH_SIZE = int(os.getenv("CHAIN_LOG_BATCH_SIZE", "2000"))
+
+# Largest window the scanner will grow to
+LOG_MAX_BATCH_SIZE = int(os.getenv("CHAIN_LOG_MAX_BATCH_SIZE", "50000"))
+
+# Logs per eth_getLogs response the window is sized towards
+LOG_TARGET_RESULTS = int(os.getenv("CHAIN_LOG_TARGET_RESULTS", "1000"))
+
+# Blocks behind the head we treat as final
+CONFIRMATIONS = int(os.getenv("CHAIN_CONFIRMATIONS", "2"))
+
+# Seconds between polls of the chain head
+POLL_INTERVAL = int(os.getenv("CHAIN_POLL_INTERVAL", "15"))
+
+# Deepest reorg we can roll back without replaying from further back
+REORG_DEPTH = int(os.getenv("CHAIN_REORG_DEPTH", "128"))
+
+# Parallel eth_getLogs workers used while backfilling
+BACKFILL_WORKERS = int(os.getenv("CHAIN_BACKFILL_WORKERS", "4"))
+
+# Blocks per backfill segment handed to one worker
+BACKFILL_SEGMENT_SIZE = int(os.getenv("CHAIN_BACKFILL_SEGMENT_SIZE", "20000"))
+
+# Error messages providers use when a getLogs range or result set is too large
+RANGE_ERROR_MARKERS = ("more than", "too many", "too large", "too wide", "range", "limit", "exceed", "size")
+
+
+def _is_range_error(error: RpcError) -> bool:
+    message = error.message.lower()
+    return any(marker in message for marker in RANGE_ERROR_MARKERS)
+
+
+class BlockScanner:
+    """Checkpointed, reorg-safe eth_getLogs scanner.
+
+    The scanner fetches logs from ``start_block`` (or after the store's
+    checkpoint) up to the confirmed head and hands decoded events to the
+    store with the new checkpoint and the hashes of the blocks it saw.
+
+    - The getLogs window halves when the provider refuses a range or caps
+      its results, and is resized towards ``LOG_TARGET_RESULTS`` logs per
+      response otherwise, so sparse ranges are crossed in few requests.
+    - When far behind, the remaining range is split into segments fetched
+      by parallel workers and committed in order, so the checkpoint only
+      ever advances over contiguous, fully indexed blocks.
+    - Before scanning, the checkpoint block's hash is compared with the
+      chain. On a mismatch the scanner walks back through the stored
+      hashes to the newest common block and rolls the store back to it.
+
+    The store needs ``checkpoint``, ``add_events(events, checkpoint,
+    block_hashes)``, ``recent_blocks()`` and ``rollback(block_number)``;
+    ``decode`` turns a raw log into an event dict with ``block_number``,
+    ``log_index`` and ``block_hash``, or None to skip it.
+    """
+
+    name = "block-scanner"
+
+    def __init__(self, store, decode: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+                 rpc: Optional[JsonRpcClient] = None, addresses: Optional[List[str]] = None,
+                 topics: Optional[List[Any]] = None, start_block: int = 0,
+                 batch_size: int = LOG_BATCH_SIZE, max_batch_size: int = LOG_MAX_BATCH_SIZE,
+                 target_results: int = LOG_TARGET_RESULTS, confirmations: int = CONFIRMATIONS,
+                 reorg_depth: int = REORG_DEPTH, workers: int = BACKFILL_WORKERS,
+                 segment_size: int = BACKFILL_SEGMENT_SIZE):
+        self.store = store
+        self.decode = decode
+        self.rpc = rpc or JsonRpcClient()
+        self.addresses = addresses
+        self.topics = topics
+        self.start_block = start_block
+        self.window = batch_size
+        self.max_batch_size = max_batch_size
+        self.target_results = target_results
+        self.confirmations = confirmations
+        self.reorg_depth = reorg_depth
+        self.workers = workers
+        self.segment_size = segment_size
+        self._window_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _block_hash(self, number: int) -> Optional[str]:
+        block = self.rpc.call("eth_getBlockByNumber", [hex(number), False])
+        return block["hash"] if block else None
+
+    def _resize(self, window: int):
+        with self._window_lock:
+            self.window = max(1, min(window, self.max_batch_size))
+
+    def _fetch_window(self, start: int, end: int) -> Tuple[int, List[Dict[str, Any]]]:
+        """Fetch logs from `start` in one adaptive window no further than `end`.
+
+        Returns the last block covered and its decoded events.
+        """
+        while True:
+            window = self.window
+            to_block = min(start + window - 1, end)
+            try:
+                logs = self.rpc.get_logs(start, to_block, self.addresses, self.topics)
+            except RpcError as e:
+                if to_block == start or not _is_range_error(e):
+                    raise
+                self._resize((to_block - start + 1) // 2)
+                continue
+
+            # Only resize from windows that weren't cut short by `end`
+            if to_block - start + 1 == window:
+                self._resize(min(window * 2, window * self.target_results // max(len(logs), 1)))
+            return to_block, [event for event in map(self.decode, logs) if event]
+
+    def _fetch_range(self, start: int, end: int) -> List[Dict[str, Any]]:
+        events = []
+        while start <= end:
+            to_block, window_events = self._fetch_window(start, end)
+            events.extend(window_events)
+            start = to_block + 1
+        return events
+
+    def _commit(self, events: List[Dict[str, Any]], checkpoint: int):
+        block_hashes = {event["block_number"]: event["block_hash"] for event in events if event.get("block_hash")}
+        block_hashes[checkpoint] = self._block_hash(checkpoint)
+        self.store.add_events(events, checkpoint, block_hashes)
+
+    def check_reorg(self) -> Optional[int]:
+        """Roll the store back if the chain no longer contains its checkpoint block.
+
+        Returns the block rolled back to, or None when no reorg was found.
+        """
+        checkpoint = self.store.checkpoint
+        recent = self.store.recent_blocks()
+        if checkpoint is None or not recent or recent[0][0] != checkpoint:
+            return None
+        if self._block_hash(checkpoint) == recent[0][1]:
+            return None
+
+        ancestor = max(checkpoint - self.reorg_depth, self.start_block - 1)
+        for number, block_hash in recent[1:]:
+            if self._block_hash(number) == block_hash:
+                ancestor = number
+                break
+
+        self.store.rollback(ancestor)
+        print(f"Chain reorg at block {checkpoint}: rolled back to block {ancestor}")
+        return ancestor
+
+    def sync(self) -> int:
+        """Index every new block up to the confirmed head. Returns the events added."""
+        self.check_reorg()
+        head = self.rpc.block_number() - self.confirmations
+        checkpoint = self.store.checkpoint
+        from_block = checkpoint + 1 if checkpoint is not None else self.start_block
+        if from_block > head:
+            return 0
+
+        if self.workers > 1 and head - from_block + 1 > self.segment_size:
+            return self._backfill(from_block, head)
+
+        added = 0
+        while from_block <= head:
+            to_block, events = self._fetch_window(from_block, head)
+            self._commit(events, to_block)
+            added += len(events)
+            from_block = to_block + 1
+        return added
+
+    def _backfill(self, from_block: int, head: int) -> int:
+        """Fetch segments in parallel and commit them in block order."""
+        segments = [
+            (start, min(start + self.segment_size - 1, head))
+            for start in range(from_block, head + 1, self.segment_size)
+        ]
+        added = 0
+        pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=self.name)
+        try:
+            futures = [pool.submit(self._fetch_range, start, end) for start, end in segments]
+            for (_, end), future in zip(segments, futures):
+                events = future.result()
+                self._commit(events, end)
+                added += len(events)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+        return added
+
+    def run_forever(self, interval: int = POLL_INTERVAL):
+        """Poll the chain until stopped, logging (not raising) RPC failures."""
+        while not self._stop.is_set():
+            try:
+                added = self.sync()
+                if added:
+                    print(f"Indexed {added} events up to block {self.store.checkpoint}")
+            except Exception as e:
+                print(f"Error scanning chain events: {e}")
+            self._stop.wait(interval)
+
+    def start(self, interval: int = POLL_INTERVAL):
+        """Run the scanner on a daemon thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run_forever, args=(interval,), daemon=True, name=self.name)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
@@ -0,0 +1,108 @@
+import os
+import asyncio
+from typing import Dict, Any, List, Optional, Iterable, AsyncIterator
+
+from pydantic import BaseModel
+
+from agents.base_agent import BaseAgent, ChatRequest, Message
+from agents.scheduler import RequestDropped
+from api.admission import AdmissionController
+from swarm.dispatch import ChatDispatcher, chat_dispatcher
+
+# Conversations a batch runs at once; batches may ask for fewer
+BATCH_MAX_CONCURRENCY = int(os.getenv("BATCH_MAX_CONCURRENCY", "4"))
+
+# Conversations accepted in one batch request
+BATCH_MAX_CONVERSATIONS = int(os.getenv("BATCH_MAX_CONVERSATIONS", "1000"))
+
+# Token required in X-Admin-Token to run batches over HTTP; batch chat is off without one
+BATCH_ADMIN_TOKEN = os.getenv("BATCH_ADMIN_TOKEN", os.getenv("REGISTRY_ADMIN_TOKEN", ""))
+
+# Seconds a batch conversation waits before asking again for a slot at a provider that is at its in-flight cap
+BATCH_PROVIDER_POLL = float(os.getenv("BATCH_PROVIDER_POLL", "0.1"))
+
+
+class BatchConversation(BaseModel):
+    id: Optional[str] = None  # defaults to the conversation's position in the batch
+    messages: List[Message]
+
+
+class BatchChatRequest(BaseModel):
+    conversations: List[BatchConversation]
+    concurrency: int = BATCH_MAX_CONCURRENCY
+    completed: List[str] = []  # ids answered by an earlier, interrupted run; skipped
+
+
+def batch_queue(agent: BaseAgent) -> str:
+    """Fair-scheduler queue for an agent's batch chats, next to (not in) its interactive queue."""
+    return f"{agent.type}/batch"
+
+
+async def run_batch(agent: BaseAgent, conversations: Iterable[BatchConversation], model_type: str = "gemini",
+                    concurrency: int = BATCH_MAX_CONCURRENCY, completed: Iterable[str] = (),
+                    dispatcher: ChatDispatcher = chat_dispatcher,
+                    admission: Optional[AdmissionController] = None,
+                    offload: bool = True) -> AsyncIterator[Dict[str, Any]]:
+    """Answer many conversations with an agent, yielding one result per conversation as it finishes.
+
+    At most `concurrency` conversations (capped at BATCH_MAX_CONCURRENCY)
+    run at once, through the dispatcher in the agent's batch queue, so a
+    batch gets a fair share of generation slots without starving the
+    agent's interactive chats. With `admission`, each conversation that
+    calls the LLM also holds one of the provider's in-flight slots, waiting
+    for one to free up, so batches count against the same caps as
+    interactive chats. Results are ``{"id", "response", "project_info",
+    "project_info_etag"}`` (the chat route's body) or ``{"id", "error",
+    "retryable"}``; a final
+    ``{"done": True, ...}`` summary closes the run. Conversations whose id
+    is in `completed` are skipped, so a partial run can be resumed.
+    Closing the iterator early cancels the conversations still running.
+    With `offload=False` no conversation is sent to SwarmNode.
+    """
+    done = set(completed)
+    pending = asyncio.Queue()
+    skipped = 0
+    for i, conversation in enumerate(conversations):
+        conversation_id = conversation.id if conversation.id is not None else str(i)
+        if conversation_id in done:
+            skipped += 1
+        else:
+            pending.put_nowait((conversation_id, conversation))
+
+    total = pending.qsize()
+    results = asyncio.Queue()
+
+    async def worker():
+        while not pending.empty():
+            conversation_id, conversation = pending.get_nowait()
+            request = ChatRequest(messages=conversation.messages)
+            reserved = False
+            try:
+                # Scripted greetings make no LLM call, so they need no provider slot
+                if admission is not None and agent.get_scripted_response(request) is None:
+                    while not admission.reserve(model_type):
+                        await asyncio.sleep(BATCH_PROVIDER_POLL)
+                    reserved = True
+                response = await dispatcher.dispatch(agent, request, model_type, queue=batch_queue(agent), offload=offload)
+                result = {"id": conversation_id, **response.model_dump()}
+            except RequestDropped as e:
+                result = {"id": conversation_id, "error": str(e), "retryable": True}
+            except Exception as e:
+                result = {"id": conversation_id, "error": f"{type(e).__name__}: {e}", "retryable": False}
+            finally:
+                if reserved:
+                    admission.release(model_type)
+            await results.put(result)
+
+    workers = [asyncio.create_task(worker()) for _ in range(max(1, min(concurrency, BATCH_MAX_CONCURRENCY, total)))]
+    failed = 0
+    try:
+        for _ in range(total):
+            result = await results.get()
+            failed += "error" in result
+            yield result
+        yield {"done": True, "total": total + skipped, "succeeded": total - failed, "failed": failed, "skipped": skipped}
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
@@ -0,0 +1,292 @@
+import os
+import json
+import random
+import asyncio
+import hashlib
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional
+
+import httpx
+
+# Base URL of the SwarmNode REST API
+SWARMNODE_API_URL = os.getenv("SWARMNODE_API_URL", "https://api.swarmnode.ai/v1")
+
+# Most executions submitted and not yet finished at once
+SWARMNODE_MAX_IN_FLIGHT = int(os.getenv("SWARMNODE_MAX_IN_FLIGHT", "32"))
+
+# Seconds before the first status poll; the delay doubles up to the max
+SWARMNODE_POLL_INITIAL = float(os.getenv("SWARMNODE_POLL_INITIAL", "0.5"))
+SWARMNODE_POLL_MAX = float(os.getenv("SWARMNODE_POLL_MAX", "8"))
+
+# Seconds to wait for an execution to finish
+SWARMNODE_JOB_TIMEOUT = float(os.getenv("SWARMNODE_JOB_TIMEOUT", "300"))
+
+# Successful results are cached by payload hash
+SWARMNODE_CACHE_TTL = float(os.getenv("SWARMNODE_CACHE_TTL", "300"))
+SWARMNODE_CACHE_SIZE = int(os.getenv("SWARMNODE_CACHE_SIZE", "1024"))
+
+# Attempts for requests failing with a transport error, 429 or 5xx (creates only retry when that cannot duplicate them)
+SWARMNODE_RETRIES = int(os.getenv("SWARMNODE_RETRIES", "3"))
+
+# Transport errors raised before a request reached SwarmNode, after which even a create can be sent again
+UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+# Execution statuses after which SwarmNode will not update an execution
+FINISHED_STATUSES = {"success", "failure", "termination"}
+
+
+class SwarmNodeError(Exception):
+    """A SwarmNode request or execution failed."""
+
+
+class UncertainCreateError(SwarmNodeError):
+    """A create request failed after it was sent, so SwarmNode may have applied it."""
+
+
+def payload_hash(agent_id: str, payload: Any) -> str:
+    """Stable hash of an agent execution request, used as its cache key."""
+    canonical = json.dumps([agent_id, payload], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class AsyncSwarmNodeClient:
+    """Asynchronous SwarmNode client for running many agent executions at once.
+
+    ``execute`` submits an agent executor job and waits for its execution
+    without blocking the event loop, unlike ``Agent.execute(wait=True)``.
+
+    - At most ``max_in_flight`` executions are submitted and unfinished at a
+      time; further calls wait for a slot.
+    - Completion is detected by polling with exponential backoff.
+    - Successful results are cached by payload hash for ``cache_ttl``
+      seconds, and identical requests already in flight share one job.
+
+    It also wraps the agent and store endpoints used by deployments.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, base_url: str = SWARMNODE_API_URL,
+                 max_in_flight: int = SWARMNODE_MAX_IN_FLIGHT, poll_initial: float = SWARMNODE_POLL_INITIAL,
+                 poll_max: float = SWARMNODE_POLL_MAX, timeout: float = SWARMNODE_JOB_TIMEOUT,
+                 cache_ttl: float = SWARMNODE_CACHE_TTL, cache_size: int = SWARMNODE_CACHE_SIZE,
+                 retries: int = SWARMNODE_RETRIES, http: Optional[httpx.AsyncClient] = None):
+        self.api_key = api_key if api_key is not None else os.getenv("SWARMNODE_API_KEY")
+        self.base_url = base_url.rstrip("/")
+        self.max_in_flight = max_in_flight
+        self.poll_initial = poll_initial
+        self.poll_max = poll_max
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.retries = retries
+        self._http = http
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._pending: Dict[str, asyncio.Future] = {}
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.stats = {"submitted": 0, "succeeded": 0, "failed": 0, "cache_hits": 0,
+                      "deduplicated": 0, "polls": 0}
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=30
+            )
+        return self._http
+
+    async def aclose(self):
+        if self._http is not None:
+            await self._http.aclose()
+
+    async def _backoff(self, attempt: int):
+        await asyncio.sleep(self.poll_initial * 2 ** (attempt - 1) * random.uniform(0.5, 1.0))
+
+    async def _request(self, method: str, path: str, **kwargs) -> Any:
+        """Send a request, retrying with backoff where that cannot apply it twice.
+
+        GET, PATCH and DELETE are retried after transport errors, 429 and 5xx.
+        A POST creates something, so it is only retried on 429 or when the
+        connection failed before anything was sent; other failures raise
+        UncertainCreateError and it is up to the caller to check whether
+        the create went through.
+        """
+        idempotent = method != "POST"
+        for attempt in range(1, self.retries + 1):
+            try:
+                response = await self.http.request(method, path, **kwargs)
+            except httpx.TransportError as e:
+                if not idempotent and not isinstance(e, UNSENT_ERRORS):
+                    raise UncertainCreateError(f"SwarmNode {method} {path} failed: {e}") from e
+                if attempt == self.retries:
+                    raise SwarmNodeError(f"SwarmNode {method} {path} failed: {e}") from e
+            else:
+                status = response.status_code
+                if status < 400:
+                    return response.json() if response.content else None
+                error = f"SwarmNode {method} {path} failed with {status}: {response.text}"
+                if status >= 500 and not idempotent:
+                    raise UncertainCreateError(error)
+                if status != 429 and status < 500 or attempt == self.retries:
+                    raise SwarmNodeError(error)
+            await self._backoff(attempt)
+
+    async def _create(self, path: str, fields: Dict[str, Any], find) -> Dict[str, Any]:
+        """POST a create, re-listing with `find` after an uncertain failure instead of creating a duplicate."""
+        for attempt in range(1, self.retries + 1):
+            try:
+                return await self._request("POST", path, json=fields)
+            except UncertainCreateError:
+                created = await find()
+                if created is not None:
+                    return created
+                if attempt == self.retries:
+                    raise
+            await self._backoff(attempt)
+
+    async def _list_pages(self, path: str, page_size: int = 100) -> List[Dict[str, Any]]:
+        results, page = [], 1
+        while True:
+            data = await self._request("GET", path, params={"page": page, "page_size": page_size})
+            results.extend(data.get("results") or [])
+            if not data.get("next"):
+                return results
+            page += 1
+
+    async def list_agents(self) -> List[Dict[str, Any]]:
+        """Every agent in the account, with its script and requirements."""
+        return await self._list_pages("/agents/")
+
+    async def create_agent(self, **fields) -> Dict[str, Any]:
+        async def find():
+            return next((agent for agent in await self.list_agents()
+                         if agent.get("name") == fields.get("name") and agent.get("script") == fields.get("script")), None)
+        return await self._create("/agents/create/", fields, find)
+
+    async def update_agent(self, agent_id: str, **fields) -> Dict[str, Any]:
+        """Update an agent's name, script, requirements, env_vars or python_version."""
+        return await self._request("PATCH", f"/agents/{agent_id}/update/", json=fields)
+
+    async def delete_agent(self, agent_id: str):
+        await self._request("DELETE", f"/agents/{agent_id}/delete/")
+
+    async def list_stores(self) -> List[Dict[str, Any]]:
+        return await self._list_pages("/stores/")
+
+    async def create_store(self, name: str) -> Dict[str, Any]:
+        async def find():
+            return next((store for store in await self.list_stores() if store.get("name") == name), None)
+        return await self._create("/stores/create/", {"name": name}, find)
+
+    async def submit(self, agent_id: str, payload: Any = None) -> Dict[str, Any]:
+        """Create an agent executor job; returns it without waiting for the execution.
+
+        Jobs cannot be looked up by payload, so a create that fails after it
+        was sent is not retried: UncertainCreateError is raised instead of
+        risking a second execution.
+        """
+        job = await self._request("POST", "/agent-executor-jobs/create/", json={"agent_id": agent_id, "payload": payload})
+        self.stats["submitted"] += 1
+        return job
+
+    async def get_execution(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """The execution started by a job, or None if it has not started yet."""
+        data = await self._request("GET", "/executions/", params={"agent_executor_job_id": job_id})
+        results = data.get("results") or []
+        return results[0] if results else None
+
+    async def wait_for_execution(self, job_id: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Wait for a job's execution to finish, polling with backoff."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (timeout or self.timeout)
+        delay = self.poll_initial
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise SwarmNodeError(f"SwarmNode job {job_id} did not finish in time")
+            await asyncio.sleep(min(delay, remaining))
+
+            self.stats["polls"] += 1
+            execution = await self.get_execution(job_id)
+            if execution and execution.get("status") in FINISHED_STATUSES:
+                return execution
+            delay = min(delay * 2, self.poll_max)
+
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        cached_at, execution = entry
+        if asyncio.get_running_loop().time() - cached_at > self.cache_ttl:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return execution
+
+    def _cache_put(self, key: str, execution: Dict[str, Any]):
+        self._cache[key] = (asyncio.get_running_loop().time(), execution)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    async def _run(self, agent_id: str, payload: Any, timeout: Optional[float]) -> Dict[str, Any]:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        async with self._semaphore:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            try:
+                job = await self.submit(agent_id, payload)
+                execution = await self.wait_for_execution(job["id"], timeout)
+            finally:
+                self.in_flight -= 1
+
+        if execution.get("status") != "success":
+            self.stats["failed"] += 1
+            raise SwarmNodeError(f"SwarmNode execution {execution.get('id')} finished with status {execution.get('status')}")
+        self.stats["succeeded"] += 1
+        return execution
+
+    async def execute(self, agent_id: str, payload: Any = None, use_cache: bool = True,
+                      timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Run an agent with a payload and return its finished execution.
+
+        Raises SwarmNodeError if the execution fails or times out.
+        """
+        if not use_cache:
+            return await self._run(agent_id, payload, timeout)
+
+        key = payload_hash(agent_id, payload)
+        cached = self._cache_get(key)
+        if cached is not None:
+            self.stats["cache_hits"] += 1
+            return cached
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            self.stats["deduplicated"] += 1
+            return await asyncio.shield(pending)
+
+        future = self._pending[key] = asyncio.get_running_loop().create_future()
+        try:
+            execution = await self._run(agent_id, payload, timeout)
+            self._cache_put(key, execution)
+            future.set_result(execution)
+            return execution
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Mark the exception retrieved in case no duplicate request awaits it
+                future.exception()
+            raise
+        finally:
+            self._pending.pop(key, None)
+
+    async def execute_many(self, agent_id: str, payloads: List[Any], **kwargs) -> List[Any]:
+        """Run many payloads concurrently; failed executions are returned as exceptions."""
+        return await asyncio.gather(*(self.execute(agent_id, payload, **kwargs) for payload in payloads),
+                                    return_exceptions=True)
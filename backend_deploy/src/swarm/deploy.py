@@ -0,0 +1,146 @@
+import os
+import json
+import asyncio
+import hashlib
+from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Optional, Iterable
+
+from swarm.client import AsyncSwarmNodeClient, SwarmNodeError
+
+# Store every deployed agent is attached to
+SWARMNODE_STORE_NAME = os.getenv("SWARMNODE_STORE_NAME", "Mammothon Agent Store")
+
+# Creates/updates/deletes sent to SwarmNode at once
+DEPLOY_CONCURRENCY = int(os.getenv("SWARMNODE_DEPLOY_CONCURRENCY", "8"))
+
+
+@dataclass
+class AgentSpec:
+    """Desired state of one SwarmNode agent."""
+    name: str
+    script: str
+    requirements: str = ""
+    env_vars: str = ""
+    python_version: str = "3.9"
+
+    @classmethod
+    def from_manifest(cls, entry: Dict[str, Any], base_dir: str = ".") -> "AgentSpec":
+        """Build a spec from a manifest entry, reading its files and env vars."""
+        with open(os.path.join(base_dir, entry["script"]), "r") as f:
+            script = f.read()
+        requirements = ""
+        if entry.get("requirements"):
+            with open(os.path.join(base_dir, entry["requirements"]), "r") as f:
+                requirements = f.read()
+        env_vars = "\n".join(f"{name}={os.environ.get(name, '')}" for name in entry.get("env", []))
+        return cls(entry["name"], script, requirements, env_vars, entry.get("python_version", "3.9"))
+
+    def fields(self) -> Dict[str, str]:
+        return asdict(self)
+
+
+def content_hash(agent: Dict[str, Any]) -> str:
+    """Hash of what an agent runs: script, requirements, env vars and Python version."""
+    content = [agent.get("script", ""), agent.get("requirements", ""), agent.get("env_vars", ""), agent.get("python_version", "")]
+    return hashlib.sha256(json.dumps(content).encode()).hexdigest()
+
+
+@dataclass
+class DeployAction:
+    """One step of a deploy plan: create, update, unchanged or delete."""
+    action: str
+    name: str
+    agent_id: Optional[str] = None
+    spec: Optional[AgentSpec] = None
+    error: Optional[str] = None
+
+
+def plan_deploy(specs: Iterable[AgentSpec], existing: List[Dict[str, Any]]) -> List[DeployAction]:
+    """Diff desired agents against existing ones by name and content hash.
+
+    The newest existing agent with a spec's name is updated in place (or
+    left alone if unchanged); older agents with the same name are orphans
+    from earlier deploys and planned for deletion. Agents whose names are
+    not in the specs are not touched.
+    """
+    by_name: Dict[str, List[Dict[str, Any]]] = {}
+    for agent in existing:
+        by_name.setdefault(agent.get("name"), []).append(agent)
+
+    actions = []
+    for spec in specs:
+        matches = sorted(by_name.get(spec.name, []), key=lambda a: a.get("modified") or a.get("created") or "", reverse=True)
+        if not matches:
+            actions.append(DeployAction("create", spec.name, spec=spec))
+            continue
+
+        current = matches[0]
+        action = "unchanged" if content_hash(current) == content_hash(spec.fields()) else "update"
+        actions.append(DeployAction(action, spec.name, current["id"], spec))
+        actions.extend(DeployAction("delete", spec.name, orphan["id"]) for orphan in matches[1:])
+    return actions
+
+
+class SwarmNodeDeployer:
+    """Idempotent, concurrent deployment of SwarmNode agents.
+
+    Existing agents are listed once and diffed against the desired specs by
+    content hash, so unchanged agents cost no requests and redeploys update
+    agents in place instead of creating new ones. Independent creates,
+    updates and deletes run concurrently; transient failures are retried by
+    the client, and a failure is recorded on its action instead of
+    aborting the rest of the deploy.
+    """
+
+    def __init__(self, client: Optional[AsyncSwarmNodeClient] = None, store_name: str = SWARMNODE_STORE_NAME,
+                 concurrency: int = DEPLOY_CONCURRENCY):
+        self.client = client or AsyncSwarmNodeClient()
+        self.store_name = store_name
+        self.concurrency = concurrency
+
+    async def plan(self, specs: List[AgentSpec]) -> List[DeployAction]:
+        return plan_deploy(specs, await self.client.list_agents())
+
+    async def ensure_store(self) -> str:
+        """ID of the deploy store, creating it only if no store has its name."""
+        stores = [store for store in await self.client.list_stores() if store.get("name") == self.store_name]
+        if stores:
+            return stores[0]["id"]
+        return (await self.client.create_store(self.store_name))["id"]
+
+    async def _apply(self, action: DeployAction, store_id: Optional[str]):
+        try:
+            if action.action == "create":
+                agent = await self.client.create_agent(**action.spec.fields(), store_id=store_id)
+                action.agent_id = agent["id"]
+            elif action.action == "update":
+                await self.client.update_agent(action.agent_id, **action.spec.fields())
+            elif action.action == "delete":
+                await self.client.delete_agent(action.agent_id)
+        except SwarmNodeError as e:
+            action.error = str(e)
+
+    async def deploy(self, specs: List[AgentSpec], prune: bool = False, dry_run: bool = False) -> List[DeployAction]:
+        """Bring SwarmNode in line with `specs` and return the actions taken.
+
+        Orphaned duplicates are only deleted when `prune` is set.
+        """
+        actions = await self.plan(specs)
+        if not prune:
+            actions = [action for action in actions if action.action != "delete"]
+        if dry_run:
+            return actions
+
+        pending = [action for action in actions if action.action != "unchanged"]
+        store_id = None
+        if any(action.action == "create" for action in pending):
+            store_id = await self.ensure_store()
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(action):
+            async with semaphore:
+                await self._apply(action, store_id)
+
+        await asyncio.gather(*(run(action) for action in pending))
+        return actions
@@ -0,0 +1,190 @@
+import os
+import time
+import asyncio
+import threading
+from typing import Dict, Any, Optional, Callable
+
+from agents.base_agent import BaseAgent, ChatRequest, ChatResponse
+from agents.scheduler import FairScheduler
+from swarm.client import AsyncSwarmNodeClient, SwarmNodeError
+
+# SwarmNode agent running this backend; offloading is off without it
+SWARMNODE_AGENT_ID = os.getenv("SWARMNODE_AGENT_ID")
+
+# Chat generations run at once in this process
+LOCAL_MAX_CONCURRENCY = int(os.getenv("LOCAL_MAX_CONCURRENCY", "8"))
+
+# Requests allowed to wait for a local slot before the rest are offloaded
+LOCAL_MAX_QUEUE_DEPTH = int(os.getenv("LOCAL_MAX_QUEUE_DEPTH", "16"))
+
+# Starting latency estimates in seconds, refined from observed requests
+LOCAL_EXPECTED_LATENCY = float(os.getenv("LOCAL_EXPECTED_LATENCY", "3"))
+SWARMNODE_EXPECTED_LATENCY = float(os.getenv("SWARMNODE_EXPECTED_LATENCY", "10"))
+
+# Weight of the newest sample in the latency moving averages
+LATENCY_SMOOTHING = 0.2
+
+
+class ChatDispatcher:
+    """Runs chat requests locally, offloading to SwarmNode when the process is saturated.
+
+    A request runs locally while a local slot is free. Once all slots are
+    busy it waits for one, unless the queue is already ``max_queue_depth``
+    deep or the expected local wait (queue depth times the observed local
+    latency) is longer than a SwarmNode execution is expected to take; then
+    it is sent to the deployed SwarmNode agent as an ``/agents/{name}/chat``
+    payload. SwarmNode failures fall back to local execution, so callers get
+    the same ChatResponse either way.
+
+    Local slots are handed out by a FairScheduler with one queue per agent,
+    so a burst of traffic to one agent cannot starve the others.
+    """
+
+    def __init__(self, swarm_client: Optional[AsyncSwarmNodeClient] = None,
+                 swarm_agent_id: Optional[str] = SWARMNODE_AGENT_ID,
+                 max_concurrency: int = LOCAL_MAX_CONCURRENCY, max_queue_depth: int = LOCAL_MAX_QUEUE_DEPTH,
+                 local_latency: float = LOCAL_EXPECTED_LATENCY, swarm_latency: float = SWARMNODE_EXPECTED_LATENCY):
+        self.swarm_agent_id = swarm_agent_id
+        self._swarm_client = swarm_client
+        self.scheduler = FairScheduler(max_concurrency)
+        self.max_queue_depth = max_queue_depth
+        self.local_latency = local_latency
+        self.swarm_latency = swarm_latency
+        self.stats = {"scripted": 0, "local": 0, "offloaded": 0, "fallbacks": 0, "cancelled": 0}
+
+    @property
+    def max_concurrency(self) -> int:
+        return self.scheduler.slots
+
+    @max_concurrency.setter
+    def max_concurrency(self, slots: int):
+        self.scheduler.slots = slots
+
+    @property
+    def local_in_flight(self) -> int:
+        return self.scheduler.running
+
+    @property
+    def queued(self) -> int:
+        return self.scheduler.queued
+
+    @property
+    def swarm_client(self) -> Optional[AsyncSwarmNodeClient]:
+        if not self.swarm_agent_id:
+            return None
+        if self._swarm_client is None:
+            self._swarm_client = AsyncSwarmNodeClient()
+        return self._swarm_client
+
+    def _observe(self, attribute: str, elapsed: float):
+        current = getattr(self, attribute)
+        setattr(self, attribute, current + LATENCY_SMOOTHING * (elapsed - current))
+
+    def should_offload(self) -> bool:
+        """Whether the next request is better served by SwarmNode than by waiting locally."""
+        client = self.swarm_client
+        if client is None or self.local_in_flight < self.max_concurrency:
+            return False
+        if client.in_flight >= client.max_in_flight:
+            return False
+        if self.queued >= self.max_queue_depth:
+            return True
+        expected_wait = (self.queued // self.max_concurrency + 1) * self.local_latency
+        return expected_wait + self.local_latency > self.swarm_latency
+
+    async def run_local(self, agent: BaseAgent, request: ChatRequest, model_type: str,
+                        abandoned: Optional[Callable[[], bool]] = None, queue: Optional[str] = None,
+                        on_chunk: Optional[Callable[[str], None]] = None,
+                        on_restart: Optional[Callable[[], None]] = None) -> ChatResponse:
+        queue = queue or agent.type
+        await self.scheduler.acquire(queue, abandoned=abandoned)
+        cancelled = threading.Event()
+        start = time.monotonic()
+        worker = asyncio.ensure_future(asyncio.to_thread(agent.process_chat_request, request, model_type,
+                                                         cancelled, on_chunk, on_restart))
+
+        def finished(task: asyncio.Future):
+            # The slot stays taken until the worker thread is done, even if the caller stopped waiting earlier
+            self.scheduler.release(queue)
+            if not task.cancelled():
+                task.exception()
+
+        worker.add_done_callback(finished)
+        try:
+            response = await asyncio.shield(worker)
+            self._observe("local_latency", time.monotonic() - start)
+            return response
+        except asyncio.CancelledError:
+            # The worker thread stops at the next streamed chunk
+            cancelled.set()
+            raise
+
+    async def run_remote(self, agent: BaseAgent, request: ChatRequest, model_type: str) -> ChatResponse:
+        payload = {
+            "endpoint": f"/agents/{agent.type}/chat",
+            "method": "POST",
+            "params": {"model_type": model_type},
+            "body": request.model_dump()
+        }
+        start = time.monotonic()
+        execution = await self.swarm_client.execute(self.swarm_agent_id, payload, use_cache=False)
+        self._observe("swarm_latency", time.monotonic() - start)
+        return ChatResponse(**execution["return_value"])
+
+    async def dispatch(self, agent: BaseAgent, request: ChatRequest, model_type: str = "gemini",
+                       abandoned: Optional[Callable[[], bool]] = None, queue: Optional[str] = None,
+                       on_chunk: Optional[Callable[[str], None]] = None,
+                       on_restart: Optional[Callable[[], None]] = None, offload: bool = True) -> ChatResponse:
+        """Answer a chat request locally or on SwarmNode, whichever is expected to be faster.
+
+        `abandoned` reports whether the client has gone away; such requests
+        are dropped from the local queue with RequestDropped. Cancelling the
+        calling task stops a running local generation at its next chunk.
+        `queue` is the fair-scheduler queue to wait in (default: the agent's).
+        `on_chunk` receives the text of a local generation as it streams, from
+        the generating thread; offloaded and scripted answers only return.
+        `on_restart` says the text streamed so far was abandoned (see
+        BaseAgent.get_chat_response); the returned response is authoritative.
+        `offload=False` keeps the request in this process, for apps whose
+        deployment profile does not offload.
+        """
+        if model_type in ("openai", "gemini"):
+            # Scripted greetings need no LLM, so they never queue or leave the process
+            scripted = agent.get_scripted_response(request)
+            if scripted is not None:
+                self.stats["scripted"] += 1
+                return scripted
+
+        try:
+            if offload and model_type in ("openai", "gemini") and self.should_offload():
+                try:
+                    response = await self.run_remote(agent, request, model_type)
+                    self.stats["offloaded"] += 1
+                    return response
+                except (SwarmNodeError, KeyError, TypeError, ValueError) as e:
+                    print(f"SwarmNode offload failed, answering locally: {e}")
+                    self.stats["fallbacks"] += 1
+
+            self.stats["local"] += 1
+            return await self.run_local(agent, request, model_type, abandoned, queue, on_chunk, on_restart)
+        except asyncio.CancelledError:
+            self.stats["cancelled"] += 1
+            raise
+
+    def status(self) -> Dict[str, Any]:
+        """Queue depth, latency estimates, dispatch counts and per-agent queues."""
+        client = self._swarm_client
+        return {
+            "local_in_flight": self.local_in_flight,
+            "queued": self.queued,
+            "local_latency": round(self.local_latency, 3),
+            "swarm_latency": round(self.swarm_latency, 3),
+            "swarm_enabled": bool(self.swarm_agent_id),
+            "swarm_in_flight": client.in_flight if client else 0,
+            **self.stats,
+            "scheduler": self.scheduler.status()
+        }
+
+
+# Shared dispatcher used by the agent routes
+chat_dispatcher = ChatDispatcher()
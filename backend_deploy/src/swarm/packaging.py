@@ -0,0 +1,262 @@
+import os
+import re
+import ast
+import json
+import shutil
+import hashlib
+import tempfile
+from dataclasses import dataclass, field
+from importlib import metadata
+from typing import List, Dict, Any, Optional, Iterable, Set
+
+from api.github_sync import DATA_DIR
+
+# Built agent packages, one directory per content hash
+PACKAGE_CACHE_DIR = os.getenv("SWARMNODE_PACKAGE_CACHE", os.path.join(DATA_DIR, "swarmnode_packages"))
+
+# Bumped whenever packaging output changes, so stale cache entries are not reused
+PACKAGER_VERSION = "3"
+
+# Rough cost model for a cold-start `pip install` on SwarmNode
+INSTALL_BASE_SECONDS = float(os.getenv("SWARMNODE_INSTALL_BASE_SECONDS", "2"))
+INSTALL_SECONDS_PER_PACKAGE = float(os.getenv("SWARMNODE_INSTALL_SECONDS_PER_PACKAGE", "0.3"))
+INSTALL_MB_PER_SECOND = float(os.getenv("SWARMNODE_INSTALL_MB_PER_SECOND", "15"))
+
+# Import names whose distribution name differs, for Pythons without packages_distributions()
+KNOWN_DISTRIBUTIONS = {
+    "dotenv": "python-dotenv",
+    "google": "google-generativeai",
+    "langchain_openai": "langchain-openai",
+    "langchain_core": "langchain-core",
+    "yaml": "PyYAML",
+}
+
+
+def normalize(name: str) -> str:
+    """PEP 503 normalized distribution name."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _bound_names(node: ast.AST) -> Set[str]:
+    return {n.id for n in ast.walk(node) if isinstance(n, ast.Name)}
+
+
+def _strip_docstring(body: List[ast.stmt]) -> List[ast.stmt]:
+    if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant) and isinstance(body[0].value.value, str):
+        body = body[1:] or [ast.Pass()]
+    return body
+
+
+def shake_script(script: str, keep: Iterable[str] = ("main",)) -> str:
+    """Drop unused top-level functions, classes and from-imports, docstrings and comments.
+
+    Top-level code other than definitions is always kept and is the root of
+    reachability together with `keep` (SwarmNode calls ``main``) and every
+    decorated definition, since a decorator may register it (routes,
+    handlers, atexit). Bare ``import x`` statements are kept, as they may be
+    there for their side effects. Names only reachable through
+    getattr/globals() must be listed in `keep`.
+    """
+    tree = ast.parse(script)
+    definitions = {
+        node.name: node for node in tree.body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+    }
+    roots = set(keep)
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            if node.decorator_list:
+                roots.add(node.name)
+        elif not isinstance(node, (ast.Import, ast.ImportFrom)):
+            roots |= _bound_names(node)
+
+    used, stack = set(roots), list(roots)
+    while stack:
+        name = stack.pop()
+        if name in definitions:
+            for referenced in _bound_names(definitions[name]) - used:
+                used.add(referenced)
+                stack.append(referenced)
+
+    body = []
+    for node in _strip_docstring(tree.body):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            if node.name not in used:
+                continue
+            for child in ast.walk(node):
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                    child.body = _strip_docstring(child.body)
+        elif isinstance(node, ast.ImportFrom):
+            if node.module == "__future__":
+                body.append(node)
+                continue
+            node.names = [
+                alias for alias in node.names
+                if alias.name == "*" or (alias.asname or alias.name.split(".")[0]) in used
+            ]
+            if not node.names:
+                continue
+        body.append(node)
+    tree.body = body
+    return ast.unparse(tree) + "\n"
+
+
+def imported_modules(script: str) -> Set[str]:
+    """Top-level module names a script imports (absolute imports only)."""
+    modules = set()
+    for node in ast.walk(ast.parse(script)):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules.add(node.module.split(".")[0])
+    return modules
+
+
+def module_distributions(modules: Iterable[str]) -> Set[str]:
+    """Normalized names of the installed distributions providing `modules`."""
+    try:
+        mapping = metadata.packages_distributions()
+    except AttributeError:
+        mapping = {}
+    names = set()
+    for module in modules:
+        for dist in mapping.get(module) or [KNOWN_DISTRIBUTIONS.get(module, module)]:
+            names.add(normalize(dist))
+    return names
+
+
+def dependency_closure(names: Iterable[str]) -> Set[str]:
+    """`names` plus every installed distribution they require, transitively."""
+    closure, stack = set(), [normalize(name) for name in names]
+    while stack:
+        name = stack.pop()
+        if name in closure:
+            continue
+        closure.add(name)
+        try:
+            requires = metadata.requires(name) or []
+        except metadata.PackageNotFoundError:
+            continue
+        for requirement in requires:
+            if "extra ==" in requirement:
+                continue
+            stack.append(normalize(re.split(r"[<>=!~;\[ (]", requirement, 1)[0]))
+    return closure
+
+
+def _requirement_name(line: str) -> Optional[str]:
+    tokens = [token for token in line.split() if not token.startswith("-") and token != ":all:"]
+    return normalize(re.split(r"[<>=!~;\[]", tokens[-1], 1)[0]) if tokens else None
+
+
+def _installed(name: str) -> bool:
+    try:
+        metadata.distribution(name)
+    except metadata.PackageNotFoundError:
+        return False
+    return True
+
+
+def slim_requirements(requirements: str, modules: Iterable[str], pin: bool = False) -> str:
+    """Keep requirement lines the script's imports need (directly or transitively).
+
+    Whether a distribution is needed is worked out from what is installed
+    here, so lines naming one that is not installed are kept, with a
+    warning. With `pin`, unpinned lines are pinned to the locally
+    installed version.
+    """
+    needed = dependency_closure(module_distributions(modules))
+    lines = []
+    for line in requirements.splitlines():
+        line = line.split("#", 1)[0].strip()
+        name = _requirement_name(line) if line else None
+        if not name:
+            continue
+        if name not in needed:
+            if _installed(name):
+                continue
+            print(f"⚠️  Keeping requirement {line!r}: {name} is not installed here, so whether the script needs it is unknown")
+        if pin and not re.search(r"[<>=!~]=?", line.split()[-1]):
+            try:
+                line = f"{line}=={metadata.version(name)}"
+            except metadata.PackageNotFoundError:
+                pass
+        lines.append(line)
+    return "\n".join(lines) + ("\n" if lines else "")
+
+
+def install_size(name: str) -> int:
+    """Bytes an installed distribution occupies, or 0 if it is not installed here."""
+    try:
+        files = metadata.distribution(name).files or []
+    except metadata.PackageNotFoundError:
+        return 0
+    return sum(f.size or 0 for f in files)
+
+
+def package_report(script: str, requirements: str) -> Dict[str, Any]:
+    """Size of a package and a rough estimate of its cold-start install time."""
+    names = [name for name in map(_requirement_name, requirements.splitlines()) if name]
+    closure = dependency_closure(names)
+    install_bytes = sum(install_size(name) for name in closure)
+    return {
+        "script_bytes": len(script.encode()),
+        "requirements": len(names),
+        "installed_packages": len(closure),
+        "install_bytes": install_bytes,
+        "estimated_install_seconds": round(
+            INSTALL_BASE_SECONDS + len(closure) * INSTALL_SECONDS_PER_PACKAGE
+            + install_bytes / (INSTALL_MB_PER_SECOND * 1024 * 1024), 1
+        )
+    }
+
+
+@dataclass
+class AgentPackage:
+    """A built agent script and requirements, with before/after size reports."""
+    script: str
+    requirements: str
+    cache_key: str
+    report: Dict[str, Any] = field(default_factory=dict)
+    cached: bool = False
+
+
+def build_package(script: str, requirements: str = "", keep: Iterable[str] = ("main",),
+                  cache_dir: Optional[str] = PACKAGE_CACHE_DIR, pin: bool = False) -> AgentPackage:
+    """Shake the script, slim the requirements and cache the result by content hash.
+
+    `pin` pins unpinned requirements to the versions installed here.
+    """
+    keep = sorted(set(keep))
+    cache_key = hashlib.sha256(json.dumps([PACKAGER_VERSION, script, requirements, keep, pin]).encode()).hexdigest()
+    package_dir = os.path.join(cache_dir, cache_key) if cache_dir else None
+
+    if package_dir and os.path.isdir(package_dir):
+        with open(os.path.join(package_dir, "script.py"), "r") as f:
+            built_script = f.read()
+        with open(os.path.join(package_dir, "requirements.txt"), "r") as f:
+            built_requirements = f.read()
+        with open(os.path.join(package_dir, "report.json"), "r") as f:
+            report = json.load(f)
+        return AgentPackage(built_script, built_requirements, cache_key, report, cached=True)
+
+    built_script = shake_script(script, keep)
+    built_requirements = slim_requirements(requirements, imported_modules(built_script), pin)
+    report = {"before": package_report(script, requirements), "after": package_report(built_script, built_requirements)}
+
+    if package_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(dir=cache_dir)
+        with open(os.path.join(tmp_dir, "script.py"), "w") as f:
+            f.write(built_script)
+        with open(os.path.join(tmp_dir, "requirements.txt"), "w") as f:
+            f.write(built_requirements)
+        with open(os.path.join(tmp_dir, "report.json"), "w") as f:
+            json.dump(report, f, indent=2)
+        try:
+            os.replace(tmp_dir, package_dir)
+        except OSError:
+            # Another build of the same package got there first
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return AgentPackage(built_script, built_requirements, cache_key, report)
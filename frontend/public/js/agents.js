@@ -4,6 +4,24 @@ import { apiBaseUrl } from "./config.js";
 console.log("Agents.js loaded");
 console.log("API Base URL:", apiBaseUrl);
 
+// Project info by ETag, shared by every agent on the page
+const projectInfoCache = new Map();
+
+// Same links block the API used to append to first responses
+function linksHtml(info) {
+  let html = '<div class="agent-links">';
+  if (info.github_repo) {
+    html += `<p><strong>GitHub:</strong> <a href="${info.github_repo}" target="_blank" rel="noopener noreferrer">${info.github_repo}</a></p>`;
+  }
+  if (info.project_url) {
+    html += `<p><strong>Project:</strong> <a href="${info.project_url}" target="_blank" rel="noopener noreferrer">${info.project_url}</a></p>`;
+  }
+  if (info.hackathon_link) {
+    html += `<p><strong>Hackathon:</strong> <a href="${info.hackathon_link}" target="_blank" rel="noopener noreferrer">View Submission</a></p>`;
+  }
+  return html + "</div>";
+}
+
 class Agent {
   constructor(config) {
     console.log(`Initializing agent: ${config.name}`);
@@ -83,9 +101,10 @@ class Agent {
         }),
       });
       const data = await response.json();
+      const links = await this.projectLinks(data);
       this.hideTypingIndicator();
       this.addMessage(`Hello, can you tell me about ${this.name}?`, "user");
-      this.addMessage(data.response, "assistant");
+      this.addMessage(data.response + links, "assistant");
       this.messages.push({
         role: "system",
         content:
@@ -110,6 +129,29 @@ class Agent {
     }
   }
 
+  // First chat responses refer to the project info by version instead of
+  // resending it; the browser caches /info and revalidates it by ETag.
+  async projectLinks(data) {
+    if (!data.project_info_etag || data.response.includes("<a href='")) {
+      return "";
+    }
+    try {
+      if (!projectInfoCache.has(data.project_info_etag)) {
+        const response = await fetch(`${apiBaseUrl}/${this.type}/info`);
+        // Leave error bodies out of the cache and the chat
+        if (!response.ok) {
+          console.error("Error fetching project info:", response.status);
+          return "";
+        }
+        projectInfoCache.set(data.project_info_etag, await response.json());
+      }
+      return linksHtml(projectInfoCache.get(data.project_info_etag));
+    } catch (error) {
+      console.error("Error fetching project info:", error);
+      return "";
+    }
+  }
+
   async sendMessage() {
     const message = this.chatInput.value.trim();
     if (message) {
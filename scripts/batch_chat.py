@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Run canned conversations against an agent through the batch chat API.
+
+Posts the conversations to /agents/{name}/chat/batch and appends every
+result line to an NDJSON output file as it streams in. Conversations
+already answered in the output file are skipped, so re-running the same
+command after a failure (or letting --retries do it) resumes the run
+instead of starting over. Failed conversations are retried when they
+are retryable.
+
+The input file is either a JSON list of questions (each becomes a
+one-question conversation) or a list of {"id", "messages"}
+conversations; a transcripts file (scripts/model_tier_transcripts.json)
+works too, using each conversation up to its last user message.
+
+Usage:
+    python scripts/batch_chat.py wooly questions.json results.ndjson [--base-url http://localhost:8000]
+                                 [--token $BATCH_ADMIN_TOKEN] [--concurrency 4] [--retries 3]
+"""
+import os
+import sys
+import json
+import asyncio
+import argparse
+from typing import List, Dict, Any, Set
+
+import httpx
+
+
+def load_conversations(path: str) -> List[Dict[str, Any]]:
+    """Conversations with ids, from questions, conversations or transcripts."""
+    with open(path) as f:
+        items = json.load(f)
+    conversations = []
+    for i, item in enumerate(items):
+        if isinstance(item, str):
+            conversations.append({"id": str(i), "messages": [{"role": "user", "content": item}]})
+            continue
+        messages = item["messages"]
+        last_user = max(j for j, message in enumerate(messages) if message["role"] == "user")
+        conversations.append({"id": str(item.get("id", i)), "messages": messages[:last_user + 1]})
+    return conversations
+
+
+def answered_ids(output: str) -> Set[str]:
+    """Ids with a response in an earlier run's output file."""
+    if not os.path.exists(output):
+        return set()
+    answered = set()
+    with open(output) as f:
+        for line in f:
+            try:
+                result = json.loads(line)
+            except ValueError:
+                # A line cut short when the earlier run died
+                continue
+            if "response" in result:
+                answered.add(result["id"])
+    return answered
+
+
+async def run(client: httpx.AsyncClient, agent: str, conversations: List[Dict[str, Any]], output: str,
+              token: str = "", model_type: str = "gemini", concurrency: int = 4, retries: int = 3,
+              backoff: float = 1.0) -> Dict[str, Any]:
+    """Run the conversations not yet answered in `output`, appending results; returns the final summary.
+
+    Interrupted streams and retryable failures are resumed up to `retries` times.
+    """
+    if os.path.exists(output) and os.path.getsize(output):
+        with open(output, "rb+") as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                # Keep a line cut short by an earlier run off the first new result
+                f.write(b"\n")
+
+    summary = {}
+    for attempt in range(retries + 1):
+        completed = answered_ids(output)
+        if attempt and len(completed) == len(conversations):
+            break
+        body = {"conversations": conversations, "concurrency": concurrency, "completed": sorted(completed)}
+        retryable = False
+        try:
+            async with client.stream("POST", f"/agents/{agent}/chat/batch", params={"model_type": model_type},
+                                     json=body, headers={"X-Admin-Token": token}, timeout=None) as response:
+                response.raise_for_status()
+                with open(output, "a") as f:
+                    async for line in response.aiter_lines():
+                        if not line:
+                            continue
+                        result = json.loads(line)
+                        if result.get("done"):
+                            summary = result
+                            continue
+                        retryable = retryable or result.get("retryable", False)
+                        f.write(line + "\n")
+                        f.flush()
+            if not retryable:
+                break
+        except (httpx.TransportError, httpx.HTTPStatusError) as e:
+            if isinstance(e, httpx.HTTPStatusError) and e.response.status_code < 500:
+                raise
+            print(f"Batch interrupted ({e}); resuming")
+        if attempt < retries:
+            await asyncio.sleep(min(backoff * 2 ** attempt, 30))
+    summary["answered"] = len(answered_ids(output))
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("agent")
+    parser.add_argument("conversations", help="JSON file of questions, conversations or transcripts")
+    parser.add_argument("output", help="NDJSON file results are appended to")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--token", default=os.getenv("BATCH_ADMIN_TOKEN", os.getenv("REGISTRY_ADMIN_TOKEN", "")))
+    parser.add_argument("--model-type", default="gemini", choices=("gemini", "openai"))
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--retries", type=int, default=3)
+    args = parser.parse_args()
+
+    conversations = load_conversations(args.conversations)
+
+    async def go():
+        async with httpx.AsyncClient(base_url=args.base_url) as client:
+            return await run(client, args.agent, conversations, args.output, args.token,
+                             args.model_type, args.concurrency, args.retries)
+
+    summary = asyncio.run(go())
+    print(f"{summary['answered']}/{len(conversations)} conversations answered in {args.output}")
+    if summary["answered"] < len(conversations):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
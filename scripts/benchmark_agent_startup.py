@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Measure startup time and memory for 500 data-driven agent definitions.
+
+Compares building agents with the factory and serving them from the one
+shared router against the old layout, where every agent module created its
+own FastAPI app with CORS middleware that was mounted under /agents.
+
+Usage:
+    python scripts/benchmark_agent_startup.py [--agents 500]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import tracemalloc
+
+# Make the backend package importable when running from the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend_deploy", "src"))
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from agents.agent_factory import DEFINITIONS_DIR, load_agents
+
+def write_definitions(count, directory):
+    """Write `count` copies of the bundled definitions with unique agent types."""
+    templates = []
+    for file_name in sorted(os.listdir(DEFINITIONS_DIR)):
+        with open(os.path.join(DEFINITIONS_DIR, file_name), "r") as f:
+            templates.append(json.load(f))
+
+    for i in range(count):
+        definition = dict(templates[i % len(templates)])
+        definition["type"] = f"{definition['type']}{i}"
+        with open(os.path.join(directory, f"agent{i:04d}.json"), "w") as f:
+            json.dump(definition, f)
+
+def measure(label, fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{label:<36} {elapsed * 1000:>9.1f} ms {current / 1024 / 1024:>8.2f} MiB retained {peak / 1024 / 1024:>8.2f} MiB peak")
+    return result
+
+def shared_router_app(directory):
+    """New layout: agents from definitions, one router."""
+    import api.agent_router as agent_router
+    agent_router.agents.clear()
+    agent_router.agents.update(load_agents(directory))
+    app = FastAPI()
+    app.include_router(agent_router.router)
+    return app
+
+def sub_app_per_agent(directory):
+    """Old layout: one FastAPI app with CORS and four routes per agent."""
+    agents = load_agents(directory)
+    app = FastAPI()
+    for agent_type, agent in agents.items():
+        agent_app = FastAPI(title=f"{agent.name} Agent")
+        agent_app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_credentials=True, allow_methods=["*"], allow_headers=["*"])
+
+        @agent_app.get("/")
+        async def root():
+            return {}
+
+        @agent_app.get("/health")
+        async def health_check():
+            return {"status": "healthy"}
+
+        @agent_app.get("/info")
+        async def info(agent=agent):
+            return agent.project_info
+
+        @agent_app.post("/chat")
+        async def chat(agent=agent):
+            return {}
+
+        app.mount(f"/agents/{agent_type}", agent_app)
+    return app
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, default=500)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    write_definitions(args.agents, directory)
+
+    print(f"Agent startup benchmark ({args.agents} agent definitions)")
+    print("=" * 90)
+    agents = measure("load definitions + build agents", lambda: load_agents(directory))
+    measure("shared router app", lambda: shared_router_app(directory))
+    measure("sub-app per agent (old layout)", lambda: sub_app_per_agent(directory))
+
+    prompt_bytes = sum(len(agent.system_prompt.encode()) for agent in agents.values())
+    print(f"\nSystem prompts: {prompt_bytes / 1024:.1f} KiB across {len(agents)} agents")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Check that every deployment profile runs the same chat hot path at the same speed.
+
+Builds the app for each backend profile (the Procfile/Docker server and the
+SwarmNode and minimal profiles) and drives concurrent multi-turn chats
+through it in-process. Gemini is replaced by a stand-in with a fixed
+latency, so everything else on the request path (routing, dispatch,
+prompt assembly from GitHub, staking and knowledge context) runs for real.
+
+Exits non-zero if a profile serves chat through a different endpoint or
+is more than --tolerance slower than the fastest profile.
+
+Usage:
+    python scripts/benchmark_app_profiles.py [--requests 400] [--concurrency 32] [--latency 0.01]
+"""
+import io
+import os
+import sys
+import time
+import asyncio
+import argparse
+import contextlib
+
+# Make the backend package importable when running from the repo root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "backend_deploy", "src"))
+
+import httpx
+
+from agents import base_agent
+from api import agent_router
+from api.admission import admission_controller
+from api.app import PROFILES, create_app
+
+class FakeGeminiModel:
+    """Stand-in for genai.GenerativeModel that answers after a fixed delay."""
+
+    latency = 0.01
+
+    def __init__(self, model_name):
+        self.model_name = model_name
+
+    def generate_content(self, prompt, stream=False, **kwargs):
+        time.sleep(self.latency)
+        response = type("Response", (), {"text": f"Answer to a {len(prompt)}-character prompt"})()
+        return [response] if stream else response
+
+def chat_body(i):
+    return {"messages": [
+        {"role": "user", "content": "What does this project do?"},
+        {"role": "assistant", "content": "It helps builders ship."},
+        {"role": "user", "content": f"How much is staked on it, and what makes it unique? ({i})"}
+    ]}
+
+async def drive(app, agent_names, requests, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one(i):
+            async with semaphore:
+                response = await client.post(f"/agents/{agent_names[i % len(agent_names)]}/chat", json=chat_body(i))
+                response.raise_for_status()
+
+        # Warm up knowledge indexes and snapshots before timing
+        await asyncio.gather(*(one(i) for i in range(len(agent_names))))
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        return time.perf_counter() - start
+
+async def run_profiles(agent_names, requests, concurrency):
+    """Chats/sec per profile, all on one event loop like a single server process."""
+    results, failures = {}, []
+    for name in PROFILES:
+        # Agent code prints every prompt; keep the report readable
+        with contextlib.redirect_stdout(io.StringIO()):
+            app = create_app(name)
+            chat_endpoint = next(route.endpoint for route in app.routes if getattr(route, "path", None) == "/agents/{agent_name}/chat")
+            elapsed = await drive(app, agent_names, requests, concurrency)
+        if chat_endpoint is not agent_router.chat:
+            failures.append(f"{name}: chat is served by {chat_endpoint.__module__}.{chat_endpoint.__name__}")
+        results[name] = requests / elapsed
+        print(f"{name:<12} {results[name]:>10,.1f} chats/s {elapsed * 1000 / requests:>10.2f} ms/chat")
+    return results, failures
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.01, help="seconds per fake Gemini call")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown against the fastest profile")
+    args = parser.parse_args()
+
+    FakeGeminiModel.latency = args.latency
+    base_agent.gemini_api_key = "benchmark"
+    base_agent.safety_settings = []
+    base_agent.genai.GenerativeModel = FakeGeminiModel
+    agent_names = sorted(agent_router.agents)
+    # Admission control still runs on every chat, but with limits this run cannot reach
+    admission_controller.client_burst = admission_controller.agent_burst = args.requests + len(agent_names)
+    admission_controller.provider_limits = {provider: args.concurrency for provider in admission_controller.provider_limits}
+
+    print(f"App profile benchmark ({args.requests} chats, {args.concurrency} concurrent, {args.latency * 1000:.0f} ms/LLM call)")
+    print("=" * 72)
+    results, failures = asyncio.run(run_profiles(agent_names, args.requests, args.concurrency))
+
+    fastest = max(results.values())
+    for name, rate in results.items():
+        if rate < fastest * (1 - args.tolerance):
+            failures.append(f"{name}: {rate:,.1f} chats/s is more than {args.tolerance:.0%} below {fastest:,.1f}")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if failures:
+        sys.exit(1)
+    print("✅ All profiles share the chat hot path")
+
+if __name__ == "__main__":
+    main()
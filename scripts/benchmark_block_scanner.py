@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Benchmark the chain event scanner backfilling from the deploy block.
+
+Runs against the local dev-chain stand-in used by the tests, with a fixed
+per-request latency standing in for a remote RPC provider, and compares
+the old fixed-window sequential scan with adaptive windows and parallel
+backfill workers. Reports blocks/sec and RPC requests for each.
+
+Usage:
+    python scripts/benchmark_block_scanner.py [--blocks 1000000] [--events 20000] [--latency 0.02]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+# Make the backend package and the dev-chain stand-in importable when running from the repo root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "backend_deploy", "src"))
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+from fake_chain import FakeChain
+from chain.rpc import JsonRpcClient
+from chain.indexer import StakingStore, StakingIndexer
+
+def make_chain(blocks, events, latency, max_logs):
+    chain = FakeChain(head=blocks, max_logs=max_logs)
+    chain.emit("ProjectAdded", block=1, project_id="vocafi", name="VocaFI")
+    for block in sorted(random.randint(2, blocks) for _ in range(events)):
+        chain.emit("Staked", block=block, staker="0x" + "a" * 40, project_id="vocafi", amount=1)
+    chain.latency = latency
+    return chain
+
+def run(label, chain, **kwargs):
+    chain.requests.clear()
+    store = StakingStore(os.path.join(tempfile.mkdtemp(), "events.db"))
+    indexer = StakingIndexer(store, rpc=JsonRpcClient(url="http://fake-chain", session=chain),
+                             start_block=0, confirmations=0, **kwargs)
+    start = time.perf_counter()
+    added = indexer.sync()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<44} {chain.head / elapsed:>12,.0f} blocks/s {len(chain.requests):>6} requests {added:>6} events")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--blocks", type=int, default=1000000)
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds per RPC request")
+    parser.add_argument("--max-logs", type=int, default=1000, help="provider cap on logs per getLogs response")
+    args = parser.parse_args()
+
+    random.seed(42)
+    chain = make_chain(args.blocks, args.events, args.latency, args.max_logs)
+
+    print(f"Block scanner benchmark ({args.blocks} blocks, {args.events} events, {args.latency * 1000:.0f} ms/request)")
+    print("=" * 92)
+    run("fixed 2000-block windows, sequential", chain, batch_size=2000, max_batch_size=2000, workers=1)
+    run("adaptive windows, sequential", chain, batch_size=2000, workers=1)
+    run("adaptive windows, 4 backfill workers", chain, batch_size=2000, workers=4)
+    run("adaptive windows, 8 backfill workers", chain, batch_size=2000, workers=8, segment_size=args.blocks // 16 or 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Compare per-turn overhead of chat over HTTP POST and over the WebSocket.
+
+Boots the minimal app under uvicorn on a local port with instant fake
+LLM providers (tests/fake_providers.py), so what is measured is the
+transport: connection reuse, request parsing and validation, and the
+transcript each turn has to carry. Over HTTP every turn posts the whole
+conversation to /agents/{name}/chat on a keep-alive connection; over
+/agents/{name}/ws only the new message is sent and the answer streams
+back as tokens.
+
+Usage:
+    python scripts/benchmark_chat_transport.py [--conversations 20] [--turns 12] [--agent wooly]
+"""
+import io
+import os
+import sys
+import json
+import time
+import socket
+import asyncio
+import argparse
+import contextlib
+import statistics
+import threading
+
+# Make the backend package and the provider stand-ins importable when running from the repo root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "backend_deploy", "src"))
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+import httpx
+import uvicorn
+import websockets
+
+from fake_providers import install
+from api.app import create_app
+
+QUESTIONS = [
+    "Hi",
+    "What does this project do?",
+    "What makes it different from similar projects?",
+    "How can I contribute or fork it?",
+]
+
+
+def question(turn: int) -> str:
+    return QUESTIONS[turn] if turn < len(QUESTIONS) else f"Follow-up question number {turn}?"
+
+
+def start_server(app) -> tuple:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", ws="websockets"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    return server, thread, port
+
+
+async def http_conversation(client: httpx.AsyncClient, agent: str, turns: int, timings: list, sent: list):
+    messages = []
+    for turn in range(turns):
+        messages.append({"role": "user", "content": question(turn)})
+        body = json.dumps({"messages": messages})
+        start = time.perf_counter()
+        response = await client.post(f"/agents/{agent}/chat", content=body, headers={"Content-Type": "application/json"})
+        response.raise_for_status()
+        timings.append(time.perf_counter() - start)
+        sent.append(len(body))
+        messages.append({"role": "assistant", "content": response.json()["response"]})
+
+
+async def ws_conversation(url: str, agent: str, turns: int, timings: list, sent: list):
+    async with websockets.connect(url) as socket:
+        for turn in range(turns):
+            body = json.dumps({"type": "chat", "id": str(turn), "content": question(turn)})
+            start = time.perf_counter()
+            await socket.send(body)
+            while True:
+                message = json.loads(await socket.recv())
+                if message["type"] not in ("token", "restart"):
+                    break
+            assert message["type"] == "done", message
+            timings.append(time.perf_counter() - start)
+            sent.append(len(body))
+
+
+def report(label: str, timings: list, sent: list):
+    ms = sorted(t * 1000 for t in timings)
+    p95 = ms[int(len(ms) * 0.95) - 1]
+    print(f"{label:<12} {statistics.mean(ms):>9.2f} {statistics.median(ms):>9.2f} {p95:>9.2f} {statistics.mean(sent):>12.0f}")
+    return statistics.mean(ms)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--conversations", type=int, default=20)
+    parser.add_argument("--turns", type=int, default=12)
+    parser.add_argument("--agent", default="wooly")
+    args = parser.parse_args()
+
+    app = create_app("minimal")
+    # The agents log every generation; keep the report readable
+    with install(), contextlib.redirect_stdout(io.StringIO()):
+        server, thread, port = start_server(app)
+        try:
+            async def run():
+                results = {}
+                async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}") as client:
+                    timings, sent = [], []
+                    for _ in range(args.conversations):
+                        await http_conversation(client, args.agent, args.turns, timings, sent)
+                    results["HTTP POST"] = (timings, sent)
+                timings, sent = [], []
+                for _ in range(args.conversations):
+                    await ws_conversation(f"ws://127.0.0.1:{port}/agents/{args.agent}/ws", args.agent, args.turns,
+                                          timings, sent)
+                results["WebSocket"] = (timings, sent)
+                return results
+
+            results = asyncio.run(run())
+        finally:
+            server.should_exit = True
+            thread.join()
+
+    print(f"Chat transport benchmark ({args.conversations} conversations x {args.turns} turns, instant fake LLM)")
+    print("=" * 80)
+    print(f"{'transport':<12} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'bytes/turn':>12}")
+    http_ms = report("HTTP POST", *results["HTTP POST"])
+    ws_ms = report("WebSocket", *results["WebSocket"])
+    print(f"\nPer-turn overhead: WebSocket {ws_ms:.2f} ms vs HTTP {http_ms:.2f} ms ({http_ms / ws_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Benchmark the GitHub project registry with 10k registered projects.
+
+Compares the registry's indexed (owner, repo) lookup against the linear
+``next(...)`` scan the old hard-coded TRACKED_PROJECTS list used.
+
+Usage:
+    python scripts/benchmark_project_registry.py [--projects 10000] [--lookups 100000]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+# Make the backend package importable when running from the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend_deploy", "src"))
+
+from api.project_registry import ProjectRegistry
+
+def timed(label, fn, count=1):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    per_op = elapsed / count * 1e6
+    print(f"{label:<40} {elapsed * 1000:>10.2f} ms total {per_op:>10.2f} µs/op")
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=10000)
+    parser.add_argument("--lookups", type=int, default=100000)
+    args = parser.parse_args()
+
+    projects = [
+        {"owner": f"builder{i}", "repo": f"hackathon-project-{i}", "name": f"Project {i}"}
+        for i in range(args.projects)
+    ]
+    db_file = os.path.join(tempfile.mkdtemp(), "projects.db")
+    targets = [random.choice(projects) for _ in range(args.lookups)]
+
+    print(f"Project registry benchmark ({args.projects} projects, {args.lookups} lookups)")
+    print("=" * 80)
+
+    registry = ProjectRegistry(db_file=db_file, projects_file=None, defaults=[])
+    timed("bulk register", lambda: registry.register_many(projects), args.projects)
+    timed("cold start (load from SQLite)", lambda: ProjectRegistry(db_file=db_file, projects_file=None, defaults=[]))
+
+    timed("indexed lookup", lambda: [registry.get(p["owner"], p["repo"]) for p in targets], args.lookups)
+
+    linear_targets = targets[:max(1, args.lookups // 100)]
+    timed(
+        "linear scan (old TRACKED_PROJECTS)",
+        lambda: [next((p for p in projects if p["owner"] == t["owner"] and p["repo"] == t["repo"]), None) for t in linear_targets],
+        len(linear_targets)
+    )
+
+    timed("list page (limit=100)", lambda: [registry.all(offset, 100) for offset in range(0, args.projects, 100)], args.projects // 100 or 1)
+
+if __name__ == "__main__":
+    main()
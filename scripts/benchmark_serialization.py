@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Benchmark JSON serialization per endpoint, before and after the orjson response path.
+
+"before" is FastAPI's default path: jsonable_encoder and response_model
+validation, then json.dumps in JSONResponse. "after" is what the
+endpoint does now: pre-serialized bytes for /agents and
+/agents/{name}/info, FastJSONResponse straight from the stored snapshot
+for /github/activity and /github/projects, and orjson after the usual
+encoding for everything else. GitHub data is synthetic; no network
+calls are made.
+
+Usage:
+    python scripts/benchmark_serialization.py [--projects 100] [--requests 2000]
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+# Make the backend package importable when running from the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend_deploy", "src"))
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+
+from api import agent_router
+from api.github_api import router as github_router
+from api.serialization import FastJSONResponse
+from swarm.dispatch import chat_dispatcher
+
+
+def response_field(path):
+    return next(route.response_field for route in github_router.routes if route.path == path)
+
+
+async def default_path(content, field=None):
+    """What FastAPI does with an endpoint's return value by default."""
+    return JSONResponse(await serialize_response(field=field, response_content=content))
+
+
+async def encoded_orjson_path(content):
+    """Default response class now: the same encoding, rendered with orjson."""
+    return FastJSONResponse(await serialize_response(response_content=content))
+
+
+async def ready(response):
+    return response
+
+
+def activity(projects):
+    return {
+        f"Project {i}": {
+            "repo_info": {"name": f"project-{i}", "owner": f"builder{i}", "repo": f"project-{i}", "stars": i * 7,
+                          "forks": i, "watchers": i * 3, "open_issues": i % 11, "last_updated": "2025-03-01T12:00:00Z"},
+            "recent_commits": [{"sha": f"{i:03d}{c:04d}", "message": f"Fix the thing number {c} in the staking flow",
+                                "author": f"Builder {i}", "date": "2025-03-01T12:00:00Z"} for c in range(5)],
+            "recent_forks": [{"owner": f"forker{f}", "full_name": f"forker{f}/project-{i}",
+                              "created_at": "2025-02-20T08:30:00Z", "url": f"https://github.com/forker{f}/project-{i}"}
+                             for f in range(5)]
+        }
+        for i in range(projects)
+    }
+
+
+def timed(fn, count):
+    """Mean µs per call of an async response builder, and the body size."""
+    async def run():
+        await fn()  # warm up
+        start = time.perf_counter()
+        for _ in range(count):
+            response = await fn()
+        return (time.perf_counter() - start) / count * 1e6, len(response.body)
+    return asyncio.run(run())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=100, help="tracked projects in /github/activity")
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    name = next(iter(agent_router.agents))
+    agent = agent_router.agents[name]
+    listing = {"agents": [{"name": a.name, "type": a.type, "description": a.description, "endpoint": f"/agents/{key}",
+                           "project_info": a.project_info, "project_info_etag": a.project_info_etag}
+                          for key, a in agent_router.agents.items()]}
+    snapshot = activity(args.projects)
+    projects = [{"owner": f"builder{i}", "repo": f"project-{i}", "name": f"Project {i}"} for i in range(args.projects * 10)]
+    status = chat_dispatcher.status()
+
+    endpoints = [
+        ("/agents", lambda: default_path(listing), lambda: ready(agent_router.agents_listing.response())),
+        (f"/agents/{name}/info", lambda: default_path(agent.project_info),
+         lambda: ready(agent_router.agent_infos[name].response())),
+        ("/github/activity", lambda: default_path(snapshot, response_field("/github/activity")),
+         lambda: ready(FastJSONResponse(snapshot))),
+        ("/github/projects", lambda: default_path(projects, response_field("/github/projects")),
+         lambda: ready(FastJSONResponse(projects))),
+        ("/agents/dispatch/status", lambda: default_path(status), lambda: encoded_orjson_path(status)),
+    ]
+
+    print(f"Serialization benchmark ({args.requests} requests per endpoint, {args.projects} projects)")
+    print("=" * 80)
+    print(f"{'endpoint':<28} {'bytes':>9} {'before µs':>11} {'after µs':>10} {'speedup':>9}")
+    for path, before, after in endpoints:
+        before_us, size = timed(before, args.requests)
+        after_us, _ = timed(after, args.requests)
+        print(f"{path:<28} {size:>9} {before_us:>11.1f} {after_us:>10.1f} {before_us / after_us:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
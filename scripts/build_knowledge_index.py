@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Build the per-agent knowledge indexes used for retrieval.
+
+Chunks each agent's project_info and the documents under
+backend_deploy/src/agents/knowledge/<agent type>/ into a BM25 index on disk.
+Agents without documents get no index, and no retrieval.
+With --fetch-readme the project's GitHub README is downloaded into that
+directory first (this is the only step that needs the network).
+
+Usage:
+    python scripts/build_knowledge_index.py [--fetch-readme] [--query "how does staking work"]
+"""
+import os
+import sys
+import argparse
+import requests
+
+# Make the backend package importable when running from the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend_deploy", "src"))
+
+from agents.agent_factory import load_agents
+from agents.knowledge import KNOWLEDGE_DOCS_DIR, knowledge_chunks, load_or_build_index
+
+def fetch_readme(agent):
+    """Download the project's README into the agent's knowledge directory."""
+    project = agent.get_github_repo()
+    if not project:
+        return
+    token = os.getenv("GITHUB_TOKEN", "")
+    headers = {"Accept": "application/vnd.github.raw"}
+    if token:
+        headers["Authorization"] = f"token {token}"
+
+    try:
+        response = requests.get(f"https://api.github.com/repos/{project['owner']}/{project['repo']}/readme", headers=headers)
+        response.raise_for_status()
+    except Exception as e:
+        print(f"Error fetching README for {agent.type}: {e}")
+        return
+
+    directory = os.path.join(KNOWLEDGE_DOCS_DIR, agent.type)
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, "README.md"), "w") as f:
+        f.write(response.text)
+    print(f"✅ Fetched README for {agent.type} ({len(response.text)} bytes)")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fetch-readme", action="store_true", help="download each project's README first")
+    parser.add_argument("--query", default="", help="show the chunks retrieved for a sample query")
+    args = parser.parse_args()
+
+    for agent_type, agent in load_agents().items():
+        if args.fetch_readme:
+            fetch_readme(agent)
+
+        chunks = knowledge_chunks(agent_type, agent.project_info)
+        index = load_or_build_index(agent_type, chunks)
+        if not index:
+            print(f"⚠️  {agent_type}: no documents, retrieval stays off")
+            continue
+
+        full_size = sum(len(chunk) for chunk in chunks)
+        print(f"✅ {agent_type}: {index.doc_count} chunks, {full_size / 1024:.1f} KiB of knowledge -> {index.path}")
+        if args.query:
+            retrieved = agent.get_knowledge_context(args.query)
+            print(f"   top-k context for {args.query!r}: {len(retrieved)} chars ({len(retrieved) / max(full_size, 1):.0%} of all knowledge)")
+
+if __name__ == "__main__":
+    main()
@@ -54,8 +54,8 @@ else
 fi
 
 # Check API endpoints
-echo -e "\n${YELLOW}Checking API endpoints in serve.py...${RESET}"
-grep -n "mount.*api" src/api/serve.py || echo -e "${RED}No API endpoints found in serve.py${RESET}"
+echo -e "\n${YELLOW}Checking API routers in the app factory...${RESET}"
+grep -n "include_router" backend_deploy/src/api/app.py || echo -e "${RED}No API routers found in backend_deploy/src/api/app.py${RESET}"
 
 echo -e "\n${GREEN}Cleanup complete!${RESET}"
 echo -e "${BOLD}Next steps:${RESET}"
@@ -1,12 +1,34 @@
 #!/usr/bin/env python3
+"""Deploy the SwarmNode agents listed in scripts/swarmnode_agents.json.
+
+Deploys are idempotent: existing agents are diffed against the manifest by
+content hash, unchanged agents are skipped, changed ones are updated in
+place and missing ones are created, all concurrently.
+
+Before upload each agent is packaged: unused code is shaken out of the
+script and requirements are cut down to what it imports (cached by hash).
+--pin also pins unpinned requirements to the versions installed locally.
+
+Usage:
+    python scripts/deploy_swarmnode.py [--manifest scripts/swarmnode_agents.json] [--dry-run] [--prune] [--no-package] [--pin]
+"""
 import os
 import sys
 import json
-import requests
+import time
+import asyncio
+import argparse
+
+# Make the backend package importable when running from the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend_deploy", "src"))
+
+from swarm.client import AsyncSwarmNodeClient
+from swarm.deploy import AgentSpec, SwarmNodeDeployer
+from swarm.packaging import build_package
 
-# Initialize SwarmNode
-import swarmnode
-from swarmnode import Agent
+DEFAULT_MANIFEST = os.path.join(os.path.dirname(os.path.abspath(__file__)), "swarmnode_agents.json")
+
+ACTION_ICONS = {"create": "🆕", "update": "🔄", "unchanged": "✅", "delete": "🗑️"}
 
 def check_env_vars():
     """Check if required environment variables are set."""
@@ -20,97 +42,43 @@ def check_env_vars():
     
     print("✅ Environment variables are set.")
 
-def create_store():
-    """Create a new SwarmNode store."""
-    print("Creating SwarmNode store...")
-    
-    # Set the API key
-    swarmnode.api_key = os.environ.get("SWARMNODE_API_KEY")
-    
-    # Create a store using direct API call (since Store is not exposed in the SDK)
-    try:
-        response = requests.post(
-            "https://api.swarmnode.ai/v1/stores/create/",
-            headers={
-                "Authorization": f"Bearer {os.environ.get('SWARMNODE_API_KEY')}",
-                "Content-Type": "application/json"
-            },
-            json={"name": "Mammothon Agent Store"}
-        )
-        
-        # HTTP 201 Created is a success
-        if response.status_code not in [200, 201]:
-            print(f"Error creating store: {response.status_code}")
-            print(response.text)
-            sys.exit(1)
-        
-        store_data = response.json()
-        store_id = store_data.get("id")
-        
-        if not store_id:
-            print("Error: Store ID not found in response.")
-            sys.exit(1)
-        
-        print(f"✅ Store created with ID: {store_id}")
-        return store_id
-    except Exception as e:
-        print(f"Error creating store: {e}")
-        sys.exit(1)
+def load_specs(manifest_file):
+    """Read the desired agents from the manifest (file paths are relative to the working directory)."""
+    with open(manifest_file, "r") as f:
+        return [AgentSpec.from_manifest(entry) for entry in json.load(f)]
 
-def create_agent(store_id):
-    """Create a new SwarmNode agent."""
-    print("Creating SwarmNode agent...")
-    
-    # Read the agent script
-    with open("swarmnode_agent.py", "r") as f:
-        script_content = f.read()
-    
-    # Read the requirements file
-    with open("swarmnode_requirements.txt", "r") as f:
-        requirements = f.read()
-    
-    # Create the agent using direct API call to include store_id
+def package_specs(specs, manifest_file, pin=False):
+    """Replace each spec's script and requirements with its built package and report the savings."""
+    with open(manifest_file, "r") as f:
+        entries = {entry["name"]: entry for entry in json.load(f)}
+    
+    print("\nPackaging agents...")
+    for spec in specs:
+        package = build_package(spec.script, spec.requirements, keep=entries[spec.name].get("keep", ["main"]), pin=pin)
+        before, after = package.report["before"], package.report["after"]
+        print(f"📦 {spec.name}{' (cached)' if package.cached else ''}")
+        print(f"   script: {before['script_bytes']:,} -> {after['script_bytes']:,} bytes, "
+              f"requirements: {before['requirements']} -> {after['requirements']}")
+        print(f"   install: {before['installed_packages']} -> {after['installed_packages']} packages, "
+              f"{before['install_bytes'] / 1e6:.1f} -> {after['install_bytes'] / 1e6:.1f} MB, "
+              f"~{before['estimated_install_seconds']}s -> ~{after['estimated_install_seconds']}s cold start")
+        spec.script, spec.requirements = package.script, package.requirements
+
+async def deploy(specs, prune, dry_run):
+    client = AsyncSwarmNodeClient()
     try:
-        response = requests.post(
-            "https://api.swarmnode.ai/v1/agents/create/",
-            headers={
-                "Authorization": f"Bearer {os.environ.get('SWARMNODE_API_KEY')}",
-                "Content-Type": "application/json"
-            },
-            json={
-                "name": "Mammothon Agent Swarm API",
-                "script": script_content,
-                "requirements": requirements,
-                "env_vars": f"OPENAI_API_KEY={os.environ.get('OPENAI_API_KEY')}",
-                "python_version": "3.9",
-                "store_id": store_id
-            }
-        )
-        
-        # HTTP 201 Created is a success
-        if response.status_code not in [200, 201]:
-            print(f"Error creating agent: {response.status_code}")
-            print(response.text)
-            sys.exit(1)
-        
-        agent_data = response.json()
-        agent_id = agent_data.get("id")
-        
-        if not agent_id:
-            print("Error: Agent ID not found in response.")
-            sys.exit(1)
-        
-        print(f"✅ Agent created with ID: {agent_id}")
-        return agent_id
-    except Exception as e:
-        print(f"Error creating agent: {e}")
-        sys.exit(1)
+        return await SwarmNodeDeployer(client).deploy(specs, prune=prune, dry_run=dry_run)
+    finally:
+        await client.aclose()
 
 def update_frontend_config(agent_id):
     """Update the frontend configuration with the agent ID."""
     print("Updating frontend configuration...")
     
     config_file = "frontend/src/lib/config.ts"
+    if not os.path.exists(config_file):
+        print(f"Skipping frontend configuration: {config_file} not found")
+        return
     
     # Read the current config
     with open(config_file, "r") as f:
@@ -126,32 +94,57 @@ def update_frontend_config(agent_id):
     print(f"✅ Updated {config_file} with agent ID: {agent_id}")
 
 def main():
-    """Main function to deploy the SwarmNode agent."""
+    """Main function to deploy the SwarmNode agents."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--manifest", default=DEFAULT_MANIFEST)
+    parser.add_argument("--dry-run", action="store_true", help="show the plan without changing anything")
+    parser.add_argument("--prune", action="store_true", help="delete older duplicates of manifest agents")
+    parser.add_argument("--no-package", action="store_true", help="upload scripts and requirements as they are")
+    parser.add_argument("--pin", action="store_true", help="pin unpinned requirements to the locally installed versions")
+    args = parser.parse_args()
+
     print("Mammothon Agent Swarm - SwarmNode Deployment")
     print("============================================")
     
     # Check environment variables
     check_env_vars()
     
-    # Create a store
-    store_id = create_store()
+    specs = load_specs(args.manifest)
+    if not args.no_package:
+        package_specs(specs, args.manifest, args.pin)
     
-    # Create the agent with the store ID
-    agent_id = create_agent(store_id)
+    start = time.perf_counter()
+    actions = asyncio.run(deploy(specs, args.prune, args.dry_run))
+    elapsed = time.perf_counter() - start
     
-    # Update the frontend config
-    update_frontend_config(agent_id)
+    for action in actions:
+        status = f"❌ {action.error}" if action.error else (action.agent_id or "")
+        print(f"{ACTION_ICONS.get(action.action, '')} {action.action:<9} {action.name:<40} {status}")
+    print(f"\n{'Planned' if args.dry_run else 'Deployed'} {len(actions)} agent(s) in {elapsed:.1f}s")
     
-    # Print next steps
-    print("\nDeployment complete!")
-    print(f"API URL: https://api.swarmnode.ai/v1/agent/execute/{agent_id}")
-    print("\nNext steps:")
-    print("1. Build and deploy your frontend")
-    print("2. Test the API by sending a request to the health endpoint:")
-    print(f"   curl -X POST https://api.swarmnode.ai/v1/agent/execute/{agent_id} \\")
-    print("     -H 'Content-Type: application/json' \\")
-    print("     -d '{\"payload\": {\"endpoint\": \"/health\", \"method\": \"GET\"}}'")
-    print("\nFor more information, see SWARMNODE_README.md")
+    failed = [action for action in actions if action.error]
+    if failed:
+        print(f"Error: {len(failed)} action(s) failed")
+        sys.exit(1)
+    if args.dry_run:
+        return
+    
+    # Point the frontend at the primary agent once it exists
+    primary = next((action for action in actions if action.name == specs[0].name and action.action != "delete"), None)
+    if primary and primary.agent_id:
+        update_frontend_config(primary.agent_id)
+        agent_id = primary.agent_id
+    
+        # Print next steps
+        print("\nDeployment complete!")
+        print(f"API URL: https://api.swarmnode.ai/v1/agent/execute/{agent_id}")
+        print("\nNext steps:")
+        print("1. Build and deploy your frontend")
+        print("2. Test the API by sending a request to the health endpoint:")
+        print(f"   curl -X POST https://api.swarmnode.ai/v1/agent/execute/{agent_id} \\")
+        print("     -H 'Content-Type: application/json' \\")
+        print("     -d '{\"payload\": {\"endpoint\": \"/health\", \"method\": \"GET\"}}'")
+        print("\nFor more information, see SWARMNODE_README.md")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
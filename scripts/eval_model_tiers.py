@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""Offline evaluation of model tiering on chat transcripts.
+
+Replays every user turn of the transcripts through the agents' real
+prompt building and model routing, with a stand-in provider that answers
+with the transcript's reply (cut at the tier's output token cap).
+Each routing mode is replayed in turn: "large" (every chat on the large
+model, as before tiering), "fast" and "auto". For each, it estimates
+latency and cost per chat from the prompt and answer sizes and the
+per-model figures in MODEL_COSTS, and counts answers the token cap would
+have cut short.
+
+Transcripts are a JSON list of {"agent": <type>, "messages": [...]} in
+the chat API's message format, with the assistant replies. The default,
+scripts/model_tier_transcripts.json, is a small synthetic sample written
+by hand, not recorded traffic: it exercises every routing rule, but the
+figures it gives are illustrative. Pass real chat logs with --transcripts
+for numbers that reflect production.
+
+Usage:
+    python scripts/eval_model_tiers.py [--provider gemini] [--transcripts scripts/model_tier_transcripts.json]
+"""
+import io
+import os
+import sys
+import json
+import argparse
+import contextlib
+from typing import List, Dict, Any
+
+# Make the backend package and the provider stand-ins importable when running from the repo root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "backend_deploy", "src"))
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+from fake_providers import install
+from agents.base_agent import Message
+from agents.agent_factory import load_agents
+from agents.model_router import model_router, TIERS
+
+# Hand-written synthetic conversations replayed by default
+TRANSCRIPTS_FILE = os.path.join(ROOT, "scripts", "model_tier_transcripts.json")
+
+# Per model: USD per million input and output tokens, seconds to first token, output tokens per second.
+# List prices and typical throughput; adjust to your account and region.
+MODEL_COSTS = {
+    "gemini-1.5-flash": {"input": 0.075, "output": 0.30, "first_token": 0.35, "tokens_per_second": 180},
+    "gemini-1.5-pro": {"input": 1.25, "output": 5.00, "first_token": 0.90, "tokens_per_second": 60},
+    "gpt-4o-mini": {"input": 0.15, "output": 0.60, "first_token": 0.45, "tokens_per_second": 90},
+    "gpt-4": {"input": 30.00, "output": 60.00, "first_token": 0.80, "tokens_per_second": 25},
+}
+
+# Routing modes compared, the first being the pre-tiering behaviour
+MODES = ("large", "fast", "auto")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count: about four characters per token for English text."""
+    return max(1, round(len(text) / 4))
+
+
+class ReplayProvider:
+    """Stand-in Gemini and OpenAI that answer with a queued transcript reply.
+
+    Records the model, prompt size and output cap of every call, and cuts
+    the reply at the cap like the real provider would.
+    """
+
+    def __init__(self):
+        self.reply = ""
+        self.calls: List[Dict[str, Any]] = []
+
+    def _answer(self, model: str, prompt: str, max_tokens: int) -> str:
+        reply_tokens = estimate_tokens(self.reply)
+        self.calls.append({
+            "model": model,
+            "input_tokens": estimate_tokens(prompt),
+            "output_tokens": min(reply_tokens, max_tokens),
+            "truncated": reply_tokens > max_tokens,
+        })
+        return self.reply[:max_tokens * 4]
+
+    def GenerativeModel(self, model_name):
+        provider = self
+
+        class Model:
+            def generate_content(self, prompt, stream=False, generation_config=None, **kwargs):
+                text = provider._answer(model_name, prompt, generation_config["max_output_tokens"])
+                chunk = type("Chunk", (), {"text": text})()
+                return [chunk] if stream else chunk
+
+        return Model()
+
+    def __call__(self, api_key=None, model=None, max_tokens=None, **kwargs):
+        provider = self
+
+        class Chat:
+            def stream(self, messages):
+                prompt = "\n".join(message.content for message in messages)
+                return [type("Chunk", (), {"content": provider._answer(model, prompt, max_tokens)})()]
+
+        return Chat()
+
+
+def chat_cost(call: Dict[str, Any]) -> Dict[str, float]:
+    costs = MODEL_COSTS[call["model"]]
+    return {
+        "latency": costs["first_token"] + call["output_tokens"] / costs["tokens_per_second"],
+        "cost": (call["input_tokens"] * costs["input"] + call["output_tokens"] * costs["output"]) / 1e6,
+    }
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))] if ordered else 0.0
+
+
+def replay(transcripts: List[Dict[str, Any]], provider_name: str, mode: str) -> List[Dict[str, Any]]:
+    """Replay every user turn with the router in `mode`; returns one record per chat."""
+    agents = load_agents()
+    provider = ReplayProvider()
+    saved_mode = model_router.mode
+    model_router.mode = mode
+    try:
+        with install(gemini=provider, openai=provider), contextlib.redirect_stdout(io.StringIO()):
+            for transcript in transcripts:
+                agent = agents[transcript["agent"]]
+                messages = [Message(**message) for message in transcript["messages"]]
+                for i, message in enumerate(messages):
+                    if message.role != "assistant":
+                        continue
+                    provider.reply = message.content
+                    agent.get_chat_response(messages[:i], provider_name)
+    finally:
+        model_router.mode = saved_mode
+
+    tiers = {tier.model: tier.name for tier in TIERS[provider_name].values()}
+    return [{**call, **chat_cost(call), "tier": tiers[call["model"]]} for call in provider.calls]
+
+
+def summarize(chats: List[Dict[str, Any]]) -> Dict[str, Any]:
+    latencies = [chat["latency"] for chat in chats]
+    return {
+        "chats": len(chats),
+        "fast_share": round(sum(chat["tier"] == "fast" for chat in chats) / len(chats), 3) if chats else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000),
+        "p95_ms": round(percentile(latencies, 95) * 1000),
+        "usd_per_1k_chats": round(sum(chat["cost"] for chat in chats) / len(chats) * 1000, 3) if chats else 0.0,
+        "truncated": sum(chat["truncated"] for chat in chats),
+    }
+
+
+def evaluate(transcripts: List[Dict[str, Any]], provider_name: str = "gemini") -> Dict[str, Any]:
+    """Summary per routing mode, plus per tier for the "auto" mode."""
+    report = {"provider": provider_name, "modes": {}, "auto_tiers": {}}
+    for mode in MODES:
+        chats = replay(transcripts, provider_name, mode)
+        report["modes"][mode] = summarize(chats)
+        if mode == "auto":
+            for tier in ("fast", "large"):
+                report["auto_tiers"][tier] = summarize([chat for chat in chats if chat["tier"] == tier])
+    return report
+
+
+def print_report(report: Dict[str, Any]):
+    header = f"{'':<12} {'chats':>6} {'fast':>6} {'p50 ms':>8} {'p95 ms':>8} {'$/1k chats':>11} {'cut short':>10}"
+    print(f"Provider: {report['provider']}")
+    print(header)
+    rows = [(f"mode {mode}", summary) for mode, summary in report["modes"].items()]
+    rows += [(f"  auto {tier}", summary) for tier, summary in report["auto_tiers"].items()]
+    for label, s in rows:
+        print(f"{label:<12} {s['chats']:>6} {s['fast_share']:>6.0%} {s['p50_ms']:>8} {s['p95_ms']:>8} "
+              f"{s['usd_per_1k_chats']:>11.3f} {s['truncated']:>10}")
+
+    large, auto = report["modes"]["large"], report["modes"]["auto"]
+    if large["usd_per_1k_chats"]:
+        saved = 1 - auto["usd_per_1k_chats"] / large["usd_per_1k_chats"]
+        print(f"\nauto vs large: {saved:.0%} cheaper, p50 {auto['p50_ms']} ms vs {large['p50_ms']} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--provider", choices=sorted(TIERS), default="gemini")
+    parser.add_argument("--transcripts", default=TRANSCRIPTS_FILE)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    with open(args.transcripts) as f:
+        transcripts = json.load(f)
+    report = evaluate(transcripts, args.provider)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
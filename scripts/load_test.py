@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""Offline load test of the agent chat API with fake LLM and GitHub providers.
+
+Boots the app from api/serve.py in-process and drives multi-turn
+conversations through /agents/{name}/chat, first one agent at a time and
+then all agents at once. Gemini, OpenAI and GitHub are replaced by the
+stand-ins from tests/fake_providers.py, with configurable latency, jitter
+and error rates. Reports requests/sec, p50/p95/p99 latency and peak
+Python memory (tracemalloc) for each agent.
+
+--check compares the report with the committed baseline and exits
+non-zero on a regression; --write-baseline records a new one.
+
+Usage:
+    python scripts/load_test.py [--conversations 24] [--turns 4] [--concurrency 16]
+                                [--llm-latency 0.05] [--llm-jitter 0.3] [--llm-errors 0.02]
+                                [--github-latency 0.05] [--github-errors 0.05]
+    python scripts/load_test.py --check
+    python scripts/load_test.py --write-baseline
+"""
+import io
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import itertools
+import tracemalloc
+import contextlib
+from typing import List, Dict, Any
+
+# Make the backend package and the provider stand-ins importable when running from the repo root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "backend_deploy", "src"))
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+# Visitors are told apart by X-Forwarded-For, as they are behind the Koyeb proxy
+os.environ.setdefault("TRUST_FORWARDED_FOR", "true")
+
+import httpx
+
+from fake_providers import LatencyModel, FakeGemini, FakeOpenAI, FakeGitHub, install
+
+# Committed results the --check run is compared with
+BASELINE_FILE = os.path.join(ROOT, "scripts", "load_test_baseline.json")
+
+# Questions a visitor asks, in roughly the order they ask them
+QUESTIONS = [
+    "What does this project do?",
+    "What makes it different from similar projects?",
+    "How active is development on GitHub lately?",
+    "How much MON is staked on it?",
+    "How can I contribute or fork it?",
+    "Who are the top builders?",
+]
+
+# Every conversation comes from its own visitor address, so per-client rate limits apply as in production
+VISITORS = itertools.count(1)
+
+# Metrics where a higher value is a regression, and where a lower one is
+HIGHER_IS_WORSE = ("p50_ms", "p95_ms", "p99_ms", "peak_memory_kb")
+LOWER_IS_WORSE = ("rps",)
+
+# Absolute slack on top of the tolerance, for metrics whose small values are noisy
+SLACK = {"peak_memory_kb": 1024}
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile of a list of numbers."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))]
+
+
+def conversation(turns: int, rng: random.Random) -> List[List[Dict[str, str]]]:
+    """Message lists for each turn of one conversation, history included."""
+    questions = QUESTIONS[:1] + rng.sample(QUESTIONS[1:], min(turns, len(QUESTIONS)) - 1)
+    messages, requests = [], []
+    for question in questions[:turns]:
+        messages = messages + [{"role": "user", "content": question}]
+        requests.append(messages)
+        messages = messages + [{"role": "assistant", "content": "Here is what I know about that."}]
+    return requests
+
+
+async def run_conversations(client: httpx.AsyncClient, agent_names: List[str], conversations: int, turns: int,
+                            concurrency: int, model_type: str = "gemini", seed: int = 0) -> Dict[str, Any]:
+    """Drive conversations round-robin over agents; returns per-agent latencies and status codes."""
+    rng = random.Random(seed)
+    semaphore = asyncio.Semaphore(concurrency)
+    results = {name: {"latencies": [], "statuses": {}} for name in agent_names}
+
+    async def talk(agent_name, turn_messages):
+        visitor = next(VISITORS)
+        headers = {"X-Forwarded-For": f"10.{visitor >> 16 & 255}.{visitor >> 8 & 255}.{visitor & 255}"}
+        async with semaphore:
+            for messages in turn_messages:
+                start = time.perf_counter()
+                response = await client.post(f"/agents/{agent_name}/chat", params={"model_type": model_type},
+                                             json={"messages": messages}, headers=headers)
+                result = results[agent_name]
+                result["latencies"].append(time.perf_counter() - start)
+                result["statuses"][response.status_code] = result["statuses"].get(response.status_code, 0) + 1
+
+    await asyncio.gather(*(talk(agent_names[i % len(agent_names)], conversation(turns, rng)) for i in range(conversations)))
+    return results
+
+
+def summarize(latencies: List[float], statuses: Dict[int, int], elapsed: float, peak_memory: int) -> Dict[str, Any]:
+    ms = [latency * 1000 for latency in latencies]
+    return {
+        "requests": len(latencies),
+        "errors": sum(count for status, count in statuses.items() if status >= 400 and status != 429),
+        "rejected": statuses.get(429, 0),
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(ms, 50), 1),
+        "p95_ms": round(percentile(ms, 95), 1),
+        "p99_ms": round(percentile(ms, 99), 1),
+        "peak_memory_kb": round(peak_memory / 1024),
+    }
+
+
+async def measure(client, agent_names, conversations, turns, concurrency, model_type, seed):
+    """Run one phase and summarize it per agent, with Python memory allocated during it."""
+    tracemalloc.reset_peak()
+    baseline_memory = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    results = await run_conversations(client, agent_names, conversations, turns, concurrency, model_type, seed)
+    elapsed = time.perf_counter() - start
+    peak_memory = tracemalloc.get_traced_memory()[1] - baseline_memory
+    return {name: summarize(result["latencies"], result["statuses"], elapsed, peak_memory)
+            for name, result in results.items()}, elapsed
+
+
+async def load_test(app, agent_names: List[str], conversations: int = 24, turns: int = 4, concurrency: int = 16,
+                    model_type: str = "gemini", seed: int = 0) -> Dict[str, Any]:
+    """Per-agent runs followed by a mixed run over every agent."""
+    report = {"agents": {}}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://load-test", timeout=None) as client:
+        # Open knowledge indexes and the GitHub snapshot before measuring (the first turn is a scripted greeting)
+        await run_conversations(client, agent_names, len(agent_names), 2, concurrency, model_type, seed)
+
+        for name in agent_names:
+            summary, _ = await measure(client, [name], conversations, turns, concurrency, model_type, seed)
+            report["agents"][name] = summary[name]
+
+        summary, elapsed = await measure(client, agent_names, conversations * len(agent_names), turns,
+                                         concurrency, model_type, seed)
+        results = list(summary.values())
+        mixed = {
+            "requests": sum(result["requests"] for result in results),
+            "errors": sum(result["errors"] for result in results),
+            "rejected": sum(result["rejected"] for result in results),
+        }
+        mixed["rps"] = round(mixed["requests"] / elapsed, 1)
+        for metric in ("p50_ms", "p95_ms", "p99_ms", "peak_memory_kb"):
+            mixed[metric] = max(result[metric] for result in results)
+        report["mixed"] = mixed
+    return report
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Regressions of the report against a baseline, beyond a relative tolerance."""
+    regressions = []
+    rows = [(f"agents.{name}", result, baseline.get("agents", {}).get(name)) for name, result in report["agents"].items()]
+    rows.append(("mixed", report["mixed"], baseline.get("mixed")))
+    for label, result, expected in rows:
+        if not expected:
+            continue
+        for metric in HIGHER_IS_WORSE:
+            if expected.get(metric) and result[metric] > expected[metric] * (1 + tolerance) + SLACK.get(metric, 0):
+                regressions.append(f"{label} {metric}: {result[metric]} > {expected[metric]} baseline")
+        for metric in LOWER_IS_WORSE:
+            if expected.get(metric) and result[metric] < expected[metric] * (1 - tolerance):
+                regressions.append(f"{label} {metric}: {result[metric]} < {expected[metric]} baseline")
+        if result["errors"] > expected.get("errors", 0) + max(2, expected.get("errors", 0) * tolerance):
+            regressions.append(f"{label} errors: {result['errors']} > {expected.get('errors', 0)} baseline")
+    return regressions
+
+
+def print_report(report: Dict[str, Any]):
+    print(f"{'agent':<12} {'requests':>8} {'errors':>6} {'429s':>6} {'rps':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'peak KB':>8}")
+    for name, result in list(report["agents"].items()) + [("(mixed)", report["mixed"])]:
+        print(f"{name:<12} {result['requests']:>8} {result['errors']:>6} {result['rejected']:>6} {result['rps']:>8.1f} {result['p50_ms']:>8.1f}"
+              f" {result['p95_ms']:>8.1f} {result['p99_ms']:>8.1f} {result['peak_memory_kb']:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--conversations", type=int, default=24, help="conversations per agent")
+    parser.add_argument("--turns", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=16, help="conversations in progress at once")
+    parser.add_argument("--model-type", default="gemini", choices=("gemini", "openai"))
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="median seconds per LLM call")
+    parser.add_argument("--llm-jitter", type=float, default=0.3)
+    parser.add_argument("--llm-errors", type=float, default=0.02, help="fraction of failing LLM calls")
+    parser.add_argument("--github-latency", type=float, default=0.05, help="median seconds per GitHub request")
+    parser.add_argument("--github-errors", type=float, default=0.05)
+    parser.add_argument("--check", action="store_true", help="compare with the committed baseline")
+    parser.add_argument("--write-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="allowed relative regression for --check")
+    args = parser.parse_args()
+
+    config = {key: value for key, value in vars(args).items() if key not in ("check", "write_baseline", "tolerance")}
+    llm = LatencyModel(args.llm_latency, args.llm_jitter, args.llm_errors, seed=1)
+    github = FakeGitHub(LatencyModel(args.github_latency, args.llm_jitter, args.github_errors, seed=2))
+
+    tracemalloc.start()
+    # Agent code prints every prompt; keep the report readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        from api.serve import app
+        from api.agent_router import agents
+        with install(FakeGemini(llm), FakeOpenAI(llm), github, github_interval=1):
+            report = asyncio.run(load_test(app, sorted(agents), args.conversations, args.turns,
+                                           args.concurrency, args.model_type))
+    tracemalloc.stop()
+
+    print(f"Load test ({args.conversations} conversations x {args.turns} turns per agent, {args.concurrency} concurrent,"
+          f" LLM {args.llm_latency * 1000:.0f} ms / {args.llm_errors:.0%} errors)")
+    print("=" * 78)
+    print_report(report)
+
+    if args.write_baseline:
+        with open(BASELINE_FILE, "w") as f:
+            json.dump({"config": config, **report}, f, indent=2)
+            f.write("\n")
+        print(f"Wrote baseline to {os.path.relpath(BASELINE_FILE, ROOT)}")
+
+    if args.check:
+        with open(BASELINE_FILE, "r") as f:
+            baseline = json.load(f)
+        if baseline.get("config") != config:
+            print("⚠️  Options differ from the baseline's; comparing anyway")
+        regressions = compare(report, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"❌ {regression}")
+        if regressions:
+            sys.exit(1)
+        print("✅ No regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Measure the share of LLM calls that scripted greetings eliminate.
+
+Replays conversations the way the chat UI sends them (every turn
+posts the whole history so far) through the agents, once with scripted
+greetings disabled and once with them enabled, and counts the calls that
+reach the LLM provider (a stand-in, so nothing is spent). Transcripts use
+the same format as scripts/model_tier_transcripts.json, the default, which
+is a hand-written synthetic sample rather than recorded traffic.
+
+Usage:
+    python scripts/measure_scripted_greetings.py [--transcripts scripts/model_tier_transcripts.json]
+"""
+import io
+import os
+import sys
+import json
+import argparse
+import contextlib
+from typing import List, Dict, Any
+
+# Make the backend package and the provider stand-ins importable when running from the repo root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "backend_deploy", "src"))
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+from fake_providers import FakeGemini, install
+from agents.base_agent import ChatRequest, Message
+from agents.agent_factory import load_agents
+
+# Hand-written synthetic conversations replayed by default
+TRANSCRIPTS_FILE = os.path.join(ROOT, "scripts", "model_tier_transcripts.json")
+
+
+def chat_requests(transcripts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """One chat request per user turn, each carrying the conversation so far."""
+    requests = []
+    for transcript in transcripts:
+        messages = [Message(**message) for message in transcript["messages"]]
+        for i, message in enumerate(messages):
+            if message.role == "user":
+                requests.append({"agent": transcript["agent"], "request": ChatRequest(messages=messages[:i + 1])})
+    return requests
+
+
+def llm_calls(requests: List[Dict[str, Any]], greetings: bool) -> Dict[str, int]:
+    """LLM calls per agent when replaying `requests`, with or without scripted greetings."""
+    agents = load_agents()
+    if not greetings:
+        for agent in agents.values():
+            agent.greeting = None
+
+    calls = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for item in requests:
+            gemini = FakeGemini()
+            with install(gemini=gemini):
+                agents[item["agent"]].process_chat_request(item["request"])
+            calls[item["agent"]] = calls.get(item["agent"], 0) + gemini.calls
+    return calls
+
+
+def measure(transcripts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Requests, LLM calls without and with greetings, and the share eliminated, per agent and in total."""
+    requests = chat_requests(transcripts)
+    before, after = llm_calls(requests, greetings=False), llm_calls(requests, greetings=True)
+    report = {}
+    for name in sorted(before):
+        report[name] = {
+            "requests": sum(item["agent"] == name for item in requests),
+            "llm_calls_before": before[name],
+            "llm_calls_after": after.get(name, 0),
+        }
+    report["total"] = {key: sum(row[key] for row in report.values()) for key in ("requests", "llm_calls_before", "llm_calls_after")}
+    for row in report.values():
+        row["eliminated"] = round(1 - row["llm_calls_after"] / row["llm_calls_before"], 3) if row["llm_calls_before"] else 0.0
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transcripts", default=TRANSCRIPTS_FILE)
+    args = parser.parse_args()
+
+    with open(args.transcripts) as f:
+        report = measure(json.load(f))
+
+    print(f"{'agent':<12} {'requests':>8} {'LLM calls before':>17} {'after':>6} {'eliminated':>11}")
+    for name, row in report.items():
+        print(f"{name:<12} {row['requests']:>8} {row['llm_calls_before']:>17} {row['llm_calls_after']:>6} {row['eliminated']:>11.0%}")
+
+
+if __name__ == "__main__":
+    main()
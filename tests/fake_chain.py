@@ -0,0 +1,171 @@
+"""Local dev-chain stand-in for the chain tests.
+
+Speaks enough Ethereum JSON-RPC over a fake ``requests`` session for the
+backend's chain client: eth_blockNumber, eth_getLogs, eth_getBlockByNumber,
+eth_call against the ProjectStaking views (directly or through Multicall3)
+and JSON-RPC batches. It can also reorg, cap getLogs ranges and results like
+public providers do, and add per-request latency.
+"""
+import os
+import sys
+import time
+
+# Make the backend package importable when running from the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend_deploy", "src"))
+
+from chain.abi import encode, decode, event_topic, keccak256, function_selector, hex_to_bytes, parse_signature
+from chain.multicall import VIEW_RETURNS, MULTICALL3_ADDRESS
+from chain.contracts import EVENTS, BUILDER_NFT_ADDRESS, PROJECT_STAKING_ADDRESS
+
+EVENT_ADDRESSES = {"BuilderNFTMinted": BUILDER_NFT_ADDRESS}
+
+class FakeResponse:
+    def __init__(self, data):
+        self._data = data
+        self.status_code = 200
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        pass
+
+class FakeChain:
+    """In-memory chain: blocks are mined on demand and hold contract logs."""
+
+    def __init__(self, head=100, max_logs=None, max_range=None, latency=0.0):
+        self.head = head
+        self.logs = []
+        self.requests = []
+        self.forks = {}
+        self.block_log_counts = {}
+        self.max_logs = max_logs
+        self.max_range = max_range
+        self.latency = latency
+        self.projects = {}
+        self.builder_nfts = {}
+        self.project_nfts = {}
+
+    def add_project(self, project_id, name, total_staked=0, stakers_count=0):
+        self.projects[project_id] = [project_id, name, total_staked, stakers_count, True]
+        self.project_nfts.setdefault(project_id, [])
+
+    def add_builder_nft(self, token_id, github_username, repo_name, project_id, total_staked=0, stakers_count=0):
+        self.builder_nfts[token_id] = [token_id, github_username, repo_name, total_staked, stakers_count]
+        self.project_nfts.setdefault(project_id, []).append(token_id)
+
+    def view(self, data):
+        """Run a ProjectStaking view call and return its ABI-encoded result."""
+        selectors = {function_selector(sig): sig for sig in VIEW_RETURNS}
+        signature = selectors.get(data[:4])
+        if not signature:
+            raise ValueError("execution reverted: unknown function")
+        args = decode(parse_signature(signature)[1], data[4:])
+        if signature == "getAllProjectIds()":
+            values = [list(self.projects)]
+        elif signature == "getAllBuilderNFTIds()":
+            values = [list(self.builder_nfts)]
+        elif signature == "getProject(string)":
+            if args[0] not in self.projects:
+                raise ValueError("execution reverted: project not found")
+            values = self.projects[args[0]]
+        elif signature == "getBuilderNFTsByProject(string)":
+            values = [self.project_nfts.get(args[0], [])]
+        else:
+            values = self.builder_nfts.get(args[0], [0, "", "", 0, 0])
+        return encode(VIEW_RETURNS[signature], values)
+
+    def multicall(self, data):
+        calls = decode(["(address,bool,bytes)[]"], data[4:])[0]
+        results = []
+        for _, allow_failure, call_data in calls:
+            try:
+                results.append((True, self.view(call_data)))
+            except ValueError:
+                if not allow_failure:
+                    raise
+                results.append((False, b""))
+        return encode(["(bool,bytes)[]"], [results])
+
+    def block_hash(self, number):
+        return "0x" + keccak256(f"{self.forks.get(number, 0)}:{number}".encode()).hex()
+
+    def mine(self, count=1):
+        self.head += count
+        return self.head
+
+    def reorg(self, depth):
+        """Replace the last `depth` blocks with empty ones on a new fork."""
+        first = self.head - depth + 1
+        for number in range(first, self.head + 1):
+            self.forks[number] = self.forks.get(number, 0) + 1
+        self.logs = [log for log in self.logs if int(log["blockNumber"], 16) < first]
+        for number in range(first, self.head + 1):
+            self.block_log_counts.pop(number, None)
+
+    def emit(self, event, block=None, **args):
+        """Add a log for one of the followed events, in a new block by default."""
+        block = block if block is not None else self.mine()
+        fields = EVENTS[event]
+        signature = f"{event}({','.join(t for _, t, _ in fields)})"
+        topics = [event_topic(signature)] + [
+            "0x" + encode([abi_type], [args[field]]).hex() for field, abi_type, indexed in fields if indexed
+        ]
+        data = encode([t for _, t, indexed in fields if not indexed], [args[f] for f, _, indexed in fields if not indexed])
+        log_index = self.block_log_counts.get(block, 0)
+        self.block_log_counts[block] = log_index + 1
+        self.logs.append({
+            "address": EVENT_ADDRESSES.get(event, PROJECT_STAKING_ADDRESS),
+            "topics": topics,
+            "data": "0x" + data.hex(),
+            "blockNumber": hex(block),
+            "blockHash": self.block_hash(block),
+            "transactionHash": "0x" + keccak256(f"tx{len(self.logs)}".encode()).hex(),
+            "logIndex": hex(log_index)
+        })
+        return block
+
+    def handle(self, method, params):
+        if method == "eth_blockNumber":
+            return hex(self.head)
+        if method == "eth_getBlockByNumber":
+            number = int(params[0], 16)
+            return {"number": hex(number), "hash": self.block_hash(number)} if number <= self.head else None
+        if method == "eth_getLogs":
+            log_filter = params[0]
+            from_block, to_block = int(log_filter["fromBlock"], 16), int(log_filter["toBlock"], 16)
+            if self.max_range and to_block - from_block + 1 > self.max_range:
+                raise ValueError(f"block range too large, maximum is {self.max_range}")
+            addresses = log_filter["address"] if isinstance(log_filter["address"], list) else [log_filter["address"]]
+            topics = (log_filter.get("topics") or [None])[0]
+            logs = [
+                log for log in self.logs
+                if from_block <= int(log["blockNumber"], 16) <= to_block
+                and log["address"] in addresses
+                and (topics is None or log["topics"][0] in topics)
+            ]
+            if self.max_logs and len(logs) > self.max_logs:
+                raise ValueError(f"query returned more than {self.max_logs} results")
+            return logs
+        if method == "eth_call":
+            call = params[0]
+            data = hex_to_bytes(call["data"])
+            if call["to"].lower() == MULTICALL3_ADDRESS.lower():
+                return "0x" + self.multicall(data).hex()
+            return "0x" + self.view(data).hex()
+        raise ValueError(f"Unsupported method {method}")
+
+    # requests.Session interface
+    def respond(self, request):
+        try:
+            return {"jsonrpc": "2.0", "id": request["id"], "result": self.handle(request["method"], request["params"])}
+        except ValueError as e:
+            return {"jsonrpc": "2.0", "id": request["id"], "error": {"code": -32000, "message": str(e)}}
+
+    def post(self, url, json=None, timeout=None):
+        self.requests.append(json)
+        if self.latency:
+            time.sleep(self.latency)
+        if isinstance(json, list):
+            return FakeResponse([self.respond(request) for request in json])
+        return FakeResponse(self.respond(json))
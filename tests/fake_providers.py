@@ -0,0 +1,190 @@
+"""Stand-in Gemini, OpenAI and GitHub providers for offline load tests.
+
+Each provider answers after a latency drawn from a ``LatencyModel`` and
+fails at a configurable rate, like the real service under load. ``install``
+swaps them into the agent code and the shared GitHub sync engine and
+restores the real ones on exit.
+"""
+import os
+import sys
+import math
+import time
+import random
+import tempfile
+import threading
+import contextlib
+
+# Make the backend package importable when running from the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend_deploy", "src"))
+
+from agents import base_agent
+from api.github_sync import sync_engine
+
+
+class ProviderError(Exception):
+    """A fake provider call failed."""
+
+
+class LatencyModel:
+    """Log-normal latency around a median, with a failure rate.
+
+    ``jitter`` is the sigma of the underlying normal distribution: 0 gives
+    a fixed latency, 0.5 a p99 about three times the median.
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0, seed: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample(self):
+        """Seconds the next call takes and whether it fails."""
+        with self._lock:
+            latency = self.latency * math.exp(self._random.gauss(0, self.jitter)) if self.jitter else self.latency
+            return latency, self._random.random() < self.error_rate
+
+    def wait(self, name: str):
+        latency, fails = self.sample()
+        time.sleep(latency)
+        if fails:
+            raise ProviderError(f"{name} failed after {latency:.3f}s")
+
+
+class FakeLLM:
+    """Generates `words` words in `chunks` streamed chunks.
+
+    The sampled latency is the time to generate the whole answer; streamed
+    answers spread it evenly over the chunks, and ``chunks_sent`` counts
+    what was actually generated, so a stream abandoned early costs less.
+    """
+
+    def __init__(self, model: LatencyModel = None, words: int = 60, chunks: int = 6):
+        self.model = model or LatencyModel()
+        self.words = words
+        self.chunks = chunks
+        self.calls = 0
+        self.chunks_sent = 0
+        self.models = []
+
+    def _text(self, words: int) -> str:
+        return " ".join(["word"] * words)
+
+    def generate(self, name: str) -> str:
+        self.calls += 1
+        self.model.wait(name)
+        self.chunks_sent += self.chunks
+        return self._text(self.words)
+
+    def stream(self, name: str):
+        self.calls += 1
+        latency, fails = self.model.sample()
+        if fails:
+            time.sleep(latency / self.chunks)
+            raise ProviderError(f"{name} stream failed")
+        per_chunk = self.words // self.chunks
+        for i in range(self.chunks):
+            time.sleep(latency / self.chunks)
+            self.chunks_sent += 1
+            yield self._text(per_chunk) + (" " if i < self.chunks - 1 else "")
+
+
+class FakeGemini(FakeLLM):
+    """Replaces ``google.generativeai`` as used by BaseAgent."""
+
+    def GenerativeModel(self, model_name):
+        fake = self
+        fake.models.append(model_name)
+
+        class Model:
+            def generate_content(self, prompt, stream=False, **kwargs):
+                if stream:
+                    return (type("Chunk", (), {"text": text})() for text in fake.stream("Gemini"))
+                return type("Response", (), {"text": fake.generate("Gemini")})()
+
+        return Model()
+
+
+class FakeOpenAI(FakeLLM):
+    """Replaces ``ChatOpenAI`` as used by BaseAgent."""
+
+    def __call__(self, api_key=None, model=None, **kwargs):
+        fake = self
+        fake.models.append(model)
+
+        class Chat:
+            def invoke(self, messages):
+                return type("Message", (), {"content": fake.generate("OpenAI")})()
+
+            def stream(self, messages):
+                return (type("Chunk", (), {"content": text})() for text in fake.stream("OpenAI"))
+
+        return Chat()
+
+
+class FakeGitHubResponse:
+    def __init__(self, status_code, data=None, headers=None):
+        self.status_code = status_code
+        self._data = data
+        self.headers = headers or {}
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise Exception(f"HTTP {self.status_code}")
+
+
+class FakeGitHub:
+    """Session serving canned repo, commit and fork responses with ETags."""
+
+    def __init__(self, model: LatencyModel = None):
+        self.model = model or LatencyModel()
+        self.calls = 0
+
+    def get(self, url, headers=None):
+        self.calls += 1
+        latency, fails = self.model.sample()
+        time.sleep(latency)
+        if fails:
+            return FakeGitHubResponse(502)
+        if (headers or {}).get("If-None-Match") == '"v1"':
+            return FakeGitHubResponse(304)
+        if "/commits" in url:
+            data = [{"sha": "a" * 40, "commit": {"message": "Ship it", "author": {"name": "alice", "date": "2025-02-01T00:00:00Z"}}}]
+        elif "/forks" in url:
+            data = [{"owner": {"login": "bob"}, "full_name": "bob/demo", "created_at": "2025-02-01T00:00:00Z", "html_url": "https://github.com/bob/demo"}]
+        else:
+            data = {"name": "demo", "stargazers_count": 3, "forks_count": 1, "watchers_count": 3, "open_issues_count": 0}
+        return FakeGitHubResponse(200, data, {"ETag": '"v1"'})
+
+
+@contextlib.contextmanager
+def install(gemini: FakeGemini = None, openai: FakeOpenAI = None, github: FakeGitHub = None, github_interval: int = 0):
+    """Route agent LLM calls and GitHub syncs to the fakes for the duration of the block.
+
+    ``github_interval`` is how long a synced snapshot is served before the
+    fake GitHub is asked again.
+    """
+    gemini, openai, github = gemini or FakeGemini(), openai or FakeOpenAI(), github or FakeGitHub()
+    patches = [
+        (base_agent, "genai", gemini),
+        (base_agent, "ChatOpenAI", openai),
+        (base_agent, "gemini_api_key", "fake-gemini-key"),
+        (base_agent, "openai_api_key", "fake-openai-key"),
+        (base_agent, "safety_settings", []),
+        (sync_engine, "session", github),
+        (sync_engine, "interval", github_interval),
+        (sync_engine, "state_file", os.path.join(tempfile.mkdtemp(), "github_sync_state.json")),
+        (sync_engine, "state", {}),
+    ]
+    saved = [(target, name, getattr(target, name, None)) for target, name, _ in patches]
+    for target, name, value in patches:
+        setattr(target, name, value)
+    try:
+        yield gemini, openai, github
+    finally:
+        for target, name, value in saved:
+            setattr(target, name, value)
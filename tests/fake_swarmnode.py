@@ -0,0 +1,121 @@
+"""Stand-in SwarmNode REST API for the SwarmNode client tests.
+
+Serves agent and store management, agent executor job creation and
+execution lookup through an ``httpx.MockTransport``. Executions finish a
+fixed time after their job is created; every request can be delayed by a
+fixed latency. Failures can be injected: refused connections, error
+responses before a request is handled, and creates that are applied but
+whose response is lost.
+"""
+import os
+import sys
+import json
+import time
+import uuid
+import asyncio
+
+import httpx
+
+# Make the backend package importable when running from the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend_deploy", "src"))
+
+from swarm.client import AsyncSwarmNodeClient
+
+class FakeSwarmNode:
+    """Stand-in SwarmNode API: executions finish `duration` seconds after their job is created."""
+
+    def __init__(self, duration=0.05, status="success", flaky=0, flaky_status=503, unreachable=0, lost=0,
+                 respond=None, latency=0.0):
+        self.duration = duration
+        self.latency = latency
+        self.agents = {}
+        self.stores = {}
+        self.requests = []
+        self.status = status
+        self.flaky = flaky
+        self.flaky_status = flaky_status
+        self.unreachable = unreachable
+        self.lost = lost
+        self.respond = respond or (lambda payload: {"echo": payload})
+        self.jobs = {}
+        self.running = 0
+        self.peak_running = 0
+
+    def execution(self, job_id):
+        job = self.jobs[job_id]
+        finished = time.monotonic() - job["created"] >= self.duration
+        if finished and not job["done"]:
+            job["done"] = True
+            self.running -= 1
+        return {
+            "id": f"exec-{job_id}", "agent_id": job["agent_id"], "agent_executor_job_id": job_id,
+            "status": self.status if finished else "in_progress",
+            "return_value": self.respond(job["payload"]) if finished else None
+        }
+
+    def add_agent(self, **fields):
+        agent_id = str(uuid.uuid4())
+        stamp = f"2025-01-01T00:00:{len(self.agents):02d}Z"
+        self.agents[agent_id] = {"id": agent_id, "created": stamp, "modified": stamp, "requirements": "",
+                                 "env_vars": "", "python_version": "3.9", **fields}
+        return self.agents[agent_id]
+
+    def page(self, items, request):
+        page, size = int(request.url.params.get("page", 1)), int(request.url.params.get("page_size", 10))
+        results = items[(page - 1) * size:page * size]
+        return {"total_count": len(items), "current_page": page, "previous": None,
+                "next": "more" if page * size < len(items) else None, "results": results}
+
+    async def handler(self, request):
+        if self.unreachable:
+            self.unreachable -= 1
+            raise httpx.ConnectError("connection refused", request=request)
+        self.requests.append((request.method, request.url.path))
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        response = self.handle(request)
+        if self.lost and request.method == "POST" and response.status_code == 201:
+            self.lost -= 1
+            return httpx.Response(502, json={"detail": "bad gateway"})
+        return response
+
+    def handle(self, request):
+        if self.flaky:
+            self.flaky -= 1
+            return httpx.Response(self.flaky_status, json={"detail": "try again"})
+        path = request.url.path
+        if request.method == "GET" and path == "/v1/agents/":
+            return httpx.Response(200, json=self.page(list(self.agents.values()), request))
+        if request.method == "POST" and path == "/v1/agents/create/":
+            return httpx.Response(201, json=self.add_agent(**json.loads(request.content)))
+        if request.method == "PATCH" and path.startswith("/v1/agents/") and path.endswith("/update/"):
+            agent = self.agents[path.split("/")[3]]
+            agent.update(json.loads(request.content), modified="2025-01-02T00:00:00Z")
+            return httpx.Response(200, json=agent)
+        if request.method == "DELETE" and path.endswith("/delete/"):
+            self.agents.pop(path.split("/")[3], None)
+            return httpx.Response(204)
+        if request.method == "GET" and path == "/v1/stores/":
+            return httpx.Response(200, json=self.page(list(self.stores.values()), request))
+        if request.method == "POST" and path == "/v1/stores/create/":
+            store_id = str(uuid.uuid4())
+            self.stores[store_id] = {"id": store_id, **json.loads(request.content)}
+            return httpx.Response(201, json=self.stores[store_id])
+        if request.method == "POST" and request.url.path == "/v1/agent-executor-jobs/create/":
+            data = json.loads(request.content)
+            job_id = str(uuid.uuid4())
+            self.jobs[job_id] = {"agent_id": data["agent_id"], "payload": data["payload"], "created": time.monotonic(), "done": False}
+            self.running += 1
+            self.peak_running = max(self.peak_running, self.running)
+            return httpx.Response(201, json={"id": job_id, "agent_id": data["agent_id"], "execution_address": job_id})
+        if request.method == "GET" and request.url.path == "/v1/executions/":
+            job_id = request.url.params["agent_executor_job_id"]
+            return httpx.Response(200, json={"next": None, "previous": None, "results": [self.execution(job_id)]})
+        return httpx.Response(404, json={"detail": "Not found"})
+
+    def client(self, **kwargs):
+        """AsyncSwarmNodeClient talking to this stand-in, polling quickly."""
+        http = httpx.AsyncClient(base_url="https://swarmnode.test/v1", transport=httpx.MockTransport(self.handler))
+        kwargs.setdefault("poll_initial", 0.01)
+        kwargs.setdefault("poll_max", 0.05)
+        return AsyncSwarmNodeClient(api_key="test", http=http, **kwargs)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+import os
+import sys
+import time
+import asyncio
+
+import httpx
+from fastapi.testclient import TestClient
+
+# Make the load-test harness importable when running from the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+
+from fake_providers import LatencyModel, FakeGemini, install
+from load_test import percentile
+from api import admission
+from api.admission import AdmissionController, AdmissionMiddleware, TokenBucket, client_address
+from api.agent_router import agents
+from api.app import create_app
+from swarm.dispatch import chat_dispatcher
+
+def chat_body():
+    return {"messages": [
+        {"role": "user", "content": "What does this project do?"},
+        {"role": "assistant", "content": "It helps builders ship."},
+        {"role": "user", "content": "How do I fork it?"}
+    ]}
+
+def test_token_bucket_allows_burst_then_rate():
+    bucket = TokenBucket(rate=2, burst=3, now=0)
+    for _ in range(3):
+        assert bucket.wait_time(0) == 0
+        bucket.take(0)
+    assert bucket.wait_time(0) == 0.5
+    assert bucket.wait_time(0.5) == 0
+
+def test_controller_checks_client_agent_and_provider():
+    controller = AdmissionController(client_rate=1, client_burst=2, agent_rate=1, agent_burst=3,
+                                     provider_limits={"gemini": 1})
+    assert controller.admit("a", "wooly", "gemini", now=0) == (True, 0.0)
+    # Provider cap: rejected without spending client or agent tokens
+    assert controller.admit("b", "wooly", "gemini", now=0) == (False, 1.0)
+    controller.release("gemini")
+    assert controller.admit("b", "wooly", "gemini", now=0)[0]
+    controller.release("gemini")
+    assert controller.admit("a", "wooly", "gemini", now=0)[0]
+    controller.release("gemini")
+    # Client "a" spent its burst; "c" is then stopped by the agent bucket
+    assert controller.admit("a", "vocafi", "gemini", now=0) == (False, 1.0)
+    assert controller.admit("c", "wooly", "gemini", now=0) == (False, 1.0)
+    assert controller.admit("c", "vocafi", "gemini", now=0)[0]
+    assert controller.stats == {"admitted": 4, "rejected_client": 1, "rejected_agent": 1, "rejected_provider": 1}
+
+def test_rejections_are_fast_429s_and_cheap_routes_are_never_throttled():
+    app = create_app("minimal")
+    controller = AdmissionController(client_rate=0.01, client_burst=1, provider_limits={"gemini": 10})
+    app.add_middleware(AdmissionMiddleware, controller=controller, agents={"wooly"})
+    client = TestClient(app)
+    with install():
+        assert client.post("/agents/wooly/chat", json=chat_body()).status_code == 200
+        rejected = client.post("/agents/wooly/chat", json=chat_body())
+    assert rejected.status_code == 429 and rejected.headers["Retry-After"] == "100"
+    assert rejected.json()["retry_after"] == 100
+    for _ in range(20):
+        assert client.get("/health").status_code == 200
+        assert client.get("/agents/wooly/info").status_code == 200
+    assert controller.in_flight == {"gemini": 0}
+
+def test_opening_turns_take_no_provider_slot():
+    app = create_app("minimal")
+    controller = AdmissionController(provider_limits={"gemini": 0})
+    app.add_middleware(AdmissionMiddleware, controller=controller, agents=agents)
+    client = TestClient(app)
+    gemini = FakeGemini()
+    with install(gemini=gemini):
+        # The provider is full, but the scripted greeting needs no LLM call
+        greeting = client.post("/agents/wooly/chat", json={"messages": [{"role": "user", "content": "Hi"}]})
+        follow_up = client.post("/agents/wooly/chat", json=chat_body())
+    assert greeting.status_code == 200 and greeting.json()["response"] == agents["wooly"].greeting
+    assert follow_up.status_code == 429 and gemini.calls == 0
+    assert controller.in_flight == {"gemini": 0}
+    assert controller.stats["admitted"] == 1 and controller.stats["rejected_provider"] == 1
+
+def test_forwarded_for_is_only_trusted_when_enabled(monkeypatch):
+    scope = {"client": ("203.0.113.9", 443), "headers": [(b"x-forwarded-for", b"1.2.3.4, 198.51.100.7")]}
+    monkeypatch.setattr(admission, "TRUST_FORWARDED_FOR", False)
+    assert client_address(scope) == "203.0.113.9"
+    monkeypatch.setattr(admission, "TRUST_FORWARDED_FOR", True)
+    assert client_address(scope) == "198.51.100.7"
+
+def test_p99_stays_bounded_under_overload(monkeypatch):
+    """200 simultaneous chats against 8 local slots: admitted requests still answer quickly."""
+    monkeypatch.setattr(admission, "TRUST_FORWARDED_FOR", True)
+    monkeypatch.setattr(chat_dispatcher, "max_concurrency", 8)
+    monkeypatch.setattr(chat_dispatcher, "swarm_agent_id", None)
+
+    async def burst(app, count=200):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            async def chat(i):
+                start = time.perf_counter()
+                response = await client.post("/agents/wooly/chat", json=chat_body(), headers={"X-Forwarded-For": f"10.0.{i // 256}.{i % 256}"})
+                return response.status_code, time.perf_counter() - start
+
+            async def health():
+                await asyncio.sleep(0.05)
+                start = time.perf_counter()
+                await client.get("/health")
+                return time.perf_counter() - start
+
+            results, health_latency = await asyncio.gather(asyncio.gather(*(chat(i) for i in range(count))), health())
+            return results, health_latency
+
+    async def run():
+        unlimited = await burst(create_app("minimal"))
+        limited_app = create_app("minimal")
+        limited_app.add_middleware(AdmissionMiddleware, controller=AdmissionController(provider_limits={"gemini": 16}))
+        limited = await burst(limited_app)
+        return unlimited, limited
+
+    with install(FakeGemini(LatencyModel(0.05))):
+        (unlimited, _), (limited, health_latency) = asyncio.run(run())
+
+    admitted = [latency for status, latency in limited if status == 200]
+    rejected = [latency for status, latency in limited if status == 429]
+    assert len(admitted) + len(rejected) == 200 and 16 <= len(admitted) < 50
+    # Without admission the last chats wait for 25 rounds of 8; with it at most a couple of rounds
+    assert percentile([latency for _, latency in unlimited], 99) > 1.0
+    assert percentile(admitted, 99) < 0.5
+    assert percentile(rejected, 99) < 0.2
+    assert health_latency < 0.1
+
+def main():
+    print("Admission Control Test")
+    print("======================")
+    for test in (test_token_bucket_allows_burst_then_rate, test_controller_checks_client_agent_and_provider,
+                 test_rejections_are_fast_429s_and_cheap_routes_are_never_throttled,
+                 test_opening_turns_take_no_provider_slot):
+        test()
+        print(f"✅ {test.__name__}")
+
+if __name__ == "__main__":
+    main()
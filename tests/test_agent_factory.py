@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+import os
+import sys
+import json
+import tempfile
+
+# Make the backend package importable when running from the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend_deploy", "src"))
+
+from agents.agent_factory import create_agent, load_agents
+
+def test_bundled_definitions_load():
+    """Every bundled agent definition builds an agent with a prompt."""
+    agents = load_agents()
+    assert set(agents) == {"vocafi", "wooly", "clarity", "hwc", "mammothon"}
+    for agent in agents.values():
+        assert agent.system_prompt
+        assert agent.name and agent.description
+
+def test_invalid_definitions_are_skipped():
+    """Definitions missing required fields or with bad JSON are skipped."""
+    directory = tempfile.mkdtemp()
+    with open(os.path.join(directory, "good.json"), "w") as f:
+        json.dump({"name": "Demo", "type": "demo", "description": "A demo", "system_prompt": "You are Demo."}, f)
+    with open(os.path.join(directory, "missing.json"), "w") as f:
+        json.dump({"name": "Broken", "type": "broken"}, f)
+    with open(os.path.join(directory, "bad.json"), "w") as f:
+        f.write("{not json")
+
+    agents = load_agents(directory)
+    assert list(agents) == ["demo"]
+    assert agents["demo"].project_info == {}
+
+def test_create_agent_requires_prompt():
+    try:
+        create_agent({"name": "Demo", "type": "demo", "description": "A demo"})
+    except ValueError as e:
+        assert "system_prompt" in str(e)
+    else:
+        raise AssertionError("Expected ValueError")
+
+def main():
+    print("Agent Factory Test")
+    print("==================")
+    for test in (test_bundled_definitions_load, test_invalid_definitions_are_skipped, test_create_agent_requires_prompt):
+        test()
+        print(f"✅ {test.__name__}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+import os
+import sys
+import tempfile
+from importlib import metadata
+
+# Make the backend package importable when running from the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend_deploy", "src"))
+
+from swarm.packaging import shake_script, imported_modules, slim_requirements, build_package
+
+SCRIPT = '''"""SwarmNode agent entry point."""
+import os
+import json
+import requests  # HTTP client
+from fastapi import FastAPI, HTTPException
+
+GREETING = "hello"
+
+def unused_helper():
+    """Never called."""
+    return FastAPI()
+
+def format_reply(text):
+    """Format a reply."""
+    return f"{GREETING}: {text}"
+
+class Unused:
+    pass
+
+def main(request, store):
+    """Handle a SwarmNode execution."""
+    return {"reply": format_reply(request["payload"]["text"]), "cwd": bool(os.getcwd())}
+'''
+
+REQUIREMENTS = """swarmnode==0.1.0
+not-installed-anywhere>=1.0
+fastapi==0.104.1
+requests
+langchain==0.0.335
+--only-binary :all: pydantic==2.4.2
+"""
+
+def test_shake_drops_unused_code_and_keeps_behavior():
+    shaken = shake_script(SCRIPT)
+    assert "unused_helper" not in shaken and "class Unused" not in shaken
+    # Bare imports stay for their side effects; unused from-imports go
+    assert "import json" in shaken and "import requests" in shaken and "FastAPI" not in shaken
+    assert '"""' not in shaken and "#" not in shaken
+    assert len(shaken) < len(SCRIPT) / 2
+
+    namespace = {}
+    exec(shaken, namespace)
+    assert namespace["main"]({"payload": {"text": "hi"}}, None) == {"reply": "hello: hi", "cwd": True}
+    assert "unused_helper" in shake_script(SCRIPT, keep=("main", "unused_helper"))
+
+DECORATED_SCRIPT = '''import atexit
+from fastapi import FastAPI
+
+app = FastAPI()
+HANDLERS = {}
+
+def register(fn):
+    HANDLERS[fn.__name__] = fn
+    return fn
+
+@app.get("/health")
+def health():
+    return {"status": "ok"}
+
+@register
+def chat(payload):
+    return payload["text"]
+
+@atexit.register
+def cleanup():
+    HANDLERS.clear()
+
+def unused():
+    pass
+
+def main(request, store):
+    return HANDLERS[request["payload"]["handler"]](request["payload"])
+'''
+
+def test_decorated_definitions_are_kept():
+    shaken = shake_script(DECORATED_SCRIPT)
+    for kept in ("import atexit", "def health", "def register", "def chat", "def cleanup", "def main"):
+        assert kept in shaken, kept
+    assert "def unused" not in shaken
+
+    namespace = {}
+    exec(shaken, namespace)
+    assert namespace["main"]({"payload": {"handler": "chat", "text": "hi"}}, None) == "hi"
+    assert any(route.path == "/health" for route in namespace["app"].routes)
+
+def test_requirements_follow_imports():
+    assert imported_modules("import requests\nfrom fastapi import FastAPI\nfrom . import local\n") == {"requests", "fastapi"}
+
+    # Requirements that are not installed here cannot be checked, so they are kept
+    slim = slim_requirements(REQUIREMENTS, {"requests"}).splitlines()
+    assert slim == ["not-installed-anywhere>=1.0", "requests"]
+    assert slim_requirements(REQUIREMENTS, {"requests"}, pin=True).splitlines()[1] == f"requests=={metadata.version('requests')}"
+
+    # pydantic stays pinned because fastapi needs it
+    slim = slim_requirements(REQUIREMENTS, {"fastapi"}).splitlines()
+    assert slim == ["not-installed-anywhere>=1.0", "fastapi==0.104.1", "--only-binary :all: pydantic==2.4.2"]
+
+def test_packages_are_cached_by_content_hash():
+    cache_dir = tempfile.mkdtemp()
+    package = build_package(SCRIPT, REQUIREMENTS, cache_dir=cache_dir)
+    assert not package.cached
+    assert package.requirements == "not-installed-anywhere>=1.0\nrequests\n"
+    before, after = package.report["before"], package.report["after"]
+    assert after["script_bytes"] < before["script_bytes"]
+    assert after["installed_packages"] < before["installed_packages"]
+    assert after["estimated_install_seconds"] < before["estimated_install_seconds"]
+
+    again = build_package(SCRIPT, REQUIREMENTS, cache_dir=cache_dir)
+    assert again.cached and again.script == package.script and again.report == package.report
+    assert build_package(SCRIPT + "\n# changed\n", REQUIREMENTS, cache_dir=cache_dir).cache_key != package.cache_key
+
+def main():
+    print("Agent Packaging Test")
+    print("====================")
+    for test in (test_shake_drops_unused_code_and_keeps_behavior, test_decorated_definitions_are_kept,
+                 test_requirements_follow_imports, test_packages_are_cached_by_content_hash):
+        test()
+        print(f"✅ {test.__name__}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Make the backend package importable when running from the repo root
+sys.path.insert(0, os.path.join(ROOT, "backend_deploy", "src"))
+
+from fastapi.testclient import TestClient
+
+from agents.base_agent import BaseAgent, ChatResponse
+from api import agent_router
+from api.app import PROFILES, create_app, get_profile
+from swarm.dispatch import chat_dispatcher
+
+def route_endpoints(app):
+    return {route.path: route.endpoint for route in app.routes if hasattr(route, "endpoint")}
+
+def test_profiles_share_the_agent_hot_path():
+    """Every profile serves chat through the same router endpoint and agents."""
+    for name in PROFILES:
+        endpoints = route_endpoints(create_app(name))
+        assert endpoints["/agents/{agent_name}/chat"] is agent_router.chat
+        assert "/health" in endpoints and "/agents" in endpoints
+    assert all(type(agent) is BaseAgent for agent in agent_router.agents.values())
+
+def test_profiles_switch_optional_routers():
+    server = route_endpoints(create_app("server"))
+    minimal = route_endpoints(create_app("minimal"))
+    assert "/staking/summary" in server and "/staking/summary" not in minimal
+    assert any(path.startswith("/github") for path in server)
+    assert not any(path.startswith("/github") for path in minimal)
+    assert TestClient(create_app("swarmnode")).get("/health").json()["profile"] == "swarmnode"
+
+def test_swarmnode_profile_never_offloads(monkeypatch):
+    """Offloading is read from each app's profile, so building another app cannot switch it."""
+    offloads = []
+
+    async def dispatch(agent, request, model_type="gemini", abandoned=None, offload=True, **kwargs):
+        offloads.append(offload)
+        return ChatResponse(response="ok")
+
+    monkeypatch.setattr(chat_dispatcher, "swarm_agent_id", "agent")
+    monkeypatch.setattr(chat_dispatcher, "dispatch", dispatch)
+    server = TestClient(create_app("server"))
+    swarmnode = TestClient(create_app("swarmnode"))
+    body = {"messages": [{"role": "user", "content": "hi"}]}
+    for client in (server, swarmnode, server):
+        assert client.post("/agents/wooly/chat", json=body).status_code == 200
+    assert offloads == [True, False, True]
+    assert chat_dispatcher.swarm_agent_id == "agent"
+    assert server.get("/agents/dispatch/status").json()["swarm_enabled"] is True
+    assert swarmnode.get("/agents/dispatch/status").json()["swarm_enabled"] is False
+
+def test_chat_answers_the_same_in_every_profile(monkeypatch):
+    monkeypatch.setattr(BaseAgent, "get_chat_response", lambda self, messages, *args: f"{self.name}: ok")
+    body = {"messages": [{"role": "user", "content": "hi"}, {"role": "assistant", "content": "hello"},
+                         {"role": "user", "content": "what is this?"}]}
+    answers = {name: TestClient(create_app(name)).post("/agents/wooly/chat", json=body).json() for name in PROFILES}
+    assert len({answer["response"] for answer in answers.values()}) == 1
+
+def test_unknown_profile_is_rejected():
+    try:
+        get_profile("nope")
+    except ValueError as e:
+        assert "server" in str(e)
+    else:
+        raise AssertionError("expected ValueError")
+
+def test_deploy_targets_run_the_unified_package():
+    """Both Procfiles and Dockerfiles start backend_deploy/src's api.serve:app behind the Koyeb proxy."""
+    assert not os.path.exists(os.path.join(ROOT, "src"))
+    for path in ("Procfile", "Dockerfile.backend", "backend_deploy/Procfile", "backend_deploy/Dockerfile.backend"):
+        with open(os.path.join(ROOT, path), "r") as f:
+            command = f.read()
+        assert re.search(r"cd (backend_deploy/)?src && (TRUST_FORWARDED_FOR=true )?uvicorn api\.serve:app", command), path
+        assert "TRUST_FORWARDED_FOR=true" in command, path
+    with open(os.path.join(ROOT, "Dockerfile.backend"), "r") as f:
+        assert "COPY backend_deploy/src/ ./src/" in f.read()
+
+def main():
+    print("App Profiles Test")
+    print("=================")
+    for test in (test_profiles_share_the_agent_hot_path, test_profiles_switch_optional_routers,
+                 test_unknown_profile_is_rejected, test_deploy_targets_run_the_unified_package):
+        test()
+        print(f"✅ {test.__name__}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+import os
+import sys
+import json
+import time
+import asyncio
+import tempfile
+
+import httpx
+from fastapi.testclient import TestClient
+
+# Make the batch client importable when running from the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+
+import batch_chat
+from fake_providers import LatencyModel, FakeGemini, install
+from agents.base_agent import ChatRequest, ChatResponse, Message
+from api import agent_router
+from api.admission import AdmissionController
+from api.app import create_app
+from swarm.batch import BatchConversation, run_batch
+from swarm.dispatch import ChatDispatcher, chat_dispatcher
+
+class CountingAgent:
+    """Agent stand-in that tracks how many generations run at once."""
+
+    type = "vocafi"
+
+    def __init__(self, latency=0.02):
+        self.latency = latency
+        self.running = 0
+        self.peak = 0
+
+    def get_scripted_response(self, request):
+        return None
+
+    def process_chat_request(self, request, model_type="gemini", cancelled=None, on_chunk=None, on_restart=None):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        time.sleep(self.latency)
+        self.running -= 1
+        if request.messages[-1].content == "fail":
+            raise ValueError("bad conversation")
+        return ChatResponse(response=f"answer: {request.messages[-1].content}")
+
+def conversations(count, **kwargs):
+    return [BatchConversation(messages=[Message(role="user", content=f"q{i}")], **kwargs) for i in range(count)]
+
+def follow_up(question):
+    return [{"role": "user", "content": "What is this?"}, {"role": "assistant", "content": "A project."},
+            {"role": "user", "content": question}]
+
+def collect(agent, items, dispatcher, **kwargs):
+    async def run():
+        return [result async for result in run_batch(agent, items, dispatcher=dispatcher, **kwargs)]
+    return asyncio.run(run())
+
+def test_batch_runs_with_bounded_concurrency_and_resumes():
+    agent = CountingAgent()
+    dispatcher = ChatDispatcher(swarm_agent_id=None, max_concurrency=8)
+    items = conversations(10) + [BatchConversation(id="broken", messages=[Message(role="user", content="fail")])]
+    results = collect(agent, items, dispatcher, concurrency=3)
+    assert agent.peak == 3
+    answers = {result["id"]: result for result in results[:-1]}
+    assert answers["4"]["response"] == "answer: q4"
+    assert answers["broken"] == {"id": "broken", "error": "ValueError: bad conversation", "retryable": False}
+    assert results[-1] == {"done": True, "total": 11, "succeeded": 10, "failed": 1, "skipped": 0}
+    # Resuming skips what an earlier run answered
+    resumed = collect(agent, items, dispatcher, completed=[str(i) for i in range(10)])
+    assert [result["id"] for result in resumed[:-1]] == ["broken"] and resumed[-1]["skipped"] == 10
+    assert dispatcher.status()["scheduler"]["agents"]["vocafi/batch"]["served"] == 12
+
+def test_batch_holds_provider_slots():
+    agent = CountingAgent()
+    dispatcher = ChatDispatcher(swarm_agent_id=None, max_concurrency=8)
+    admission = AdmissionController(provider_limits={"gemini": 1})
+    results = collect(agent, conversations(4), dispatcher, concurrency=4, admission=admission)
+    # The provider cap, not the batch's concurrency, bounds the chats running at once
+    assert agent.peak == 1 and results[-1]["succeeded"] == 4
+    assert admission.in_flight == {"gemini": 0}
+    assert admission.stats["admitted"] == 0
+
+def test_batch_does_not_starve_interactive_chats():
+    agent = CountingAgent(latency=0.02)
+    dispatcher = ChatDispatcher(swarm_agent_id=None, max_concurrency=1)
+
+    async def run():
+        batches = [asyncio.ensure_future(collect_async(run_batch(agent, conversations(20), dispatcher=dispatcher, concurrency=4)))
+                   for _ in range(3)]
+        await asyncio.sleep(0.05)
+        start = time.perf_counter()
+        await dispatcher.dispatch(agent, ChatRequest(messages=[Message(role="user", content="live")]))
+        interactive = time.perf_counter() - start
+        await asyncio.gather(*batches)
+        return interactive
+
+    async def collect_async(results):
+        return [result async for result in results]
+
+    # Three batches keep about 12 chats queued (0.24s of work); the interactive chat waits in its own queue and
+    # starts after at most a couple of them
+    assert asyncio.run(run()) < 0.1
+
+def test_batch_endpoint_streams_ndjson(monkeypatch):
+    monkeypatch.setattr(chat_dispatcher, "swarm_agent_id", None)
+    monkeypatch.setattr(agent_router, "BATCH_ADMIN_TOKEN", "secret")
+    client = TestClient(create_app("minimal"))
+    body = {"conversations": [{"id": "a", "messages": follow_up("How do I fork it?")},
+                              {"id": "b", "messages": [{"role": "user", "content": "Hi"}]},
+                              {"id": "c", "messages": follow_up("Who builds it?")}],
+            "completed": ["c"]}
+    assert client.post("/agents/wooly/chat/batch", json=body).status_code == 403
+    assert client.post("/agents/nobody/chat/batch", json=body, headers={"X-Admin-Token": "secret"}).status_code == 404
+    assert client.post("/agents/wooly/chat/batch", params={"model_type": "x"}, json=body,
+                       headers={"X-Admin-Token": "secret"}).status_code == 400
+
+    gemini = FakeGemini()
+    with install(gemini=gemini):
+        response = client.post("/agents/wooly/chat/batch", json=body, headers={"X-Admin-Token": "secret"})
+    assert response.status_code == 200 and response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(line["id"] for line in lines[:-1]) == ["a", "b"]
+    assert all("project_info_etag" in line for line in lines[:-1])
+    assert lines[-1] == {"done": True, "total": 3, "succeeded": 2, "failed": 0, "skipped": 1}
+    # "b" is an opening turn answered by the scripted greeting
+    assert gemini.calls == 1
+
+class FlakyTransport(httpx.AsyncBaseTransport):
+    """ASGI transport whose first request fails like a dropped connection."""
+
+    def __init__(self, app):
+        self.transport = httpx.ASGITransport(app=app)
+        self.bodies = []
+
+    async def handle_async_request(self, request):
+        self.bodies.append(json.loads(await request.aread()))
+        if len(self.bodies) == 1:
+            raise httpx.ReadError("connection reset")
+        return await self.transport.handle_async_request(request)
+
+def test_client_resumes_from_its_output_file(monkeypatch):
+    monkeypatch.setattr(chat_dispatcher, "swarm_agent_id", None)
+    monkeypatch.setattr(agent_router, "BATCH_ADMIN_TOKEN", "secret")
+    output = os.path.join(tempfile.mkdtemp(), "results.ndjson")
+    with open(output, "w") as f:
+        f.write(json.dumps({"id": "0", "response": "earlier answer"}) + "\n")
+        f.write('{"id": "1", "resp')  # cut short when the earlier run died
+    questions = os.path.join(tempfile.mkdtemp(), "questions.json")
+    with open(questions, "w") as f:
+        json.dump([{"messages": follow_up(f"Question {i}?")} for i in range(4)], f)
+
+    transport = FlakyTransport(create_app("minimal"))
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await batch_chat.run(client, "vocafi", batch_chat.load_conversations(questions), output,
+                                        token="secret", backoff=0)
+
+    with install(FakeGemini(LatencyModel(0.001))):
+        summary = asyncio.run(run())
+    assert [body["completed"] for body in transport.bodies] == [["0"], ["0"]]
+    assert summary["answered"] == 4 and summary["skipped"] == 1 and summary["succeeded"] == 3
+    assert batch_chat.answered_ids(output) == {"0", "1", "2", "3"}
+
+def main():
+    print("Batch Chat Test")
+    print("===============")
+    for test in (test_batch_runs_with_bounded_concurrency_and_resumes, test_batch_holds_provider_slots,
+                 test_batch_does_not_starve_interactive_chats):
+        test()
+        print(f"✅ {test.__name__}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+import os
+import tempfile
+
+from fake_chain import FakeChain
+from chain.abi import keccak256
+from chain.rpc import JsonRpcClient
+from chain.indexer import StakingStore, StakingIndexer
+
+ALICE = "0x" + "a" * 40
+BOB = "0x" + "b" * 40
+
+def make_indexer(chain, db_file=None, batch_size=10, **kwargs):
+    store = StakingStore(db_file or os.path.join(tempfile.mkdtemp(), "events.db"))
+    rpc = JsonRpcClient(url="http://fake-chain", session=chain)
+    kwargs.setdefault("max_batch_size", batch_size)
+    return StakingIndexer(store, rpc=rpc, start_block=100, batch_size=batch_size, confirmations=0, **kwargs), store
+
+def seed(chain):
+    chain.emit("ProjectAdded", project_id="vocafi", name="VocaFI")
+    chain.emit("ProjectAdded", project_id="clarity", name="Clarity")
+    chain.emit("BuilderNFTMinted", token_id=1, recipient=ALICE, github_username="Alice",
+               project_hash=keccak256(b"vocafi"), repo_name="alice/voca.fi")
+    chain.emit("BuilderNFTAdded", token_id=1, github_username="Alice", repo_name="alice/voca.fi", project_id="vocafi")
+    chain.emit("Staked", staker=ALICE, project_id="vocafi", amount=3 * 10**18)
+    chain.emit("Staked", staker=BOB, project_id="vocafi", amount=10**18)
+    chain.emit("Unstaked", staker=BOB, project_id="vocafi", amount=10**18)
+    chain.emit("BuilderNFTStaked", staker=BOB, token_id=1, amount=5, project_id="vocafi")
+
+def test_indexes_events_into_materialized_state():
+    chain = FakeChain()
+    seed(chain)
+    indexer, store = make_indexer(chain, batch_size=3)
+
+    assert indexer.sync() == 8
+    assert store.checkpoint == chain.head
+
+    projects = {p["id"]: p for p in store.get_projects()}
+    assert projects["vocafi"] == {"id": "vocafi", "name": "VocaFI", "total_staked": str(3 * 10**18), "stakers_count": 1, "builder_nfts": [1]}
+    assert projects["clarity"]["total_staked"] == "0"
+
+    nfts = store.get_nfts_by_github("alice")
+    assert nfts == [{"token_id": 1, "github_username": "Alice", "repo_name": "alice/voca.fi", "project_id": "vocafi",
+                     "owner": ALICE, "total_staked": "5", "stakers_count": 1}]
+
+def test_follows_new_blocks_in_batches():
+    chain = FakeChain()
+    seed(chain)
+    indexer, store = make_indexer(chain)
+    indexer.sync()
+
+    chain.mine(25)
+    chain.emit("Staked", staker=BOB, project_id="clarity", amount=7)
+    chain.requests.clear()
+    assert indexer.sync() == 1
+
+    log_requests = [r for r in chain.requests if r["method"] == "eth_getLogs"]
+    assert len(log_requests) == 3
+    assert {p["id"]: p["total_staked"] for p in store.get_projects()}["clarity"] == "7"
+
+def test_restart_replays_event_log():
+    chain = FakeChain()
+    seed(chain)
+    db_file = os.path.join(tempfile.mkdtemp(), "events.db")
+    indexer, store = make_indexer(chain, db_file)
+    indexer.sync()
+
+    restarted_indexer, restarted = make_indexer(chain, db_file)
+    assert restarted.get_projects() == store.get_projects()
+    chain.requests.clear()
+    assert restarted_indexer.sync() == 0
+    assert not [r for r in chain.requests if r["method"] == "eth_getLogs"]
+
+def test_window_adapts_to_provider_caps():
+    chain = FakeChain(max_logs=2)
+    seed(chain)
+    chain.mine(500)
+    indexer, store = make_indexer(chain, batch_size=8, max_batch_size=1000)
+
+    assert indexer.sync() == 8
+    assert store.checkpoint == chain.head
+    # The window shrank to fit the result cap, then grew across the empty blocks
+    ranges = [int(r["params"][0]["toBlock"], 16) - int(r["params"][0]["fromBlock"], 16) + 1
+              for r in chain.requests if r["method"] == "eth_getLogs"]
+    assert min(ranges) < 8 and max(ranges) > 8
+    assert len(ranges) < 500 // 8
+
+def test_parallel_backfill_matches_sequential_scan():
+    chain = FakeChain()
+    seed(chain)
+    for i in range(20):
+        chain.mine(97)
+        chain.emit("Staked", staker=BOB, project_id="clarity", amount=i + 1)
+
+    parallel, parallel_store = make_indexer(chain, batch_size=50, max_batch_size=200, workers=4, segment_size=300)
+    sequential, sequential_store = make_indexer(chain, batch_size=50, max_batch_size=200, workers=1)
+    assert parallel.sync() == sequential.sync() == 28
+    assert parallel_store.checkpoint == sequential_store.checkpoint == chain.head
+    assert parallel_store.get_projects() == sequential_store.get_projects()
+
+def test_reorg_rolls_back_orphaned_events():
+    chain = FakeChain()
+    seed(chain)
+    indexer, store = make_indexer(chain)
+    indexer.sync()
+    chain.emit("Staked", staker=BOB, project_id="clarity", amount=7)
+    chain.mine(5)
+    indexer.sync()
+    assert {p["id"]: p["total_staked"] for p in store.get_projects()}["clarity"] == "7"
+
+    # The block holding the clarity stake is replaced by an empty one
+    chain.reorg(6)
+    chain.emit("Staked", staker=BOB, project_id="clarity", amount=2)
+    assert indexer.sync() == 1
+    assert store.checkpoint == chain.head
+    assert {p["id"]: p["total_staked"] for p in store.get_projects()}["clarity"] == "2"
+
+def main():
+    print("Chain Indexer Test")
+    print("==================")
+    for test in (test_indexes_events_into_materialized_state, test_follows_new_blocks_in_batches, test_restart_replays_event_log,
+                 test_window_adapts_to_provider_caps, test_parallel_backfill_matches_sequential_scan,
+                 test_reorg_rolls_back_orphaned_events):
+        test()
+        print(f"✅ {test.__name__}")
+
+if __name__ == "__main__":
+    main()
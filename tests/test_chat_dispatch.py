@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+import time
+import asyncio
+
+from fake_swarmnode import FakeSwarmNode
+from agents.base_agent import ChatRequest, ChatResponse, Message
+from swarm.dispatch import ChatDispatcher
+
+class SlowAgent:
+    """Agent stand-in whose generation blocks a worker thread like an LLM call."""
+
+    type = "vocafi"
+
+    def __init__(self, latency=0.1):
+        self.latency = latency
+        self.calls = 0
+
+    def get_scripted_response(self, request):
+        return None
+
+    def process_chat_request(self, request, model_type="gemini", cancelled=None, on_chunk=None, on_restart=None):
+        self.calls += 1
+        time.sleep(self.latency)
+        return ChatResponse(response=f"local: {request.messages[-1].content}")
+
+def remote_chat(payload):
+    assert payload["endpoint"] == "/agents/vocafi/chat" and payload["method"] == "POST"
+    return {"response": f"remote: {payload['body']['messages'][-1]['content']}", "project_info": None}
+
+def make_request(i):
+    return ChatRequest(messages=[Message(role="user", content=f"question {i}")])
+
+def run_burst(dispatcher, agent, count):
+    async def run():
+        return await asyncio.gather(*(dispatcher.dispatch(agent, make_request(i)) for i in range(count)))
+    return asyncio.run(run())
+
+def test_below_capacity_runs_locally():
+    server = FakeSwarmNode(respond=remote_chat)
+    dispatcher = ChatDispatcher(server.client(), swarm_agent_id="agent", max_concurrency=4)
+    responses = run_burst(dispatcher, SlowAgent(), 4)
+    assert [r.response for r in responses] == [f"local: question {i}" for i in range(4)]
+    assert not server.jobs and dispatcher.stats["offloaded"] == 0
+
+def test_saturation_offloads_with_same_contract():
+    server = FakeSwarmNode(duration=0.05, respond=remote_chat)
+    dispatcher = ChatDispatcher(server.client(), swarm_agent_id="agent", max_concurrency=2,
+                                max_queue_depth=2, local_latency=0.2, swarm_latency=0.1)
+    agent = SlowAgent(latency=0.2)
+    start = time.perf_counter()
+    responses = run_burst(dispatcher, agent, 20)
+    elapsed = time.perf_counter() - start
+
+    assert all(isinstance(r, ChatResponse) for r in responses)
+    assert all(r.response.endswith(f"question {i}") for i, r in enumerate(responses))
+    assert dispatcher.stats["offloaded"] == len(server.jobs) > 0
+    assert agent.calls == dispatcher.stats["local"] == 20 - len(server.jobs)
+    # 20 requests at 0.2s over 2 local slots would take 2s
+    assert elapsed < 1
+
+def test_queue_waits_when_swarmnode_is_slower():
+    server = FakeSwarmNode(respond=remote_chat)
+    dispatcher = ChatDispatcher(server.client(), swarm_agent_id="agent", max_concurrency=2,
+                                max_queue_depth=100, local_latency=0.05, swarm_latency=30)
+    run_burst(dispatcher, SlowAgent(latency=0.05), 8)
+    assert not server.jobs and dispatcher.stats["local"] == 8
+
+def test_offload_can_be_turned_off_per_request():
+    server = FakeSwarmNode(respond=remote_chat)
+    dispatcher = ChatDispatcher(server.client(), swarm_agent_id="agent", max_concurrency=1, max_queue_depth=0)
+
+    async def run():
+        return await asyncio.gather(*(dispatcher.dispatch(SlowAgent(latency=0.01), make_request(i), offload=False)
+                                      for i in range(5)))
+
+    asyncio.run(run())
+    assert not server.jobs and dispatcher.stats["local"] == 5
+
+def test_without_swarmnode_everything_runs_locally():
+    dispatcher = ChatDispatcher(swarm_agent_id=None, max_concurrency=1, max_queue_depth=0)
+    run_burst(dispatcher, SlowAgent(latency=0.01), 5)
+    assert dispatcher.stats == {"scripted": 0, "local": 5, "offloaded": 0, "fallbacks": 0, "cancelled": 0}
+
+def test_failed_offload_falls_back_to_local():
+    server = FakeSwarmNode(status="failure", respond=remote_chat)
+    dispatcher = ChatDispatcher(server.client(), swarm_agent_id="agent", max_concurrency=1, max_queue_depth=0)
+    responses = run_burst(dispatcher, SlowAgent(latency=0.05), 4)
+    assert all(r.response.startswith("local:") for r in responses)
+    assert dispatcher.stats["fallbacks"] == len(server.jobs) > 0
+
+def main():
+    print("Chat Dispatch Test")
+    print("==================")
+    for test in (test_below_capacity_runs_locally, test_saturation_offloads_with_same_contract,
+                 test_queue_waits_when_swarmnode_is_slower, test_offload_can_be_turned_off_per_request,
+                 test_without_swarmnode_everything_runs_locally,
+                 test_failed_offload_falls_back_to_local):
+        test()
+        print(f"✅ {test.__name__}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+import asyncio
+
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from fake_providers import LatencyModel, FakeGemini, FakeOpenAI, ProviderError, install
+from agents.agent_factory import load_agents
+from agents.base_agent import ChatResponse
+from api.app import create_app
+from api.chat_socket import ChatSession
+from swarm.dispatch import chat_dispatcher
+
+def receive_turn(socket):
+    """Messages up to and including the turn's final one."""
+    messages = []
+    while not messages or messages[-1]["type"] in ("token", "restart"):
+        messages.append(socket.receive_json())
+    return messages
+
+def test_socket_keeps_the_conversation_and_streams_tokens(monkeypatch):
+    monkeypatch.setattr(chat_dispatcher, "swarm_agent_id", None)
+    client = TestClient(create_app("minimal"))
+    gemini = FakeGemini(words=60, chunks=6)
+    with install(gemini=gemini), client.websocket_connect("/agents/wooly/ws") as socket:
+        socket.send_json({"type": "chat", "id": "1", "content": "Hi"})
+        opening = receive_turn(socket)
+        assert opening == [{"type": "done", "id": "1", "agent": "wooly", "response": load_agents()["wooly"].greeting,
+                            "project_info": None, "project_info_etag": load_agents()["wooly"].project_info_etag}]
+
+        # Only the new message is sent; the socket remembers the opening turn, so this is not scripted
+        socket.send_json({"type": "chat", "id": "2", "content": "How do I fork it?"})
+        turn = receive_turn(socket)
+        tokens, done = turn[:-1], turn[-1]
+        assert len(tokens) == 6 and all(token["id"] == "2" for token in tokens)
+        assert done["type"] == "done" and done["response"] == "".join(token["text"] for token in tokens)
+        assert gemini.calls == 1
+
+        socket.send_json({"type": "reset"})
+        socket.send_json({"type": "chat", "id": "3", "content": "Hi again"})
+        assert receive_turn(socket)[-1]["response"] == load_agents()["wooly"].greeting
+
+def test_one_socket_serves_several_agents_and_cancels_turns(monkeypatch):
+    monkeypatch.setattr(chat_dispatcher, "swarm_agent_id", None)
+    client = TestClient(create_app("minimal"))
+    gemini = FakeGemini(LatencyModel(0.6), chunks=30)
+    with install(gemini=gemini), client.websocket_connect("/agents/wooly/ws") as socket:
+        for agent in ("wooly", "hwc"):
+            socket.send_json({"type": "chat", "id": f"{agent}-0", "agent": agent, "content": "Hi"})
+            assert receive_turn(socket)[-1]["agent"] == agent
+
+        socket.send_json({"type": "chat", "id": "w1", "content": "How do I stake?"})
+        socket.send_json({"type": "chat", "id": "h1", "agent": "hwc", "content": "How do I fork it?"})
+        socket.send_json({"type": "chat", "id": "h2", "agent": "hwc", "content": "And then?"})
+        assert socket.receive_json() == {"type": "error", "id": "h2", "agent": "hwc",
+                                         "error": "A turn with 'hwc' is already running"}
+        # Both turns stream side by side; cancel one of them once it is under way
+        first = socket.receive_json()
+        assert first["type"] == "token"
+        socket.send_json({"type": "cancel", "id": "w1"})
+        finals = {}
+        while len(finals) < 2:
+            message = socket.receive_json()
+            if message["type"] != "token":
+                finals[message["id"]] = message
+        assert finals["w1"] == {"type": "cancelled", "id": "w1", "agent": "wooly"}
+        assert finals["h1"]["type"] == "done" and finals["h1"]["agent"] == "hwc"
+        assert gemini.chunks_sent < 60
+
+        # The cancelled message was dropped, so wooly's conversation still ends with its greeting
+        socket.send_json({"type": "chat", "id": "w2", "content": "How do I stake?"})
+        assert receive_turn(socket)[-1]["type"] == "done"
+    assert chat_dispatcher.stats["cancelled"] >= 1
+
+class BreaksAfterFirstChunk:
+    """Streams one chunk, then fails like a dropped provider connection."""
+
+    def stream(self, name):
+        self.calls += 1
+        yield "partial "
+        raise ProviderError(f"{name} stream dropped")
+
+class BrokenGemini(BreaksAfterFirstChunk, FakeGemini):
+    pass
+
+class BrokenOpenAI(BreaksAfterFirstChunk, FakeOpenAI):
+    pass
+
+def test_failed_streams_restart_and_done_is_authoritative(monkeypatch):
+    monkeypatch.setattr(chat_dispatcher, "swarm_agent_id", None)
+    client = TestClient(create_app("minimal"))
+    with client.websocket_connect("/agents/wooly/ws") as socket:
+        socket.send_json({"type": "chat", "id": "0", "content": "Hi"})
+        receive_turn(socket)
+
+        # OpenAI drops mid-stream and Gemini answers instead
+        with install(gemini=FakeGemini(words=30, chunks=3), openai=BrokenOpenAI()):
+            socket.send_json({"type": "chat", "id": "1", "content": "How do I fork it?", "model_type": "openai"})
+            turn = receive_turn(socket)
+        kinds = [message["type"] for message in turn]
+        assert kinds == ["token", "restart", "token", "token", "token", "done"]
+        assert turn[0]["text"] == "partial " and turn[1] == {"type": "restart", "id": "1", "agent": "wooly"}
+        assert turn[-1]["response"] == "".join(message["text"] for message in turn[2:-1])
+
+        # Gemini drops mid-stream: the apology replaces the partial answer
+        with install(gemini=BrokenGemini()):
+            socket.send_json({"type": "chat", "id": "2", "content": "And then?"})
+            turn = receive_turn(socket)
+        assert [message["type"] for message in turn] == ["token", "restart", "done"]
+        assert "partial" not in turn[-1]["response"] and turn[-1]["response"].startswith("I'm sorry")
+
+def test_bad_messages_get_errors():
+    client = TestClient(create_app("minimal"))
+    try:
+        with client.websocket_connect("/agents/nobody/ws"):
+            assert False, "expected the socket to be closed"
+    except WebSocketDisconnect as e:
+        assert e.code == 4404
+    with client.websocket_connect("/agents/wooly/ws") as socket:
+        socket.send_text("not json")
+        assert socket.receive_json()["error"] == "Messages must be JSON objects"
+        socket.send_json({"type": "chat", "id": "1", "agent": "nobody", "content": "Hi"})
+        assert socket.receive_json()["error"] == "Agent 'nobody' not found"
+        for message in ({"type": "chat", "id": "1", "agent": ["wooly"], "content": "Hi"}, {"type": "reset", "agent": {"a": 1}}):
+            socket.send_json(message)
+            assert socket.receive_json()["error"] == "'agent' must be an agent name"
+        socket.send_json({"type": "chat", "id": "2", "content": "Hi", "model_type": "claude"})
+        assert socket.receive_json()["error"] == "Invalid model type. Use 'openai' or 'gemini'."
+
+def test_conversations_keep_only_the_last_turns():
+    class RecordingDispatcher:
+        def __init__(self):
+            self.sizes = []
+
+        async def dispatch(self, agent, request, model_type, on_chunk=None, on_restart=None, offload=True):
+            self.sizes.append(len(request.messages))
+            return ChatResponse(response=f"answer {len(self.sizes)}")
+
+    dispatcher = RecordingDispatcher()
+    session = ChatSession(None, "wooly", load_agents(), dispatcher, max_turns=2)
+
+    async def run():
+        for i in range(5):
+            await session._turn(str(i), "wooly", f"question {i}", "gemini")
+
+    asyncio.run(run())
+    assert dispatcher.sizes == [1, 3, 5, 5, 5]
+    assert [message.content for message in session.conversations["wooly"]] == ["question 3", "answer 4", "question 4", "answer 5"]
+
+def main():
+    print("Chat Socket Test")
+    print("================")
+    for test in (test_bad_messages_get_errors, test_conversations_keep_only_the_last_turns):
+        test()
+        print(f"✅ {test.__name__}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+import os
+import sys
+import time
+import asyncio
+
+# Make the backend package importable when running from the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend_deploy", "src"))
+
+from agents.base_agent import ChatRequest, ChatResponse, Message
+from agents.scheduler import FairScheduler, RequestDropped
+from swarm.dispatch import ChatDispatcher
+
+class TypedAgent:
+    """Agent stand-in whose generation blocks a worker thread for a fixed time."""
+
+    def __init__(self, agent_type, latency=0.02):
+        self.type = agent_type
+        self.latency = latency
+
+    def get_scripted_response(self, request):
+        return None
+
+    def process_chat_request(self, request, model_type="gemini", cancelled=None, on_chunk=None, on_restart=None):
+        time.sleep(self.latency)
+        return ChatResponse(response=f"{self.type}: {request.messages[-1].content}")
+
+async def run_job(scheduler, key, order, hold=0.005, **kwargs):
+    await scheduler.acquire(key, **kwargs)
+    order.append(key)
+    try:
+        await asyncio.sleep(hold)
+    finally:
+        scheduler.release(key)
+
+def test_busy_agent_cannot_starve_the_others():
+    async def run():
+        scheduler, order = FairScheduler(1), []
+        jobs = [run_job(scheduler, "wooly", order) for _ in range(20)] + [run_job(scheduler, "vocafi", order) for _ in range(2)]
+        await asyncio.gather(*jobs)
+        return order
+
+    order = asyncio.run(run())
+    # FIFO would start both vocafi requests last (positions 20 and 21)
+    assert [i for i, key in enumerate(order) if key == "vocafi"] == [2, 4]
+
+def test_weights_split_slots():
+    async def run():
+        scheduler, order = FairScheduler(1, weights={"wooly": 2}), []
+        jobs = [run_job(scheduler, "wooly", order) for _ in range(12)] + [run_job(scheduler, "clarity", order) for _ in range(12)]
+        await asyncio.gather(*jobs)
+        return order
+
+    order = asyncio.run(run())
+    assert order[:13].count("wooly") >= 8 and order[:13].count("clarity") >= 4
+
+def test_expired_abandoned_and_cancelled_requests_are_dropped():
+    async def run():
+        scheduler, order = FairScheduler(1, max_wait=0.05), []
+        holder = asyncio.ensure_future(run_job(scheduler, "wooly", order, hold=0.2))
+        await asyncio.sleep(0)
+        expired = asyncio.ensure_future(run_job(scheduler, "hwc", order))
+        abandoned = asyncio.ensure_future(run_job(scheduler, "clarity", order, deadline=time.monotonic() + 5, abandoned=lambda: True))
+        cancelled = asyncio.ensure_future(run_job(scheduler, "vocafi", order, deadline=time.monotonic() + 5))
+        await asyncio.sleep(0.01)
+        assert scheduler.queued == 3
+        cancelled.cancel()
+        await asyncio.sleep(0.01)
+        assert scheduler.queued == 2
+        results = await asyncio.gather(holder, expired, abandoned, cancelled, return_exceptions=True)
+        return scheduler, order, results
+
+    scheduler, order, results = asyncio.run(run())
+    assert order == ["wooly"]
+    assert isinstance(results[1], RequestDropped) and isinstance(results[2], RequestDropped)
+    assert isinstance(results[3], asyncio.CancelledError)
+    status = scheduler.status()
+    assert status["running"] == status["queued"] == 0
+    assert {key: agent["dropped"] for key, agent in status["agents"].items()} == {"clarity": 1, "hwc": 1, "vocafi": 1, "wooly": 0}
+
+def test_every_agent_latency_stays_bounded_under_skewed_load():
+    """100 chats for wooly and 5 for each other agent, over 4 local slots."""
+    async def run():
+        dispatcher = ChatDispatcher(swarm_agent_id=None, max_concurrency=4)
+        agents = {name: TypedAgent(name) for name in ("wooly", "vocafi", "clarity", "hwc", "mammothon")}
+        latencies = {name: [] for name in agents}
+
+        async def chat(name, i):
+            start = time.perf_counter()
+            await dispatcher.dispatch(agents[name], ChatRequest(messages=[Message(role="user", content=str(i))]))
+            latencies[name].append(time.perf_counter() - start)
+
+        jobs = [chat("wooly", i) for i in range(100)]
+        jobs += [chat(name, i) for name in agents if name != "wooly" for i in range(5)]
+        await asyncio.gather(*jobs)
+        return dispatcher, latencies
+
+    dispatcher, latencies = asyncio.run(run())
+    wooly_worst = max(latencies["wooly"])
+    # FIFO would serve the other agents after all of wooly's chats (~0.5s); fair queuing interleaves them
+    for name, values in latencies.items():
+        assert len(values) == (100 if name == "wooly" else 5)
+        if name != "wooly":
+            assert max(values) < wooly_worst / 2, (name, max(values), wooly_worst)
+    status = dispatcher.status()["scheduler"]
+    assert status["agents"]["wooly"]["served"] == 100 and status["agents"]["hwc"]["wait_p95_ms"] > 0
+
+def main():
+    print("Fair Scheduler Test")
+    print("===================")
+    for test in (test_busy_agent_cannot_starve_the_others, test_weights_split_slots,
+                 test_expired_abandoned_and_cancelled_requests_are_dropped,
+                 test_every_agent_latency_stays_bounded_under_skewed_load):
+        test()
+        print(f"✅ {test.__name__}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+import time
+import asyncio
+import threading
+
+from fake_providers import LatencyModel, FakeGemini, FakeOpenAI, install
+from agents.base_agent import ChatRequest, Message, GenerationCancelled, _collect_stream
+from agents.agent_factory import load_agents
+from api.app import create_app
+from swarm.dispatch import ChatDispatcher, chat_dispatcher
+
+def chat_request():
+    return ChatRequest(messages=[Message(role="user", content="What does this project do?"),
+                                 Message(role="assistant", content="It helps builders ship."),
+                                 Message(role="user", content="How do I fork it?")])
+
+def test_collect_stream_stops_at_the_next_chunk():
+    cancelled, seen = threading.Event(), []
+
+    def chunks():
+        for i in range(5):
+            seen.append(i)
+            if i == 1:
+                cancelled.set()
+            yield str(i)
+
+    assert _collect_stream(iter("abc"), None) == "abc"
+    try:
+        _collect_stream(chunks(), cancelled)
+        assert False, "expected GenerationCancelled"
+    except GenerationCancelled:
+        pass
+    assert seen == [0, 1]
+
+def test_agent_stops_streaming_when_cancelled():
+    agent = load_agents()["wooly"]
+    for fake, model_type in ((FakeGemini(chunks=10), "gemini"), (FakeOpenAI(chunks=10), "openai")):
+        cancelled = threading.Event()
+        cancelled.set()
+        with install(gemini=fake, openai=fake):
+            try:
+                agent.process_chat_request(chat_request(), model_type, cancelled)
+                assert False, "expected GenerationCancelled"
+            except GenerationCancelled:
+                pass
+            assert fake.chunks_sent == 0
+            # Not cancelled: the whole answer is generated as before
+            assert "word" in agent.process_chat_request(chat_request(), model_type).response
+        assert fake.chunks_sent == 10
+
+def test_cancelling_dispatch_stops_the_worker_thread():
+    gemini = FakeGemini(LatencyModel(0.5), chunks=50)
+    agent = load_agents()["wooly"]
+
+    async def run():
+        dispatcher = ChatDispatcher(swarm_agent_id=None, max_concurrency=1)
+        task = asyncio.ensure_future(dispatcher.dispatch(agent, chat_request()))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        # The worker thread keeps its slot until it stops at the next chunk, then frees it for the next chat
+        assert dispatcher.local_in_flight == 1
+        await asyncio.sleep(0.05)
+        assert dispatcher.local_in_flight == 0
+        return dispatcher
+
+    with install(gemini=gemini):
+        dispatcher = asyncio.run(run())
+    assert dispatcher.stats["cancelled"] == 1
+    assert 0 < gemini.chunks_sent < 20
+
+def test_client_disconnect_cancels_the_chat(monkeypatch):
+    """Raw ASGI call whose client disconnects 50ms into a 500ms generation."""
+    monkeypatch.setattr(chat_dispatcher, "swarm_agent_id", None)
+    monkeypatch.setitem(chat_dispatcher.stats, "cancelled", 0)
+    gemini = FakeGemini(LatencyModel(0.5), chunks=50)
+    app = create_app("minimal")
+    body = chat_request().model_dump_json().encode()
+
+    async def run():
+        events = [{"type": "http.request", "body": body, "more_body": False}]
+        sent = []
+
+        async def receive():
+            if events:
+                return events.pop(0)
+            await asyncio.sleep(0.05)
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+                 "scheme": "http", "path": "/agents/wooly/chat", "raw_path": b"/agents/wooly/chat",
+                 "query_string": b"", "root_path": "", "client": ("10.0.0.1", 1234), "server": ("test", 80),
+                 "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]}
+        start = time.perf_counter()
+        await app(scope, receive, send)
+        elapsed = time.perf_counter() - start
+        await asyncio.sleep(0.05)
+        return sent, elapsed
+
+    with install(gemini=gemini):
+        sent, elapsed = asyncio.run(run())
+    assert elapsed < 0.3
+    assert sent[0]["status"] == 499
+    assert chat_dispatcher.stats["cancelled"] == 1
+    assert 0 < gemini.chunks_sent < 20
+
+def main():
+    print("Generation Cancellation Test")
+    print("============================")
+    for test in (test_collect_stream_stops_at_the_next_chunk, test_agent_stops_streaming_when_cancelled,
+                 test_cancelling_dispatch_stops_the_worker_thread):
+        test()
+        print(f"✅ {test.__name__}")
+
+if __name__ == "__main__":
+    main()
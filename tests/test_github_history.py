@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+import os
+import sys
+import tempfile
+
+# Make the backend package importable when running from the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend_deploy", "src"))
+
+from api.github_history import GitHubHistoryStore
+
+START = 1_700_000_000
+
+def make_store():
+    return GitHubHistoryStore(db_file=os.path.join(tempfile.mkdtemp(), "history.db"), sample_interval=3600)
+
+def repo_info(stars, forks=0):
+    return {"owner": "alice", "repo": "demo", "stars": stars, "forks": forks, "watchers": stars, "open_issues": 0, "last_updated": ""}
+
+def test_unchanged_samples_are_throttled():
+    """Identical snapshots inside the sample interval are not written twice."""
+    store = make_store()
+    assert store.record(repo_info(1), ts=START)
+    assert not store.record(repo_info(1), ts=START + 60)
+    assert store.record(repo_info(2), ts=START + 120)
+    assert store.record(repo_info(2), ts=START + 120 + 3600)
+    assert len(store.history("alice", "demo", resolution="raw")) == 3
+
+def test_history_is_downsampled():
+    """Each bucket keeps its last sample."""
+    store = make_store()
+    for hour in range(48):
+        store.record(repo_info(hour), ts=START - START % 86400 + hour * 3600)
+
+    daily = store.history("alice", "demo", resolution="day")
+    assert [p["stars"] for p in daily] == [23, 47]
+
+    window = store.history("alice", "demo", start=START - START % 86400 + 10 * 3600,
+                           end=START - START % 86400 + 12 * 3600, resolution="hour")
+    assert [p["stars"] for p in window] == [10, 11, 12]
+
+def test_trends_and_warm_start():
+    """Trends report growth, and a reopened store knows the latest sample."""
+    db_file = os.path.join(tempfile.mkdtemp(), "history.db")
+    store = GitHubHistoryStore(db_file=db_file)
+    store.record(repo_info(1, 1), ts=START)
+    store.record(repo_info(10, 4), ts=START + 86400)
+    store.record({**repo_info(5), "repo": "other"}, ts=START)
+
+    trends = store.trends(START - 1, START + 2 * 86400)
+    assert trends[0]["repo"] == "demo"
+    assert (trends[0]["stars_delta"], trends[0]["forks_delta"]) == (9, 3)
+
+    reopened = GitHubHistoryStore(db_file=db_file)
+    assert reopened.latest("alice", "demo")["stars"] == 10
+
+def main():
+    print("GitHub History Test")
+    print("===================")
+    for test in (test_unchanged_samples_are_throttled, test_history_is_downsampled, test_trends_and_warm_start):
+        test()
+        print(f"✅ {test.__name__}")
+
+if __name__ == "__main__":
+    main()
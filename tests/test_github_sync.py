@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+import os
+import sys
+import json
+import hmac
+import hashlib
+import asyncio
+import tempfile
+import threading
+
+# Make the backend package importable when running from the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend_deploy", "src"))
+
+from fastapi.testclient import TestClient
+
+from api import github_api
+from api.app import create_app
+from api.github_sync import GitHubSyncEngine, verify_webhook_signature
+
+class FakeResponse:
+    def __init__(self, status_code, data=None, headers=None):
+        self.status_code = status_code
+        self._data = data
+        self.headers = headers or {}
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise Exception(f"HTTP {self.status_code}")
+
+class FakeGitHub:
+    """Serves canned GitHub responses and honours If-None-Match."""
+
+    def __init__(self):
+        self.calls = []
+        self.repo = {"name": "demo", "stargazers_count": 3, "forks_count": 1, "watchers_count": 3, "open_issues_count": 0, "updated_at": "2025-02-01T00:00:00Z"}
+        self.commits = [self._commit("a" * 40, "2025-02-01T00:00:00Z")]
+        self.forks = [{"owner": {"login": "bob"}, "full_name": "bob/demo", "created_at": "2025-02-01T00:00:00Z", "html_url": "https://github.com/bob/demo"}]
+        self.version = 1
+
+    def _commit(self, sha, date):
+        return {"sha": sha, "commit": {"message": f"commit {sha[:3]}", "author": {"name": "alice", "date": date}}}
+
+    def get(self, url, headers=None):
+        self.calls.append((url, dict(headers or {})))
+        etag = f'"v{self.version}"'
+        if (headers or {}).get("If-None-Match") == etag:
+            return FakeResponse(304)
+        if "/commits" in url:
+            data = [c for c in self.commits if "since=" not in url or c["commit"]["author"]["date"] >= url.split("since=")[1]]
+        elif "/forks" in url:
+            data = self.forks
+        else:
+            data = self.repo
+        return FakeResponse(200, data, {"ETag": etag})
+
+def make_engine(fake):
+    state_file = os.path.join(tempfile.mkdtemp(), "state.json")
+    return GitHubSyncEngine(state_file=state_file, session=fake, interval=0), state_file
+
+def test_unchanged_repo_uses_conditional_requests():
+    """A second sync of an unchanged repo sends validators and keeps the snapshot."""
+    fake = FakeGitHub()
+    engine, _ = make_engine(fake)
+
+    first = engine.sync("alice", "demo")
+    assert first["repo_info"]["stars"] == 3
+    assert first["recent_commits"][0]["sha"] == "aaaaaaa"
+    assert first["recent_forks"][0]["owner"] == "bob"
+
+    fake.calls.clear()
+    second = engine.sync("alice", "demo")
+    assert second == first
+    assert all(headers.get("If-None-Match") for _, headers in fake.calls)
+
+def test_new_commits_are_fetched_with_since():
+    """Only commits since the last checkpoint are requested and merged in front."""
+    fake = FakeGitHub()
+    engine, _ = make_engine(fake)
+    engine.sync("alice", "demo")
+
+    fake.version = 2
+    fake.commits.insert(0, fake._commit("b" * 40, "2025-02-02T00:00:00Z"))
+    fake.calls.clear()
+    snapshot = engine.sync("alice", "demo")
+
+    commit_urls = [url for url, _ in fake.calls if "/commits" in url]
+    assert "since=2025-02-01T00:00:00Z" in commit_urls[0]
+    assert [c["sha"] for c in snapshot["recent_commits"]] == ["bbbbbbb", "aaaaaaa"]
+
+def test_state_survives_restart():
+    """Checkpoints are persisted so a new engine starts warm."""
+    fake = FakeGitHub()
+    engine, state_file = make_engine(fake)
+    engine.sync("alice", "demo")
+
+    restarted = GitHubSyncEngine(state_file=state_file, session=fake, interval=3600)
+    fake.calls.clear()
+    restarted.state["alice/demo"]["stale"] = False
+    snapshot = restarted.sync("alice", "demo")
+    assert fake.calls == []
+    assert snapshot["repo_info"]["stars"] == 3
+
+def test_webhook_push_updates_snapshot():
+    """A push delivery adds commits without polling GitHub."""
+    fake = FakeGitHub()
+    engine, _ = make_engine(fake)
+    engine.sync("alice", "demo")
+    engine.interval = 3600
+
+    payload = {
+        "ref": "refs/heads/main",
+        "repository": {"name": "demo", "owner": {"login": "alice"}, "default_branch": "main"},
+        "commits": [{"id": "c" * 40, "message": "webhook commit\nbody", "author": {"name": "carol"}, "timestamp": "2025-02-03T00:00:00Z"}]
+    }
+    assert engine.apply_webhook("push", payload)
+
+    fake.calls.clear()
+    snapshot = engine.sync("alice", "demo")
+    assert fake.calls == []
+    assert snapshot["recent_commits"][0] == {"sha": "ccccccc", "message": "webhook commit", "author": "carol", "date": "2025-02-03T00:00:00Z"}
+
+def test_webhook_push_to_other_branch_is_ignored():
+    """Feature-branch pushes are not the project's activity."""
+    fake = FakeGitHub()
+    engine, _ = make_engine(fake)
+    before = engine.sync("alice", "demo")
+    engine.interval = 3600
+
+    payload = {
+        "ref": "refs/heads/feature",
+        "repository": {"name": "demo", "owner": {"login": "alice"}, "default_branch": "main"},
+        "commits": [{"id": "d" * 40, "message": "wip", "author": {"name": "dave"}, "timestamp": "2025-02-04T00:00:00Z"}]
+    }
+    assert engine.apply_webhook("push", payload)
+    state = engine.state["alice/demo"]
+    assert "commits" not in state["validators"] and state["last_commit_sha"] != "d" * 40
+    assert engine.sync("alice", "demo")["recent_commits"] == before["recent_commits"]
+
+def test_slow_repo_does_not_block_other_repos():
+    """A sync stuck on GitHub holds only its own repo's lock."""
+    fake = FakeGitHub()
+    release, entered = threading.Event(), threading.Event()
+    get = fake.get
+
+    def slow_get(url, headers=None):
+        if "/alice/slow" in url:
+            entered.set()
+            release.wait(5)
+        return get(url, headers)
+
+    fake.get = slow_get
+    engine, _ = make_engine(fake)
+    slow = threading.Thread(target=engine.sync, args=("alice", "slow"))
+    slow.start()
+    assert entered.wait(5)
+    try:
+        assert engine.sync("alice", "demo")["repo_info"]["stars"] == 3
+        assert engine.apply_webhook("fork", {"repository": {"name": "demo", "owner": {"login": "alice"}},
+                                             "forkee": {"owner": {"login": "erin"}, "full_name": "erin/demo",
+                                                        "created_at": "2025-02-05T00:00:00Z"}})
+        assert "alice/slow" not in engine.state
+    finally:
+        release.set()
+        slow.join()
+    assert engine.state["alice/slow"]["repo_info"] is not None
+
+def test_activity_routes_sync_off_the_event_loop(monkeypatch):
+    def get_activity(owner, repo):
+        # Raises if the GitHub requests were made on the event loop thread
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return {"repo_info": None, "recent_commits": [], "recent_forks": []}
+        raise AssertionError("GitHub activity synced on the event loop")
+
+    monkeypatch.setattr(github_api, "get_activity", get_activity)
+    monkeypatch.setattr(github_api.project_registry, "all",
+                        lambda offset=0, limit=None: [{"owner": "o", "repo": "r", "name": "Project"}])
+    monkeypatch.setattr(github_api.project_registry, "get", lambda owner, repo: {"owner": owner, "repo": repo})
+    github_api.response_cache.invalidate()
+    client = TestClient(create_app("server"))
+    assert client.get("/github/activity").status_code == 200
+    assert client.get("/github/project/o/r").status_code == 200
+
+def test_webhook_signature():
+    body = json.dumps({"zen": "hi"}).encode()
+    signature = "sha256=" + hmac.new(b"secret", body, hashlib.sha256).hexdigest()
+    assert verify_webhook_signature(body, signature, secret="secret")
+    assert not verify_webhook_signature(body, "sha256=bad", secret="secret")
+    # Without a secret nothing is trusted
+    assert not verify_webhook_signature(body, None, secret="")
+
+def main():
+    print("GitHub Sync Test")
+    print("================")
+    for test in (test_unchanged_repo_uses_conditional_requests, test_new_commits_are_fetched_with_since,
+                 test_state_survives_restart, test_webhook_push_updates_snapshot,
+                 test_webhook_push_to_other_branch_is_ignored, test_slow_repo_does_not_block_other_repos,
+                 test_webhook_signature):
+        test()
+        print(f"✅ {test.__name__}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+import os
+import sys
+import hmac
+import json
+import hashlib
+
+# Make the backend package importable when running from the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend_deploy", "src"))
+
+from fastapi.testclient import TestClient
+
+from api import agent_router, github_api
+from api.app import create_app
+from api.caching import etag_matches, response_cache
+
+def test_read_only_routes_answer_conditional_requests():
+    response_cache.invalidate()
+    client = TestClient(create_app("minimal"))
+    identity = {"Accept-Encoding": "identity"}
+    listing = client.get("/agents", headers=identity)
+    assert listing.headers["Cache-Control"] == "public, max-age=300, stale-while-revalidate=600"
+    etag, last_modified = listing.headers["ETag"], listing.headers["Last-Modified"]
+    assert etag.startswith('"') and listing.content == agent_router.agents_listing.body
+
+    for headers in ({"If-None-Match": etag}, {"If-None-Match": f'"other", W/{etag}'}, {"If-Modified-Since": last_modified}):
+        cached = client.get("/agents", headers={**identity, **headers})
+        assert cached.status_code == 304 and cached.content == b"" and cached.headers["ETag"] == etag
+    assert client.get("/agents", headers={"If-None-Match": '"other"', "If-Modified-Since": last_modified}).status_code == 200
+
+    # Compressed bytes differ from the identity ones, so their ETag is weak; either form revalidates
+    compressed = client.get("/agents", headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["Content-Encoding"] == "gzip" and compressed.headers["ETag"] == f"W/{etag}"
+    for tag in (etag, f"W/{etag}"):
+        cached = client.get("/agents", headers={"Accept-Encoding": "gzip", "If-None-Match": tag})
+        assert cached.status_code == 304 and cached.headers["ETag"] == f"W/{etag}"
+
+    # Project info keeps the ETag chat responses refer to
+    info = client.get("/agents/wooly/info", headers=identity)
+    assert info.headers["ETag"] == agent_router.agents["wooly"].project_info_etag
+    assert "Cache-Control" not in client.get("/health").headers
+
+def test_fresh_responses_skip_the_route(monkeypatch):
+    response_cache.invalidate()
+    calls = []
+    snapshot = {"repo_info": None, "recent_commits": [], "recent_forks": []}
+
+    def get_activity(owner, repo):
+        calls.append(repo)
+        return snapshot
+
+    monkeypatch.setattr(github_api, "get_activity", get_activity)
+    monkeypatch.setattr(github_api.project_registry, "all", lambda offset=0, limit=None: [{"owner": "o", "repo": "r", "name": "P"}])
+    monkeypatch.setattr(github_api.project_registry, "get", lambda owner, repo: {"owner": owner, "repo": repo})
+    monkeypatch.setattr(github_api.sync_engine, "apply_webhook", lambda event, payload: True)
+    client = TestClient(create_app("server"))
+
+    first = client.get("/github/activity")
+    assert client.get("/github/activity").content == first.content and calls == ["r"]
+    assert first.headers["Cache-Control"] == "public, max-age=60, stale-while-revalidate=600"
+
+    # A webhook delivery expires the GitHub responses; an unchanged rendering keeps its validators
+    webhook = json.dumps({"repository": {"name": "r", "owner": {"login": "o"}}}).encode()
+    signature = "sha256=" + hmac.new(b"secret", webhook, hashlib.sha256).hexdigest()
+    headers = {"X-GitHub-Event": "push", "X-Hub-Signature-256": signature}
+    # Unsigned deliveries are refused outright while no secret is configured, and flush nothing
+    assert client.post("/github/webhook", content=webhook, headers=headers).status_code == 403
+    assert client.get("/github/activity").content == first.content and len(calls) == 1
+    monkeypatch.setattr(github_api, "GITHUB_WEBHOOK_SECRET", "secret")
+    assert client.post("/github/webhook", content=webhook, headers=headers).json()["status"] == "updated"
+    again = client.get("/github/activity", headers={"If-None-Match": first.headers["ETag"]})
+    assert again.status_code == 304 and again.headers["Last-Modified"] == first.headers["Last-Modified"] and len(calls) == 2
+
+    snapshot["recent_commits"] = [{"sha": "abc1234", "message": "Fix", "author": "A", "date": ""}]
+    response_cache.invalidate("/github/")
+    changed = client.get("/github/activity", headers={"If-None-Match": first.headers["ETag"]})
+    assert changed.status_code == 200 and changed.headers["ETag"] != first.headers["ETag"]
+    assert changed.json()["P"]["recent_commits"][0]["sha"] == "abc1234"
+
+def test_errors_are_not_cached():
+    client = TestClient(create_app("minimal"))
+    missing = client.get("/agents/nobody/info")
+    assert missing.status_code == 404 and "ETag" not in missing.headers
+    assert etag_matches("*", '"x"') and not etag_matches('"y"', '"x"')
+
+def main():
+    print("HTTP Caching Test")
+    print("=================")
+    for test in (test_read_only_routes_answer_conditional_requests, test_errors_are_not_cached):
+        test()
+        print(f"✅ {test.__name__}")
+
+if __name__ == "__main__":
+    main()
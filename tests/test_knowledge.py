@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+import os
+import sys
+import tempfile
+import threading
+
+# Make the backend package importable when running from the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend_deploy", "src"))
+
+from agents.knowledge import (chunk_text, project_info_chunks, document_chunks, knowledge_chunks, build_index,
+                              load_or_build_index, KnowledgeIndex)
+
+CHUNKS = [
+    "staking: Community members stake MON tokens on projects they believe in",
+    "nfts: Builder NFTs are minted for contributors who fork a project",
+    "technology: Built with FastAPI, Next.js and Gemini",
+]
+
+def test_chunking():
+    words = " ".join(f"w{i}" for i in range(250))
+    chunks = chunk_text(words, title="doc", max_words=100, overlap=10)
+    assert len(chunks) == 3
+    assert chunks[0].startswith("doc: w0 ") and chunks[1].startswith("doc: w90 ")
+
+    info_chunks = project_info_chunks({"name": "Demo", "solution": {"features": ["Voice trading", "Safe accounts"]}})
+    assert info_chunks == ["name: Demo", "solution: features: Voice trading; Safe accounts"]
+
+def test_search_returns_relevant_chunks():
+    """BM25 ranks the chunk sharing the query's terms first."""
+    path = os.path.join(tempfile.mkdtemp(), "demo.idx")
+    build_index(CHUNKS, path)
+    index = KnowledgeIndex(path)
+
+    assert index.doc_count == 3
+    results = index.search("How do I stake tokens?", k=2)
+    assert results[0]["text"] == CHUNKS[0]
+    assert index.search("who mints builder nfts", k=1)[0]["text"] == CHUNKS[1]
+    assert index.search("unrelated words only") == []
+    index.close()
+
+def test_index_is_rebuilt_when_sources_change():
+    index_dir = tempfile.mkdtemp()
+    first = load_or_build_index("demo", CHUNKS, index_dir)
+    assert load_or_build_index("demo", CHUNKS, index_dir).source_hash == first.source_hash
+
+    changed = load_or_build_index("demo", CHUNKS + ["roadmap: Secondary market opens monthly"], index_dir)
+    assert changed.doc_count == 4
+    assert changed.search("secondary market")[0]["text"].startswith("roadmap")
+    assert load_or_build_index("demo", [], index_dir) is None
+
+def test_concurrent_builds_do_not_share_a_temporary_file():
+    index_dir = tempfile.mkdtemp()
+    path = os.path.join(index_dir, "demo.idx")
+    threads = [threading.Thread(target=build_index, args=(CHUNKS, path)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert os.listdir(index_dir) == ["demo.idx"]
+    assert KnowledgeIndex(path).doc_count == 3
+
+def test_document_chunks_split_markdown_sections():
+    docs_dir = tempfile.mkdtemp()
+    os.makedirs(os.path.join(docs_dir, "demo"))
+    with open(os.path.join(docs_dir, "demo", "README.md"), "w") as f:
+        f.write("# Demo\nIntro text.\n\n## Install\nRun pip install demo.\n")
+
+    assert document_chunks("demo", docs_dir) == ["Demo: Intro text.", "Install: Run pip install demo."]
+    assert document_chunks("missing", docs_dir) == []
+
+def test_retrieval_is_off_without_documents():
+    """project_info alone is not indexed, so prompts do not grow for agents without docs."""
+    docs_dir = tempfile.mkdtemp()
+    assert knowledge_chunks("demo", {"name": "Demo"}, docs_dir) == []
+
+    os.makedirs(os.path.join(docs_dir, "demo"))
+    with open(os.path.join(docs_dir, "demo", "notes.md"), "w") as f:
+        f.write("# Roadmap\nSecondary market opens monthly.\n")
+    assert knowledge_chunks("demo", {"name": "Demo"}, docs_dir) == ["name: Demo", "Roadmap: Secondary market opens monthly."]
+
+def main():
+    print("Knowledge Index Test")
+    print("====================")
+    for test in (test_chunking, test_search_returns_relevant_chunks, test_index_is_rebuilt_when_sources_change,
+                 test_concurrent_builds_do_not_share_a_temporary_file, test_document_chunks_split_markdown_sections, test_retrieval_is_off_without_documents):
+        test()
+        print(f"✅ {test.__name__}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+import os
+import sys
+import random
+import asyncio
+
+# Make the load-test harness importable when running from the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+
+from fake_providers import LatencyModel, FakeGemini, FakeGitHub, ProviderError, install
+from load_test import compare, conversation, load_test, percentile
+from agents import base_agent
+from api.app import create_app
+
+def test_reports_every_agent_offline():
+    gemini, github = FakeGemini(LatencyModel(0.001)), FakeGitHub()
+    with install(gemini, github=github, github_interval=60):
+        report = asyncio.run(load_test(create_app("minimal"), ["vocafi", "wooly"], conversations=4, turns=3, concurrency=4))
+    assert set(report["agents"]) == {"vocafi", "wooly"}
+    for result in list(report["agents"].values()) + [report["mixed"]]:
+        assert result["errors"] == 0 and result["rps"] > 0
+        assert result["p50_ms"] <= result["p95_ms"] <= result["p99_ms"]
+    assert report["agents"]["vocafi"]["requests"] == 12 and report["mixed"]["requests"] == 24
+    # Warm-up, two agent runs and the mixed run, less the opening turns answered by scripted greetings;
+    # GitHub questions hit the sync engine, not the network
+    assert gemini.calls == 2 + 8 + 8 + 16
+    assert github.calls > 0
+    assert base_agent.gemini_api_key != "fake-gemini-key"
+
+def test_provider_errors_follow_the_latency_model():
+    model = LatencyModel(0.01, jitter=0.5, error_rate=0.25, seed=3)
+    samples = [model.sample() for _ in range(2000)]
+    failures = sum(fails for _, fails in samples)
+    assert 400 < failures < 600
+    assert percentile([latency for latency, _ in samples], 50) < 0.012 < percentile([latency for latency, _ in samples], 99)
+    try:
+        LatencyModel(error_rate=1).wait("Gemini")
+    except ProviderError:
+        pass
+    else:
+        raise AssertionError("expected ProviderError")
+
+def test_regressions_are_flagged():
+    baseline = {"agents": {"wooly": {"requests": 10, "errors": 0, "rps": 100, "p50_ms": 10, "p95_ms": 20, "p99_ms": 30, "peak_memory_kb": 500}},
+                "mixed": {"requests": 10, "errors": 0, "rps": 100, "p50_ms": 10, "p95_ms": 20, "p99_ms": 30, "peak_memory_kb": 500}}
+    same = {"agents": {"wooly": dict(baseline["agents"]["wooly"])}, "mixed": dict(baseline["mixed"])}
+    assert compare(same, baseline, 0.3) == []
+    slower = {"agents": {"wooly": dict(baseline["agents"]["wooly"], rps=50, p99_ms=90)}, "mixed": dict(baseline["mixed"])}
+    assert compare(slower, baseline, 0.3) == ["agents.wooly p99_ms: 90 > 30 baseline", "agents.wooly rps: 50 < 100 baseline"]
+
+def test_conversations_carry_their_history():
+    turns = conversation(3, random.Random(0))
+    assert [len(messages) for messages in turns] == [1, 3, 5]
+    assert turns[0][0]["content"] == "What does this project do?"
+
+def main():
+    print("Load Harness Test")
+    print("=================")
+    for test in (test_reports_every_agent_offline, test_provider_errors_follow_the_latency_model,
+                 test_regressions_are_flagged, test_conversations_carry_their_history):
+        test()
+        print(f"✅ {test.__name__}")
+
+if __name__ == "__main__":
+    main()
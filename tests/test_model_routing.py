@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+import os
+import sys
+
+# Make the evaluation harness importable when running from the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+
+from fake_providers import LatencyModel, FakeGemini, FakeOpenAI, install
+from eval_model_tiers import evaluate
+from agents.base_agent import Message
+from agents.agent_factory import load_agents
+from agents.model_router import ModelRouter, classify, model_router
+
+def conversation(*user_messages):
+    messages = []
+    for content in user_messages:
+        messages += [Message(role="user", content=content), Message(role="assistant", content="Sure.")]
+    return messages[:-1]
+
+def test_simple_turns_go_fast_and_complex_ones_large():
+    assert classify(conversation("What does this project do?")) == ("fast", "first turn")
+    assert classify(conversation("Hi", "How much MON is staked?"))[0] == "fast"
+    assert classify(conversation("Hi", "Explain how staking works"))[0] == "large"
+    assert classify(conversation("What is the difference between Clarity and Trustpilot?"))[0] == "large"
+    assert classify(conversation(" ".join(["word"] * 41)))[0] == "large"
+    assert classify(conversation(*["Tell me more"] * 7)) == ("large", "7 user turns")
+    # "code" on its own is a simple question, asking for code is not
+    assert classify(conversation("Where is the code?"))[0] == "fast"
+    assert classify(conversation("Can you write code to stake?"))[0] == "large"
+
+def test_router_logs_and_counts_decisions(capsys):
+    router = ModelRouter()
+    tier = router.route("wooly", conversation("What is Mammothon?"), "gemini")
+    assert (tier.model, tier.max_output_tokens) == ("gemini-1.5-flash", 512)
+    assert "wooly -> gemini-1.5-flash (fast, max 512 tokens): first turn" in capsys.readouterr().out
+    assert router.route("wooly", conversation("Explain the architecture"), "openai").model == "gpt-4"
+    assert ModelRouter(mode="large").route("hwc", conversation("Hi"), "gemini").model == "gemini-1.5-pro"
+    status = router.status()
+    assert status["counts"] == {"gemini/fast": 1, "openai/large": 1} and status["fallbacks"] == {}
+    assert status["recent"][-1] == {"agent": "wooly", "model": "gpt-4", "tier": "large", "reason": "asks 'explain'"}
+    try:
+        ModelRouter(mode="cheap")
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+def test_agents_call_the_routed_model():
+    agent = load_agents()["vocafi"]
+    gemini, openai = FakeGemini(), FakeOpenAI()
+    with install(gemini=gemini, openai=openai):
+        agent.get_chat_response(conversation("What is VocaFI?"), "gemini")
+        agent.get_chat_response(conversation("What is VocaFI?", "Compare it with a normal DEX"), "gemini")
+        agent.get_chat_response(conversation("What is VocaFI?"), "openai")
+    assert gemini.models == ["gemini-1.5-flash", "gemini-1.5-pro"]
+    assert openai.models == ["gpt-4o-mini"]
+
+def test_fallback_provider_reuses_the_routed_tier(monkeypatch):
+    router = ModelRouter()
+    monkeypatch.setattr("agents.base_agent.model_router", router)
+    agent = load_agents()["vocafi"]
+    gemini, openai = FakeGemini(), FakeOpenAI(LatencyModel(error_rate=1.0))
+    with install(gemini=gemini, openai=openai):
+        agent.get_chat_response(conversation("Compare VocaFI with a normal DEX"), "openai")
+    assert gemini.models == ["gemini-1.5-pro"]
+    # One routing decision for the chat, and the switch to Gemini counted as a fallback
+    assert router.status()["counts"] == {"openai/large": 1}
+    assert router.status()["fallbacks"] == {"openai->gemini/large": 1}
+
+def test_evaluation_shows_auto_cheaper_and_faster_than_large():
+    transcripts = [
+        {"agent": "wooly", "messages": [
+            {"role": "user", "content": "What is Mammothon?"},
+            {"role": "assistant", "content": "A platform for reviving hackathon projects. " * 5},
+            {"role": "user", "content": "Explain step by step how staking works."},
+            {"role": "assistant", "content": "First you connect your wallet. " * 100},
+        ]},
+    ]
+    mode = model_router.mode
+    report = evaluate(transcripts, "gemini")
+    assert model_router.mode == mode
+    large, fast, auto = (report["modes"][name] for name in ("large", "fast", "auto"))
+    assert large["fast_share"] == 0 and fast["fast_share"] == 1 and auto["fast_share"] == 0.5
+    assert auto["usd_per_1k_chats"] < large["usd_per_1k_chats"] and auto["p50_ms"] < large["p50_ms"]
+    # The long answer does not fit the fast tier's cap
+    assert fast["truncated"] == 1 and auto["truncated"] == 0
+
+def main():
+    print("Model Routing Test")
+    print("==================")
+    for test in (test_simple_turns_go_fast_and_complex_ones_large, test_agents_call_the_routed_model,
+                 test_evaluation_shows_auto_cheaper_and_faster_than_large):
+        test()
+        print(f"✅ {test.__name__}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from fake_chain import FakeChain
+from api import staking_api
+from api.app import create_app
+from chain.rpc import JsonRpcClient
+from chain.multicall import MulticallReader, StakingSummaryReader
+from chain.contracts import PROJECT_STAKING_ADDRESS
+
+def make_reader(chain, mode="batch", ttl=60):
+    rpc = JsonRpcClient(url="http://fake-chain", session=chain)
+    return StakingSummaryReader(MulticallReader(rpc, mode=mode), ttl=ttl)
+
+def seed(chain, projects=100):
+    for i in range(projects):
+        chain.add_project(f"project-{i}", f"Project {i}", total_staked=i * 10**18, stakers_count=i % 7)
+        chain.add_builder_nft(i + 1, f"builder{i}", f"builder{i}/repo", f"project-{i}", total_staked=i, stakers_count=1)
+
+def check_summary(mode):
+    chain = FakeChain()
+    seed(chain)
+    reader = make_reader(chain, mode)
+
+    summary = reader.get_summary()
+    assert len(chain.requests) == 2
+    assert len(summary["projects"]) == 100
+    project = summary["projects"][42]
+    assert project["id"] == "project-42"
+    assert project["name"] == "Project 42"
+    assert project["total_staked"] == str(42 * 10**18)
+    assert project["stakers_count"] == 0
+    assert project["active"] is True
+    assert project["builder_nfts"] == [{"token_id": 43, "github_username": "builder42", "repo_name": "builder42/repo",
+                                        "total_staked": "42", "stakers_count": 1}]
+
+def test_summary_in_two_round_trips_with_batch():
+    check_summary("batch")
+
+def test_summary_in_two_round_trips_with_multicall():
+    check_summary("multicall")
+
+def test_summary_is_cached_for_ttl():
+    chain = FakeChain()
+    seed(chain, projects=3)
+    reader = make_reader(chain)
+    reader.get_summary()
+    reader.get_summary()
+    assert len(chain.requests) == 2
+
+    chain.add_project("late", "Late")
+    assert len(reader.get_summary(force=True)["projects"]) == 4
+    assert len(chain.requests) == 4
+
+def test_failed_calls_yield_none():
+    for mode in ("batch", "multicall"):
+        chain = FakeChain()
+        seed(chain, projects=1)
+        reader = MulticallReader(JsonRpcClient(url="http://fake-chain", session=chain), mode=mode)
+        results = reader.call_many([
+            (PROJECT_STAKING_ADDRESS, "getProject(string)", ["project-0"]),
+            (PROJECT_STAKING_ADDRESS, "getProject(string)", ["missing"]),
+            (PROJECT_STAKING_ADDRESS, "getAllProjectIds()", []),
+        ])
+        assert results == [["project-0", "Project 0", 0, 0, True], None, [["project-0"]]]
+
+def test_summary_route_reads_off_the_event_loop(monkeypatch):
+    chain = FakeChain()
+    seed(chain, projects=2)
+    reader = make_reader(chain)
+    read = reader.get_summary
+
+    def get_summary():
+        # Raises if the RPC calls were made on the event loop thread
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return read()
+        raise AssertionError("staking summary read on the event loop")
+
+    monkeypatch.setattr(staking_api.staking_summary_reader, "get_summary", get_summary)
+    response = TestClient(create_app("server")).get("/staking/summary")
+    assert response.status_code == 200
+    assert [project["id"] for project in response.json()["projects"]] == ["project-0", "project-1"]
+
+def main():
+    print("Multicall Reader Test")
+    print("=====================")
+    for test in (test_summary_in_two_round_trips_with_batch, test_summary_in_two_round_trips_with_multicall,
+                 test_summary_is_cached_for_ttl, test_failed_calls_yield_none):
+        test()
+        print(f"✅ {test.__name__}")
+
+if __name__ == "__main__":
+    main()
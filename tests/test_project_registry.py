@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+import os
+import sys
+import json
+import tempfile
+
+# Make the backend package importable when running from the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend_deploy", "src"))
+
+from api.project_registry import ProjectRegistry, DEFAULT_PROJECTS
+
+def make_registry(**kwargs):
+    directory = tempfile.mkdtemp()
+    kwargs.setdefault("projects_file", os.path.join(directory, "projects.json"))
+    return ProjectRegistry(db_file=os.path.join(directory, "projects.db"), **kwargs), directory
+
+def test_defaults_and_lookup():
+    """A fresh registry is seeded with the default projects and looks them up case-insensitively."""
+    registry, _ = make_registry()
+    assert len(registry) == len(DEFAULT_PROJECTS)
+    assert registry.get("AZF20", "Hello-World-Computer")["name"] == "Hello World Computer"
+    assert registry.get_by_agent("vocafi")["repo"] == "voca.fi"
+    assert registry.get("nobody", "nothing") is None
+
+def test_register_persists_and_remove():
+    """Projects registered at runtime survive a restart and can be removed."""
+    registry, directory = make_registry(defaults=[])
+    registry.register("alice", "demo", "Demo", agent="demo")
+    registry.register("alice", "demo", "Demo v2")
+
+    reopened = ProjectRegistry(db_file=os.path.join(directory, "projects.db"), projects_file=None, defaults=[])
+    assert reopened.all() == [{"owner": "alice", "repo": "demo", "name": "Demo v2"}]
+    assert reopened.get_by_agent("demo") is None
+    assert reopened.remove("alice", "demo")
+    assert len(reopened) == 0
+
+def test_projects_file_is_reloaded():
+    """Editing the projects file adds projects without a restart."""
+    registry, directory = make_registry(defaults=[], reload_interval=0)
+    assert registry.get("carol", "app") is None
+
+    with open(os.path.join(directory, "projects.json"), "w") as f:
+        json.dump([{"owner": "carol", "repo": "app", "name": "App"}], f)
+
+    assert registry.get("carol", "app")["name"] == "App"
+    assert registry.all(0, 1) == [{"owner": "carol", "repo": "app", "name": "App"}]
+
+def main():
+    print("Project Registry Test")
+    print("=====================")
+    for test in (test_defaults_and_lookup, test_register_persists_and_remove, test_projects_file_is_reloaded):
+        test()
+        print(f"✅ {test.__name__}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+import gzip
+import json
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from fake_providers import install
+from agents import base_agent
+from agents.agent_factory import load_agents
+from api import compression
+from api.app import create_app
+from api.compression import CompressionMiddleware, choose_encoding
+
+def follow_up_body():
+    return {"messages": [{"role": "user", "content": "Hi"}, {"role": "assistant", "content": "Hello!"},
+                         {"role": "user", "content": "How do I fork it?"}]}
+
+def test_first_response_refers_to_project_info_by_etag(monkeypatch):
+    client = TestClient(create_app("minimal"))
+    agent = load_agents()["hwc"]
+    with install():
+        first = client.post("/agents/hwc/chat", json={"messages": [{"role": "user", "content": "Hi"}]}).json()
+        later = client.post("/agents/hwc/chat", json=follow_up_body()).json()
+    assert first == {"response": agent.greeting, "project_info": None, "project_info_etag": agent.project_info_etag}
+    assert later["project_info_etag"] is None and agent.links_html not in later["response"]
+    assert len(json.dumps(first)) < len(json.dumps(agent.project_info))
+
+    info = client.get("/agents/hwc/info")
+    # Served gzipped here, so the same tag comes back weak
+    assert info.json() == agent.project_info and info.headers["ETag"] == f'W/{first["project_info_etag"]}'
+    cached = client.get("/agents/hwc/info", headers={"If-None-Match": f'{info.headers["ETag"]}, "other"'})
+    assert cached.status_code == 304 and cached.content == b""
+    listed = {item["type"]: item for item in client.get("/agents").json()["agents"]}
+    assert listed["hwc"]["project_info_etag"] == agent.project_info_etag
+
+    # Old clients can have the full payload back
+    monkeypatch.setattr(base_agent, "CHAT_INLINE_PROJECT_INFO", True)
+    with install():
+        inline = client.post("/agents/wooly/chat", json={"messages": [{"role": "user", "content": "Hi"}]}).json()
+    wooly = load_agents()["wooly"]
+    assert inline["response"] == wooly.greeting + wooly.links_html and inline["project_info"] == wooly.project_info
+
+def test_etag_is_stable_and_tracks_content():
+    assert base_agent.project_info_etag({"a": 1, "b": [1, 2]}) == base_agent.project_info_etag({"b": [1, 2], "a": 1})
+    assert base_agent.project_info_etag({"a": 1}) != base_agent.project_info_etag({"a": 2})
+
+def test_large_responses_are_compressed_small_ones_are_not():
+    client = TestClient(create_app("minimal"))
+    info = client.get("/agents/hwc/info", headers={"Accept-Encoding": "gzip"})
+    assert info.headers["Content-Encoding"] == "gzip" and info.headers["Vary"] == "Accept-Encoding"
+    # TestClient decodes the body; the wire size is the Content-Length
+    assert int(info.headers["Content-Length"]) < len(json.dumps(info.json())) / 2
+    health = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in health.headers
+    plain = client.get("/agents/hwc/info", headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in plain.headers and plain.json() == info.json()
+    assert info.headers["ETag"] == f'W/{plain.headers["ETag"]}'
+
+def test_streamed_responses_are_compressed_per_chunk():
+    app = FastAPI()
+
+    @app.get("/stream")
+    async def stream():
+        async def lines():
+            for i in range(3):
+                yield json.dumps({"id": i}) + "\n"
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    async def receive():
+        # The client stays connected until the response is done
+        await asyncio.sleep(1)
+        return {"type": "http.disconnect"}
+
+    scope = {"type": "http", "method": "GET", "path": "/stream", "raw_path": b"/stream", "query_string": b"",
+             "root_path": "", "headers": [(b"accept-encoding", b"gzip")], "http_version": "1.1",
+             "scheme": "http", "server": ("test", 80), "client": ("test", 1), "asgi": {"version": "3.0"}}
+    asyncio.run(CompressionMiddleware(app)(scope, receive, send))
+    chunks = [message["body"] for message in sent if message["type"] == "http.response.body"]
+    # Every line is decodable as soon as it arrives
+    decoder = gzip.zlib.decompressobj(31)
+    assert decoder.decompress(chunks[0]) == b'{"id": 0}\n'
+    assert b"".join(decoder.decompress(chunk) for chunk in chunks[1:]) == b'{"id": 1}\n{"id": 2}\n'
+
+def test_encoding_negotiation(monkeypatch):
+    assert choose_encoding("gzip, deflate") == "gzip"
+    assert choose_encoding("gzip;q=0, identity") is None
+    assert choose_encoding("") is None
+    monkeypatch.setattr(compression, "brotli", object())
+    assert choose_encoding("gzip, br") == "br"
+    monkeypatch.setattr(compression, "brotli", None)
+    assert choose_encoding("br") is None
+
+def main():
+    print("Response Slimming Test")
+    print("======================")
+    for test in (test_etag_is_stable_and_tracks_content, test_large_responses_are_compressed_small_ones_are_not,
+                 test_streamed_responses_are_compressed_per_chunk):
+        test()
+        print(f"✅ {test.__name__}")
+
+if __name__ == "__main__":
+    main()
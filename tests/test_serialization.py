@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+import os
+import sys
+import json
+
+# Make the backend package importable when running from the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend_deploy", "src"))
+
+from fastapi.testclient import TestClient
+
+from agents.base_agent import ChatResponse
+from api import agent_router, github_api, serialization
+from api.app import create_app
+from api.caching import response_cache
+from api.serialization import FastJSONResponse, dumps
+
+def test_dumps_matches_the_json_it_replaces(monkeypatch):
+    content = {"name": "Wooly", "emoji": "🦣", "count": 3, "ratio": 0.5, "tags": ["a", None, True], 7: "int key"}
+    expected = json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    assert dumps(content) == expected
+    assert json.loads(dumps(ChatResponse(response="hi"))) == {"response": "hi", "project_info": None,
+                                                                "project_info_etag": None}
+    # Same output without orjson installed
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert dumps(content) == expected
+
+def test_agent_payloads_are_served_pre_serialized():
+    client = TestClient(create_app("minimal"))
+    listing = client.get("/agents")
+    assert listing.content == agent_router.agents_listing.body
+    assert listing.headers["content-type"] == "application/json"
+    wooly = next(item for item in listing.json()["agents"] if item["type"] == "wooly")
+    assert wooly["endpoint"] == "/agents/wooly" and wooly["project_info"] == agent_router.agents["wooly"].project_info
+    info = client.get("/agents/wooly/info")
+    assert info.content == agent_router.agent_infos["wooly"].body
+
+def test_github_snapshots_skip_re_encoding(monkeypatch):
+    response_cache.invalidate()
+    snapshot = {"repo_info": None, "recent_commits": [{"sha": "abc1234", "message": "Fix", "author": "A", "date": ""}],
+                "recent_forks": []}
+    monkeypatch.setattr(github_api, "get_activity", lambda owner, repo: snapshot)
+    monkeypatch.setattr(github_api.project_registry, "all",
+                        lambda offset=0, limit=None: [{"owner": "o", "repo": "r", "name": "Project"}])
+    app = create_app("server")
+    assert app.router.default_response_class is FastJSONResponse
+    client = TestClient(app)
+    assert client.get("/github/activity").json() == {"Project": snapshot}
+    assert client.get("/github/projects").json() == [{"owner": "o", "repo": "r", "name": "Project"}]
+    assert client.get("/health").json()["status"] == "healthy"
+
+def main():
+    print("Serialization Test")
+    print("==================")
+    for test in (test_agent_payloads_are_served_pre_serialized,):
+        test()
+        print(f"✅ {test.__name__}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+import os
+import sys
+import tempfile
+
+# Make the backend package importable when running from the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend_deploy", "src"))
+
+from agents import base_agent
+from agents.base_agent import BaseAgent
+from chain.indexer import StakingStore
+from chain.rpc import JsonRpcClient
+
+ALICE = "0x" + "a" * 40
+BOB = "0x" + "b" * 40
+
+def make_event(block, event, **args):
+    return {"block_number": block, "log_index": 0, "block_hash": "0x0", "transaction_hash": "0x0", "event": event, "args": args}
+
+def make_store():
+    store = StakingStore(os.path.join(tempfile.mkdtemp(), "events.db"))
+    store.add_events([
+        make_event(1, "ProjectAdded", project_id="vocafi", name="VocaFI"),
+        make_event(2, "BuilderNFTAdded", token_id=1, github_username="alice", repo_name="alice/voca.fi", project_id="vocafi"),
+        make_event(3, "BuilderNFTAdded", token_id=2, github_username="bob", repo_name="bob/voca.fi", project_id="vocafi"),
+        make_event(4, "Staked", staker=ALICE, project_id="vocafi", amount=25 * 10**17),
+        make_event(5, "BuilderNFTStaked", staker=ALICE, token_id=2, amount=10**18, project_id="vocafi"),
+    ], checkpoint=5)
+    return store
+
+def make_agent():
+    return BaseAgent("VocaFI", "vocafi", "Voice DeFi", {"title": "VocaFI"}, system_prompt="You are VocaFI.")
+
+def test_snapshot_is_rebuilt_on_new_events():
+    store = make_store()
+    stats = store.get_project_stats("vocafi")
+    assert stats["total_staked"] == 25 * 10**17 and stats["stakers_count"] == 1
+    assert [nft["token_id"] for nft in stats["builder_nfts"]] == [2, 1]
+    assert store.get_project_stats("unknown", "VOCAFI") is stats
+
+    store.add_events([make_event(6, "Staked", staker=BOB, project_id="vocafi", amount=10**18)], checkpoint=6)
+    assert store.get_project_stats("vocafi")["stakers_count"] == 2
+    assert store.get_project_stats("missing") is None
+
+def test_agent_staking_summary_without_chain_io(monkeypatch):
+    monkeypatch.setattr(base_agent, "staking_store", make_store())
+
+    def no_rpc(*args, **kwargs):
+        raise AssertionError("chat path must not call the chain")
+    monkeypatch.setattr(JsonRpcClient, "call", no_rpc)
+    monkeypatch.setattr(JsonRpcClient, "batch", no_rpc)
+
+    summary = make_agent().get_staking_summary()
+    assert summary.splitlines() == [
+        "Total Staked: 2.5 MON from 1 staker",
+        "Builder NFTs: 2",
+        "Top Builders:",
+        "- bob (bob/voca.fi): 1 MON staked",
+        "- alice (alice/voca.fi): 0 MON staked",
+    ]
+
+def test_unstaked_project_has_no_summary(monkeypatch):
+    monkeypatch.setattr(base_agent, "staking_store", StakingStore(os.path.join(tempfile.mkdtemp(), "events.db")))
+    assert make_agent().get_staking_summary() == ""
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+import time
+import asyncio
+
+from fake_swarmnode import FakeSwarmNode
+from swarm.client import SwarmNodeError, UncertainCreateError, payload_hash
+
+def test_hundreds_of_concurrent_jobs_with_bounded_in_flight():
+    async def run():
+        server = FakeSwarmNode(duration=0.05)
+        client = server.client(max_in_flight=100)
+        start = time.perf_counter()
+        results = await client.execute_many("agent", [{"endpoint": "/health", "n": i} for i in range(500)])
+        elapsed = time.perf_counter() - start
+        await client.aclose()
+        return server, client, results, elapsed
+
+    server, client, results, elapsed = asyncio.run(run())
+    assert [r["return_value"]["echo"]["n"] for r in results] == list(range(500))
+    assert len(server.jobs) == 500
+    assert client.peak_in_flight == server.peak_running == 100
+    # Five waves of 100 jobs, not 500 sequential runs
+    assert elapsed < 500 * server.duration / 5
+
+def test_results_are_cached_and_duplicates_share_a_job():
+    async def run():
+        server = FakeSwarmNode()
+        client = server.client()
+        payload = {"endpoint": "/agents/wooly/info", "method": "GET"}
+        first, second = await asyncio.gather(client.execute("agent", payload), client.execute("agent", payload))
+        third = await client.execute("agent", payload)
+        uncached = await client.execute("agent", payload, use_cache=False)
+        return server, client, first, second, third, uncached
+
+    server, client, first, second, third, uncached = asyncio.run(run())
+    assert first is second is third
+    assert uncached["status"] == "success"
+    assert len(server.jobs) == 2
+    assert client.stats["deduplicated"] == 1 and client.stats["cache_hits"] == 1
+    assert payload_hash("agent", {"a": 1, "b": 2}) == payload_hash("agent", {"b": 2, "a": 1})
+
+def test_failed_executions_raise_and_are_not_cached():
+    async def run():
+        server = FakeSwarmNode(status="failure")
+        client = server.client()
+        errors = []
+        for _ in range(2):
+            try:
+                await client.execute("agent", {"endpoint": "/health"})
+            except SwarmNodeError as e:
+                errors.append(e)
+        return server, errors
+
+    server, errors = asyncio.run(run())
+    assert len(errors) == 2 and len(server.jobs) == 2
+
+def test_polling_backs_off():
+    async def run():
+        server = FakeSwarmNode(duration=0.5)
+        client = server.client(poll_initial=0.01, poll_max=1)
+        await client.execute("agent", {"endpoint": "/health"})
+        return client
+
+    client = asyncio.run(run())
+    # 0.01 + 0.02 + ... doubles past 0.5s in about 6 polls, not 50
+    assert client.stats["polls"] <= 7
+
+def test_transient_errors_are_retried():
+    async def run(**failures):
+        server = FakeSwarmNode(**failures)
+        client = server.client()
+        execution = await client.execute("agent", {"endpoint": "/health"})
+        return server, execution
+
+    # Rate limits and refused connections never reach SwarmNode, so even job creates are retried
+    for failures in ({"flaky": 2, "flaky_status": 429}, {"unreachable": 2}):
+        server, execution = asyncio.run(run(**failures))
+        assert execution["status"] == "success" and len(server.jobs) == 1
+
+def test_job_creates_that_may_have_applied_are_not_resent():
+    async def run(**failures):
+        server = FakeSwarmNode(**failures)
+        client = server.client()
+        try:
+            await client.execute("agent", {"endpoint": "/health"})
+        except UncertainCreateError:
+            return server
+        raise AssertionError("uncertain job create was not reported")
+
+    for failures, jobs in (({"flaky": 1}, 0), ({"lost": 1}, 1)):
+        server = asyncio.run(run(**failures))
+        assert server.requests.count(("POST", "/v1/agent-executor-jobs/create/")) == 1
+        assert len(server.jobs) == jobs
+
+def test_uncertain_agent_creates_re_list_before_creating_again():
+    async def run(**failures):
+        server = FakeSwarmNode(**failures)
+        client = server.client()
+        agent = await client.create_agent(name="demo", script="print('hi')")
+        store = await client.create_store("deploy")
+        return server, agent, store
+
+    # The response was lost but the agent exists: found by listing, not created twice
+    server, agent, store = asyncio.run(run(lost=2))
+    assert list(server.agents) == [agent["id"]] and list(server.stores) == [store["id"]]
+    assert server.requests.count(("POST", "/v1/agents/create/")) == 1
+    # The create failed before it was applied: listing finds nothing, so it is sent again
+    server, agent, store = asyncio.run(run(flaky=1))
+    assert list(server.agents) == [agent["id"]]
+    assert server.requests.count(("POST", "/v1/agents/create/")) == 2
+
+def main():
+    print("Async SwarmNode Client Test")
+    print("===========================")
+    for test in (test_hundreds_of_concurrent_jobs_with_bounded_in_flight, test_results_are_cached_and_duplicates_share_a_job,
+                 test_failed_executions_raise_and_are_not_cached, test_polling_backs_off,
+                 test_transient_errors_are_retried,
+                 test_job_creates_that_may_have_applied_are_not_resent,
+                 test_uncertain_agent_creates_re_list_before_creating_again):
+        test()
+        print(f"✅ {test.__name__}")
+
+if __name__ == "__main__":
+    main()
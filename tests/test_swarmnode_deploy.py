@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+import os
+import time
+import asyncio
+import tempfile
+
+import httpx
+
+from fake_swarmnode import FakeSwarmNode
+from swarm.deploy import AgentSpec, SwarmNodeDeployer, plan_deploy
+
+def make_specs(count, changed=None):
+    return [
+        AgentSpec(f"agent-{i}", f"print('agent {i}{' v2' if i == changed else ''}')", "fastapi==0.104.1", "OPENAI_API_KEY=test")
+        for i in range(count)
+    ]
+
+def deploy(server, specs, **kwargs):
+    async def run():
+        client = server.client()
+        try:
+            return await SwarmNodeDeployer(client, concurrency=8).deploy(specs, **kwargs)
+        finally:
+            await client.aclose()
+    return asyncio.run(run())
+
+def test_first_deploy_creates_agents_and_one_store():
+    server = FakeSwarmNode()
+    actions = deploy(server, make_specs(5))
+    assert [a.action for a in actions] == ["create"] * 5
+    assert len(server.agents) == 5 and len(server.stores) == 1
+    assert all(agent["store_id"] in server.stores for agent in server.agents.values())
+
+    # Redeploying with no changes touches nothing
+    server.requests.clear()
+    assert [a.action for a in deploy(server, make_specs(5))] == ["unchanged"] * 5
+    assert server.requests == [("GET", "/v1/agents/")]
+
+def test_redeploy_updates_only_the_changed_agent_quickly():
+    server = FakeSwarmNode(latency=0.05)
+    deploy(server, make_specs(40))
+    ids = set(server.agents)
+
+    server.requests.clear()
+    start = time.perf_counter()
+    actions = deploy(server, make_specs(40, changed=7))
+    elapsed = time.perf_counter() - start
+
+    assert [a.name for a in actions if a.action == "update"] == ["agent-7"]
+    assert set(server.agents) == ids and len(server.stores) == 1
+    assert ("PATCH", f"/v1/agents/{actions[7].agent_id}/update/") in server.requests
+    assert len(server.requests) == 2
+    assert elapsed < 1
+
+def test_creates_run_concurrently():
+    server = FakeSwarmNode(latency=0.05)
+    start = time.perf_counter()
+    deploy(server, make_specs(40))
+    # 40 creates at 50 ms each would take 2s one by one
+    assert time.perf_counter() - start < 1
+
+def test_orphaned_duplicates_are_pruned():
+    server = FakeSwarmNode()
+    old = server.add_agent(name="agent-0", script="print('old')")
+    newest = server.add_agent(name="agent-0", script="print('agent 0')", requirements="fastapi==0.104.1",
+                              env_vars="OPENAI_API_KEY=test")
+    unrelated = server.add_agent(name="someone-else", script="print('hi')")
+
+    plan = plan_deploy(make_specs(1), list(server.agents.values()))
+    assert [(a.action, a.agent_id) for a in plan] == [("unchanged", newest["id"]), ("delete", old["id"])]
+
+    assert [a.action for a in deploy(server, make_specs(1))] == ["unchanged"]
+    assert old["id"] in server.agents
+
+    deploy(server, make_specs(1), prune=True)
+    assert set(server.agents) == {newest["id"], unrelated["id"]}
+
+def test_transient_failures_are_retried_and_errors_recorded():
+    server = FakeSwarmNode(flaky=2)
+    assert all(not a.error for a in deploy(server, make_specs(3)))
+
+    def reject_updates(request):
+        if request.method == "PATCH":
+            return httpx.Response(400, json={"detail": "bad script"})
+        return FakeSwarmNode.handle(server, request)
+    server.handle = reject_updates
+    actions = deploy(server, make_specs(3, changed=1))
+    assert [bool(a.error) for a in actions] == [False, True, False]
+
+def test_spec_from_manifest():
+    directory = tempfile.mkdtemp()
+    with open(os.path.join(directory, "agent.py"), "w") as f:
+        f.write("print('hi')")
+    os.environ["DEPLOY_TEST_KEY"] = "secret"
+    spec = AgentSpec.from_manifest({"name": "demo", "script": "agent.py", "env": ["DEPLOY_TEST_KEY"]}, directory)
+    assert spec.fields() == {"name": "demo", "script": "print('hi')", "requirements": "",
+                             "env_vars": "DEPLOY_TEST_KEY=secret", "python_version": "3.9"}
+
+def main():
+    print("SwarmNode Deploy Test")
+    print("=====================")
+    for test in (test_first_deploy_creates_agents_and_one_store, test_redeploy_updates_only_the_changed_agent_quickly,
+                 test_creates_run_concurrently, test_orphaned_duplicates_are_pruned,
+                 test_transient_failures_are_retried_and_errors_recorded, test_spec_from_manifest):
+        test()
+        print(f"✅ {test.__name__}")
+
+if __name__ == "__main__":
+    main()